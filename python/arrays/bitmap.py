@@ -0,0 +1,217 @@
+"""Module providing a fixed-size bitmap, storing one bit per entry."""
+from typing import Optional
+
+# Bits per block: the number of set bits in each block is kept in a Fenwick tree
+BLOCK_BITS = 128
+BLOCK_BYTES = BLOCK_BITS // 8
+
+class Bitmap:
+    '''A sequence of `size` bits, all initially cleared.
+
+       Bits are packed eight per byte, least significant bit first, so that bulk operations
+       (counting set bits) can run on whole ranges of bytes at once, as a Python integer.
+       The bits are also grouped in blocks of `BLOCK_BITS`, and the number of bits set in each
+       block is kept in a Fenwick tree: counting the bits set in a prefix, or finding the k-th
+       cleared or set bit, only reads O(log n) tree entries and a single block.
+
+        Parameters:
+            size (int): The number of bits in the bitmap.
+    '''
+
+    def __init__(self, size: int) -> None:
+        if size <= 0:
+            raise ValueError(f'Invalid bitmap size (must be positive): {size}')
+        self._size = size
+        self._bytes = bytearray((size + 7) // 8)
+        self._blocks = (size + BLOCK_BITS - 1) // BLOCK_BITS
+        # Fenwick tree over the blocks, 1-based: entry i holds the bits set in blocks (i - lowbit(i), i]
+        self._tree = [0] * (self._blocks + 1)
+
+
+    def __len__(self) -> int:
+        '''
+        Return the number of bits in the bitmap.
+
+        Parameters:
+            None
+
+        Returns:
+            int: The number of bits in the bitmap.
+        '''
+
+        return self._size
+
+
+    def __getitem__(self, index: int) -> bool:
+        '''
+        Check the bit at the given index.
+
+        Parameters:
+            index (int): The index of the bit.
+
+        Returns:
+            bool: True if the bit is set, False otherwise.
+        '''
+
+        if index < 0 or index >= self._size:
+            raise IndexError('bitmap index out of range')
+        return bool(self._bytes[index >> 3] & (1 << (index & 7)))
+
+
+    def set(self, index: int) -> None:
+        '''
+        Set the bit at the given index.
+
+        Parameters:
+            index (int): The index of the bit.
+        '''
+
+        if index < 0 or index >= self._size:
+            raise IndexError('bitmap index out of range')
+        mask = 1 << (index & 7)
+        if not self._bytes[index >> 3] & mask:
+            self._bytes[index >> 3] |= mask
+            self._update(index // BLOCK_BITS, 1)
+
+
+    def clear(self, index: int) -> None:
+        '''
+        Clear the bit at the given index.
+
+        Parameters:
+            index (int): The index of the bit.
+        '''
+
+        if index < 0 or index >= self._size:
+            raise IndexError('bitmap index out of range')
+        mask = 1 << (index & 7)
+        if self._bytes[index >> 3] & mask:
+            self._bytes[index >> 3] &= ~mask & 0xFF
+            self._update(index // BLOCK_BITS, -1)
+
+
+    def clear_all(self) -> None:
+        '''
+        Clear all the bits in the bitmap.
+        '''
+
+        self._bytes[:] = bytes(len(self._bytes))
+        self._tree = [0] * (self._blocks + 1)
+
+
+    def _update(self, block: int, delta: int) -> None:
+        '''
+        Add `delta` to the number of bits set in a block, in the Fenwick tree.
+        '''
+
+        position = block + 1
+        while position <= self._blocks:
+            self._tree[position] += delta
+            position += position & -position
+
+
+    def count(self, end: Optional[int] = None) -> int:
+        '''
+        Count the bits set in the range [0, end).
+
+        Parameters:
+            end (int, optional): The end of the range (exclusive). Defaults to the size of the bitmap.
+
+        Returns:
+            int: The number of bits set before `end`.
+
+        Functionality:
+            Sums the counts of the whole blocks before `end` on the Fenwick tree, in O(log n),
+            then counts the bits set in the remaining part of the last block.
+        '''
+
+        if end is None:
+            end = self._size
+        total = 0
+        position = end // BLOCK_BITS
+        while position > 0:
+            total += self._tree[position]
+            position -= position & -position
+        full_bytes = end >> 3
+        total += int.from_bytes(self._bytes[(end // BLOCK_BITS) * BLOCK_BYTES:full_bytes], 'little').bit_count()
+        if end & 7:
+            total += (self._bytes[full_bytes] & ((1 << (end & 7)) - 1)).bit_count()
+        return total
+
+
+    def select_clear(self, k: int) -> int:
+        '''
+        Find the k-th cleared bit.
+
+        Parameters:
+            k (int): The rank of the cleared bit to find, starting from 0.
+
+        Returns:
+            int: The index of the cleared bit with exactly `k` cleared bits before it.
+
+        Functionality:
+            Goes down the Fenwick tree to the block holding the bit, in O(log n), then scans that block.
+
+        Error Handling:
+            Raises an IndexError if there are no more than `k` cleared bits.
+        '''
+
+        return self._select(k, False)
+
+
+    def select_set(self, k: int) -> int:
+        '''
+        Find the k-th set bit.
+
+        Parameters:
+            k (int): The rank of the set bit to find, starting from 0.
+
+        Returns:
+            int: The index of the set bit with exactly `k` set bits before it.
+
+        Functionality:
+            Goes down the Fenwick tree to the block holding the bit, in O(log n), then scans that block.
+
+        Error Handling:
+            Raises an IndexError if there are no more than `k` set bits.
+        '''
+
+        return self._select(k, True)
+
+
+    def _select(self, k: int, bit: bool) -> int:
+        '''
+        Find the k-th bit with the given value, see `select_clear` and `select_set`.
+        '''
+
+        if k < 0:
+            raise IndexError('bitmap rank out of range')
+        position = 0
+        step = 1 << self._blocks.bit_length()
+        while step:
+            following = position + step
+            if following <= self._blocks:
+                matching = self._tree[following]
+                if not bit:
+                    matching = min(following * BLOCK_BITS, self._size) - position * BLOCK_BITS - matching
+                if matching <= k:
+                    position = following
+                    k -= matching
+            step >>= 1
+        if position == self._blocks:
+            raise IndexError('bitmap rank out of range')
+        # The bit is in block `position`
+        index = position * BLOCK_BITS
+        for byte in self._bytes[position * BLOCK_BYTES:(position + 1) * BLOCK_BYTES]:
+            matching = byte.bit_count() if bit else 8 - byte.bit_count()
+            if k < matching:
+                while True:
+                    if bool(byte & 1) == bit:
+                        if k == 0:
+                            return index
+                        k -= 1
+                    byte >>= 1
+                    index += 1
+            k -= matching
+            index += 8
+        raise AssertionError('unreachable')    # pragma: no cover
@@ -0,0 +1,140 @@
+"""Module providing the base class of the array containers storing their elements in a `core.Array`."""
+from __future__ import annotations
+import copy
+from typing import Optional
+import arrays.core as core
+import arrays.persistence as persistence
+
+
+class ArrayContainer:
+    '''Base class of the containers (`DynamicArray`, `SortedArray`, `UnsortedArray`) that store their
+       elements in a `core.Array`, in the `_array` attribute, and whose constructor takes
+       the capacity and the typecode as its first two arguments.
+
+       A container created with a `path` stores its elements in that file, after a `persistence`
+       header recording its size and capacity: `flush` updates the header, and the container can
+       be reopened later with `open`, without copying its elements.
+
+       Subclasses set `_path` in their constructor, and implement `_header`, to describe their
+       content, and `_adopt`, to restore their state around a loaded `core.Array`.
+       '''
+
+    @staticmethod
+    def _new_storage(capacity: int, typecode: str, path: Optional[str], is_sorted: bool = False) -> core.Array:
+        '''
+        Create the `core.Array` storing the elements of a new container: in memory, or in a new file.
+
+        Error Handling:
+            Raises a FileExistsError if `path` already exists: an existing container must be reopened
+            with `open`, instead of being overwritten.
+        '''
+
+        if path is None:
+            return core.Array(capacity, typecode)
+        return persistence.create(path, typecode, capacity, is_sorted)
+
+
+    def share(self) -> ArrayContainer:
+        '''
+        Create a snapshot of the container stored in shared memory.
+
+        Parameters:
+            None
+
+        Returns:
+            ArrayContainer: A copy of the container whose elements are in a shared memory block (see `core.Array`).
+                            Pickling it, e.g. to pass it to a pool of worker processes for read-only
+                            queries, doesn't copy the elements. The block is released when the snapshot is
+                            garbage collected; the snapshot must stay alive while workers use it.
+
+        Functionality:
+            Deep-copies the container, with the copy of its `core.Array` pre-seeded in the memo as a
+            shared copy: the elements are copied only once, straight into the shared memory block.
+        '''
+
+        snapshot = copy.deepcopy(self, {id(self._array): self._array.share()})
+        snapshot._path = None
+        return snapshot
+
+
+    def flush(self) -> None:
+        '''
+        Write the content of a file-backed container to disk, header included.
+        For containers in memory, this does nothing.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        '''
+
+        if self._path is not None:
+            persistence.write_header(self._path, self._header())
+        self._array.flush()
+
+
+    def close(self) -> None:
+        '''
+        Flush the container and release its storage: the file it's mapped on, or its shared memory
+        block (see `core.Array.close`). The container can't be used after it's closed.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        '''
+
+        self.flush()
+        self._array.close()
+
+
+    @classmethod
+    def _open(cls, path: str, **options) -> ArrayContainer:
+        '''
+        Reopen a container created with a `path`, or saved with `save`, mapping the file write-through.
+        '''
+
+        result = cls._from_storage(*persistence.open_mapped(path), **options)
+        result._path = path
+        return result
+
+
+    def _header(self) -> persistence.Header:
+        '''
+        Describe the content of the container, as stored in the header of its file.
+        '''
+
+        raise NotImplementedError
+
+
+    @classmethod
+    def _from_storage(cls, header: persistence.Header, storage: core.Array, **options) -> ArrayContainer:
+        '''
+        Create a container using a loaded `core.Array` as storage.
+
+        Parameters:
+            header (persistence.Header): The metadata of the loaded array.
+            storage (core.Array): The loaded array, with `header.capacity` elements.
+            options: The keyword arguments of the subclass constructor (e.g. `growth_factor`).
+
+        Returns:
+            ArrayContainer: A new container of this class, holding the first `header.size` elements of `storage`.
+
+        Error Handling:
+            Raises a ValueError if the options are invalid, or if the subclass can't hold the loaded array.
+        '''
+
+        result = cls(1, header.typecode, **options)
+        result._adopt(header, storage)
+        return result
+
+
+    def _adopt(self, header: persistence.Header, storage: core.Array) -> None:
+        '''
+        Replace the storage of a new, empty container with a loaded `core.Array`, and restore
+        the size, capacity and any auxiliary structure of the container.
+        '''
+
+        raise NotImplementedError
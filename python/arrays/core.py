@@ -1,5 +1,9 @@
+from __future__ import annotations
 import array
-from typing import Union
+import mmap
+import os
+from multiprocessing import shared_memory
+from typing import Iterable, Optional, Union
 
 class Array:
     '''Return a new array whose items are restricted by typecode, and
@@ -25,17 +29,214 @@ class Array:
            'f'         floating point     4
            'd'         floating point     8
 
+       If a `path` is passed, the array is stored in a memory-mapped file rather than in memory:
+       the operating system pages the elements in and out as they are accessed, and the content
+       of the file persists after the array is closed. If the file already exists, its content
+       is kept (and the file truncated or extended with zeros to `size` elements), so it can be
+       reopened without rebuilding the array. All type codes but 'u' can be used for file-backed arrays.
+
+       If `shared` is True, the array is stored in a new shared memory block instead, that other
+       processes can attach to by name with `Array.attach`: they see the same elements, without
+       copying them. Pickling a shared array only pickles the name of its block, so that a shared
+       array (or a container holding one) can be passed to a pool of worker processes for free.
+       The block is destroyed when the array that created it is closed. All type codes but 'u'
+       can be used for shared arrays.
+
         Parameters:
             max_capacity (int): The maximum number of elements the array can hold.
             typecode (str, optional): The typecode of the array. Defaults to 'l' for int.
+            path (str, optional): The file backing the array. Defaults to None, for an in-memory array.
+            shared (bool, optional): Whether to store the array in shared memory. Defaults to False.
 
        '''
 
-    def __init__(self, size: int, typecode: str = 'l'):
+    def __init__(self, size: int, typecode: str = 'l', path: Optional[str] = None, shared: bool = False):
         if size <= 0:
             raise ValueError(f'Invalid array size (must be positive): {size}')
+        if path is not None and shared:
+            raise ValueError('An array can not be both file-backed and shared')
         self._size = size
-        self._array = array.array(typecode, [0] * size)
+        self._typecode = typecode
+        self._mmap = None
+        self._offset = 0
+        self._copy_on_write = False
+        self._shm = None
+        self._owner = False
+        if shared:
+            self._map_shared(size)
+        elif path is None:
+            # Initializing from zeroed bytes avoids building a temporary list of `size` Python ints
+            self._array = array.array(typecode)
+            self._array.frombytes(bytes(size * self._array.itemsize))
+        else:
+            self._map_file(path, size)
+
+
+    @classmethod
+    def _empty(cls, typecode: str) -> Array:
+        '''
+        Create an array without storage, to be set up by one of the `_map_*` methods.
+        '''
+
+        arr = cls.__new__(cls)
+        arr._typecode = typecode
+        arr._mmap = None
+        arr._offset = 0
+        arr._copy_on_write = False
+        arr._shm = None
+        arr._owner = False
+        return arr
+
+
+    @classmethod
+    def open(cls, path: str, typecode: str = 'l', offset: int = 0, copy_on_write: bool = False) -> Array:
+        '''
+        Open an existing file as a file-backed array.
+
+        Parameters:
+            path (str): The file backing the array.
+            typecode (str, optional): The typecode the array was created with. Defaults to 'l' for int.
+            offset (int, optional): The number of bytes to skip at the beginning of the file,
+                                    e.g. for a header. Defaults to 0.
+            copy_on_write (bool, optional): If True, the file is mapped privately: changes to the
+                                            array are never written back to the file, and the file
+                                            can be read-only. Defaults to False.
+
+        Returns:
+            Array: A new array mapped on the file. Its size is inferred from the size of the file,
+                   and its elements are not read until they are accessed.
+
+        Error Handling:
+            Raises a ValueError if there is no element after `offset`, or the size of the rest of
+            the file is not a multiple of the item size.
+        '''
+
+        itemsize = array.array(typecode).itemsize
+        file_size = os.path.getsize(path) - offset
+        if offset < 0 or file_size <= 0 or file_size % itemsize != 0:
+            raise ValueError(f'Invalid file size for typecode {typecode}: {file_size} bytes after offset {offset}')
+        arr = cls._empty(typecode)
+        arr._size = file_size // itemsize
+        arr._map_file(path, arr._size, offset, copy_on_write)
+        return arr
+
+
+    def _map_file(self, path: str, size: int, offset: int = 0, copy_on_write: bool = False) -> None:
+        '''
+        Map a file in memory and use it as storage for the array.
+
+        Parameters:
+            path (str): The file backing the array. Unless `copy_on_write` is True, it's created
+                        if it doesn't exist, and resized to fit exactly `size` elements after `offset`.
+            size (int): The number of elements in the array.
+            offset (int, optional): The position, in bytes, of the first element in the file. Defaults to 0.
+            copy_on_write (bool, optional): Whether to map the file privately. Defaults to False.
+        '''
+
+        if self._typecode == 'u':
+            raise ValueError("Typecode 'u' is not supported for file-backed arrays")
+        length = offset + size * array.array(self._typecode).itemsize
+        if copy_on_write:
+            fd = os.open(path, os.O_RDONLY)
+        else:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT)
+        try:
+            if copy_on_write:
+                self._mmap = mmap.mmap(fd, length, access=mmap.ACCESS_COPY)
+            else:
+                if os.fstat(fd).st_size != length:
+                    os.ftruncate(fd, length)
+                self._mmap = mmap.mmap(fd, length)
+        finally:
+            os.close(fd)
+        self._offset = offset
+        self._copy_on_write = copy_on_write
+        self._array = memoryview(self._mmap)[offset:].cast(self._typecode)
+
+
+    @classmethod
+    def attach(cls, name: str, typecode: str = 'l', size: Optional[int] = None) -> Array:
+        '''
+        Attach to the shared memory block of a shared array, possibly created by another process.
+
+        Parameters:
+            name (str): The name of the block, as returned by `name()`.
+            typecode (str, optional): The typecode the array was created with. Defaults to 'l' for int.
+            size (int, optional): The number of elements in the array. Defaults to as many elements
+                                  as fit in the block (which can be rounded up to a whole number of pages).
+
+        Returns:
+            Array: A new array sharing its elements with all the arrays attached to the same block.
+                   Closing it doesn't destroy the block.
+
+        Error Handling:
+            Raises a FileNotFoundError if there is no block with this name, and a ValueError if
+            the block is too small for `size` elements.
+        '''
+
+        arr = cls._empty(typecode)
+        arr._map_shared(size, name)
+        return arr
+
+
+    def _map_shared(self, size: Optional[int], name: Optional[str] = None) -> None:
+        '''
+        Use a shared memory block as storage for the array.
+
+        Parameters:
+            size (int, optional): The number of elements in the array. It can only be None
+                                  when attaching to an existing block.
+            name (str, optional): The name of the block to attach to. Defaults to None, to create a new block.
+        '''
+
+        if self._typecode == 'u':
+            raise ValueError("Typecode 'u' is not supported for shared arrays")
+        itemsize = array.array(self._typecode).itemsize
+        if name is None:
+            block = shared_memory.SharedMemory(create=True, size=size * itemsize)
+        else:
+            block = shared_memory.SharedMemory(name)
+            if size is None:
+                size = block.size // itemsize
+            if size <= 0 or size * itemsize > block.size:
+                block.close()
+                raise ValueError(f'Invalid size for shared memory block {name}: {size}')
+        self._size = size
+        self._array = block.buf[:size * itemsize].cast(self._typecode)
+        self._shm = block
+        self._owner = name is None
+
+
+    def _release_shared(self) -> None:
+        '''
+        Detach the array from its shared memory block, and destroy the block if the array created it.
+        '''
+
+        self._array.release()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+            self._owner = False
+
+
+    def __reduce__(self):
+        '''
+        Support pickling: a shared array is pickled as the name of its block, and unpickled
+        by attaching to the block. Other arrays are pickled with their elements.
+        '''
+
+        if self._shm is not None:
+            return (Array.attach, (self._shm.name, self._typecode, self._size))
+        return super().__reduce__()
+
+
+    def __del__(self):
+        '''
+        Release the shared memory block of a shared array when the array is garbage collected.
+        '''
+
+        if getattr(self, '_shm', None) is not None:
+            self._release_shared()
 
 
     def __len__(self):
@@ -52,37 +253,304 @@ class Array:
         return self._size
     
 
-    def __getitem__(self, index: int) -> Union[int, float]:
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, float, array.array]:
         '''
-        Get the value at the given index.
+        Get the value at the given index, or a copy of a range of values.
 
         Parameters:
-            index (int): The index to get the value from.
+            index (Union[int, slice]): The index to get the value from, or a slice
+                                       selecting a range of indices.
 
         Returns:
-            Union[int, float]: The value at the given index.
+            Union[int, float, array.array]: The value at the given index, or, for a slice,
+                                            a new `array.array` with the selected values.
         '''
 
+        if isinstance(index, slice):
+            if not isinstance(self._array, array.array):
+                return array.array(self._typecode, self._array[index].tobytes())
+            return self._array[index]
         if index < 0 or index >= self._size:
             raise IndexError('array index out of range')
         return self._array[index]
         
 
-    def __setitem__(self, index: int, val: Union[int, float]) -> None:
+    def __setitem__(self, index: Union[int, slice], val: Union[int, float, Iterable]) -> None:
         '''
-        Set the value at the given index.
+        Set the value at the given index, or overwrite a range of values.
 
         Parameters:
-            index (int): The index to set the value at.
-            val (Union[int, float]): The value to set.
+            index (Union[int, slice]): The index to set the value at, or a slice
+                                       selecting a range of indices.
+            val (Union[int, float, Iterable]): The value to set or, for a slice, the values
+                                               to copy into the range.
 
         Returns:
             None
+
+        Error Handling:
+            Raises a ValueError if the number of values assigned to a slice doesn't match
+            the size of the slice: the size of a static array can't change.
         '''
 
+        if isinstance(index, slice):
+            values = val if isinstance(val, array.array) else array.array(self._typecode, val)
+            if len(range(*index.indices(self._size))) != len(values):
+                raise ValueError('slice assignment can not change the size of the array')
+            self._array[index] = values
+            return
         if index < 0 or index >= self._size:
             raise IndexError('array assignment index out of range')
         self._array[index] = val
+
+
+    def _check_range(self, start: int, count: int) -> None:
+        '''
+        Check that a range of indices is within the bounds of the array.
+
+        Parameters:
+            start (int): The first index in the range.
+            count (int): The number of elements in the range.
+
+        Error Handling:
+            Raises an IndexError if any index in the range is out of bounds.
+        '''
+
+        if start < 0 or count < 0 or start + count > self._size:
+            raise IndexError(f'range [{start}, {start + count}) out of bounds')
+
+
+    def typecode(self) -> str:
+        '''
+        Return the typecode of the array.
+
+        Parameters:
+            None
+
+        Returns:
+            str: The typecode character used to create the array.
+        '''
+
+        return self._typecode
+
+
+    def is_file_backed(self) -> bool:
+        '''
+        Check if the array is stored in a memory-mapped file.
+
+        Parameters:
+            None
+
+        Returns:
+            bool: True if the array is backed by a file, False if it's stored in memory.
+        '''
+
+        return self._mmap is not None
+
+
+    def is_shared(self) -> bool:
+        '''
+        Check if the array is stored in a shared memory block.
+
+        Parameters:
+            None
+
+        Returns:
+            bool: True if the array is stored in shared memory, False otherwise.
+        '''
+
+        return self._shm is not None
+
+
+    def name(self) -> Optional[str]:
+        '''
+        Return the name of the shared memory block of the array.
+
+        Parameters:
+            None
+
+        Returns:
+            Optional[str]: The name to pass to `Array.attach`, or None if the array is not shared.
+        '''
+
+        return self._shm.name if self._shm is not None else None
+
+
+    def share(self) -> Array:
+        '''
+        Copy the array into a new shared array.
+
+        Parameters:
+            None
+
+        Returns:
+            Array: A shared array with the same typecode and elements, copied with a single bulk copy.
+        '''
+
+        shared = Array(self._size, self._typecode, shared=True)
+        shared._array[:] = self._array
+        return shared
+
+
+    def resize(self, new_size: int) -> None:
+        '''
+        Change the number of elements the array can hold, in place.
+
+        Parameters:
+            new_size (int): The new size of the array. Must be positive.
+
+        Returns:
+            None
+
+        Functionality:
+            The underlying buffer is extended (with zeros) or truncated without copying
+            the elements one by one. For file-backed arrays, the file is resized as well,
+            except for copy-on-write mappings, which can't be resized: their elements
+            are copied to memory, and the array is no longer file-backed.
+            Shared memory blocks can't be resized: the elements are moved, with a single
+            bulk copy, to a new block, and the name of the array changes.
+
+        Error Handling:
+            Raises a ValueError if the new size is not positive, and a BufferError if a
+            memoryview exported by the array is still alive.
+        '''
+
+        if new_size <= 0:
+            raise ValueError(f'Invalid array size (must be positive): {new_size}')
+        if self._copy_on_write:
+            elements = array.array(self._typecode, self._array.tobytes())
+            self.close()
+            self._mmap = None
+            self._copy_on_write = False
+            self._array = elements
+        if self._mmap is not None:
+            self._array.release()
+            try:
+                self._mmap.resize(self._offset + new_size * array.array(self._typecode).itemsize)
+            finally:
+                self._array = memoryview(self._mmap)[self._offset:].cast(self._typecode)
+        elif self._shm is not None:
+            old_array, old_block, old_owner = self._array, self._shm, self._owner
+            count = min(new_size, self._size)
+            self._map_shared(new_size)
+            self._array[:count] = old_array[:count]
+            if old_owner:
+                old_block.unlink()
+            old_array.release()
+            old_block.close()
+        elif new_size > self._size:
+            self._array.frombytes(bytes((new_size - self._size) * self._array.itemsize))
+        else:
+            del self._array[new_size:]
+        self._size = new_size
+
+
+    def flush(self) -> None:
+        '''
+        Write any change to a file-backed array to disk. For in-memory arrays, this does nothing.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        '''
+
+        if self._mmap is not None:
+            self._mmap.flush()
+
+
+    def close(self) -> None:
+        '''
+        Flush and unmap a file-backed array, or detach a shared array from its block (destroying
+        the block if this array created it): the array can't be used after it's closed.
+        For in-memory arrays, this does nothing.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        '''
+
+        if self._mmap is not None:
+            self._array.release()
+            self._mmap.close()
+        elif self._shm is not None:
+            self._release_shared()
+
+
+    def copy_from(self, source: Union[Array, array.array], source_start: int = 0,
+                  dest_start: int = 0, count: Optional[int] = None) -> None:
+        '''
+        Copy a range of elements from another array into this one.
+
+        Parameters:
+            source (Union[Array, array.array]): The array to copy from. It can be this same array,
+                                                in which case source and destination ranges may overlap.
+            source_start (int, optional): The first index to copy from `source`. Defaults to 0.
+            dest_start (int, optional): The first index to copy to in this array. Defaults to 0.
+            count (int, optional): The number of elements to copy. Defaults to all the elements
+                                   of `source` from `source_start` to its end.
+
+        Returns:
+            None
+
+        Functionality:
+            The whole range is moved with a single slice assignment on the underlying buffers,
+            rather than one bounds-checked assignment per element.
+
+        Error Handling:
+            Raises an IndexError if either range is out of bounds.
+        '''
+
+        source_array = source._array if isinstance(source, Array) else source
+        if count is None:
+            count = len(source_array) - source_start
+        if source_start < 0 or count < 0 or source_start + count > len(source_array):
+            raise IndexError(f'source range [{source_start}, {source_start + count}) out of bounds')
+        self._check_range(dest_start, count)
+        self._array[dest_start:dest_start + count] = source_array[source_start:source_start + count]
+
+
+    def fill(self, val: Union[int, float], start: int = 0, end: Optional[int] = None) -> None:
+        '''
+        Set all the elements in a range to the same value.
+
+        Parameters:
+            val (Union[int, float]): The value to set.
+            start (int, optional): The first index of the range. Defaults to 0.
+            end (int, optional): The index after the last one in the range. Defaults to the size of the array.
+
+        Returns:
+            None
+
+        Error Handling:
+            Raises an IndexError if the range is out of bounds.
+        '''
+
+        if end is None:
+            end = self._size
+        self._check_range(start, end - start)
+        self._array[start:end] = array.array(self._typecode, [val]) * (end - start)
+
+
+    def as_memoryview(self) -> memoryview:
+        '''
+        Export the content of the array without copying it.
+
+        Parameters:
+            None
+
+        Returns:
+            memoryview: A view sharing memory with the array: writes through the view are
+                        visible in the array, and vice versa.
+
+        Warning:
+            While a view is alive, the underlying buffer can't be resized.
+        '''
+
+        return memoryview(self._array)
     
     
     def __repr__(self):
@@ -96,4 +564,4 @@ class Array:
             str: The string representation of the array.
         '''
 
-        return repr(self._array)
\ No newline at end of file
+        return repr(self[:])
\ No newline at end of file
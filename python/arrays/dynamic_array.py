@@ -1,7 +1,12 @@
+import array
 import arrays.core as core
-from typing import Union
+import arrays.kernels as kernels
+import arrays.persistence as persistence
+import arrays.parallel as parallel
+from arrays.container import ArrayContainer
+from typing import Any, Callable, Iterable, List, Optional, Union
 
-class DynamicArray:
+class DynamicArray(ArrayContainer):
     '''Return a new dynamic _unsorted_ array whose items are restricted by typecode.
        The initial capacity of the array is by default 1, but this can be changed
        by passing a value for the initial_capacity argument.
@@ -10,6 +15,13 @@ class DynamicArray:
        seamlessly expand and shrink automatically when needed.
        The initial capacity can be set, however, to optimize initial allocation, if
        the user knows the approximate number of elements that will be needed.
+
+       When the array is full, its capacity is multiplied by `growth_factor` (2, by default,
+       doubling the capacity). When the number of elements falls to `shrink_ratio` times the
+       capacity or less (a quarter of the capacity, by default), the capacity is divided by
+       `growth_factor`. Keeping `shrink_ratio` strictly smaller than `1 / growth_factor` leaves
+       some slack after each resize, so that alternating inserts and deletes can't trigger
+       a resize at every operation.
        
        Arrays represent basic values and behave very much like Python list, except
        the type of objects stored in them is constrained. The type is specified
@@ -34,13 +46,30 @@ class DynamicArray:
         Parameters:
             initial_capacity (int, optional): The maximum number of elements the array can hold.
             typecode (str, optional): The typecode of the array. Defaults to 'l' for int.
+            path (str, optional): A new file to store the elements in, through a memory-mapped `core.Array`.
+                                  The file is resized together with the array, and must not exist:
+                                  use `open` to reopen it. Defaults to None, for an in-memory array.
+            growth_factor (float, optional): The factor by which the capacity grows when the array is full.
+                                             Must be greater than 1. Defaults to 2.
+            shrink_ratio (float, optional): The fraction of the capacity that, when reached by the size of the array,
+                                            makes the array shrink. Must be non-negative and smaller than
+                                            `1 / growth_factor`; 0 means the array never shrinks automatically.
+                                            Defaults to 0.25.
 
        '''
-    def __init__(self, initial_capacity: int = 1, typecode: str = 'l') -> None:
-        self._array = core.Array(initial_capacity, typecode)
+    def __init__(self, initial_capacity: int = 1, typecode: str = 'l', path: Optional[str] = None,
+                 growth_factor: float = 2, shrink_ratio: float = 0.25) -> None:
+        if growth_factor <= 1:
+            raise ValueError(f'Invalid growth factor (must be greater than 1): {growth_factor}')
+        if shrink_ratio < 0 or shrink_ratio * growth_factor >= 1:
+            raise ValueError(f'Invalid shrink ratio (must be in [0, 1/growth_factor)): {shrink_ratio}')
+        self._array = self._new_storage(initial_capacity, typecode, path)
+        self._path = path
         self._capacity = initial_capacity
         self._size = 0
         self._typecode = typecode
+        self._growth_factor = growth_factor
+        self._shrink_ratio = shrink_ratio
 
 
     def __len__(self) -> int:
@@ -84,7 +113,7 @@ class DynamicArray:
             str: The string representation of the array.
         '''
 
-        return repr(self._array._array[:self._size])    
+        return repr(self._array[:self._size])    
 
 
     def __iter__(self):
@@ -117,50 +146,121 @@ class DynamicArray:
         return self._size >= self._capacity
     
     
-    def _double_size(self):
+    def _resize(self, new_capacity: int) -> None:
+        '''
+        Change the capacity of the array.
+
+        Parameters:
+            new_capacity (int): The new capacity. Must be at least as large as the size of the array.
+
+        Functionality:
+            Resizes the underlying static array in place: its buffer is extended or truncated,
+            without copying the elements one by one.
         '''
-        Double the size of the underlying static array.
+
+        assert(self._size <= new_capacity)   # Invariant: no element can be lost when resizing
+        self._array.resize(new_capacity)
+        self._capacity = new_capacity
+
+        assert(self._array._size == self._capacity) # Invariant: the size of the new static array should be equal to the new capacity
+
+
+    def _grow(self) -> None:
+        '''
+        Grow the underlying static array by the growth factor.
 
         Parameters: 
             None
 
         Functionality:
-            Creates a new array with double the capacity of the old one.
-            Copies all elements from the old array into the new larger array.
+            Multiplies the capacity by the growth factor, making sure it increases by at least one element.
         '''
 
         assert(self._capacity  == self._size)   # Invariant: this is called only when capacity == size
-        old_array = self._array
-        self._array = core.Array(self._capacity * 2, self._typecode)
-        self._capacity *= 2
-        for i in range(self._size):
-            self._array[i] = old_array[i]
+        self._resize(max(self._capacity + 1, int(self._capacity * self._growth_factor)))
 
-        assert(self._array._size == self._capacity) # Invariant: the size of the new static array should be equal to the new capacity
 
+    def _should_shrink(self) -> bool:
+        '''
+        Check if the array is sparse enough that it should shrink.
 
-    def _halve_size(self):
+        Parameters:
+            None
+
+        Returns:
+            bool: True if shrinking is enabled, the capacity is larger than 1, and the size
+                  is at most `shrink_ratio` times the capacity.
+        '''
+
+        return self._shrink_ratio > 0 and self._capacity > 1 and self._size <= self._capacity * self._shrink_ratio
+
+
+    def _shrink(self) -> None:
         '''
-        Resize the static array to half the capacity.
+        Shrink the underlying static array by the growth factor.
 
         Parameters: 
             None
 
         Functionality:
-            Halves the size of the underlying static array.
+            Divides the capacity by the growth factor. The elements stored are all at the
+            beginning of the static array, so none of them is lost.
+        '''
+
+        assert(self._should_shrink())   # Invariant: this is called only when size <= capacity * shrink_ratio
+        self._resize(max(1, int(self._capacity / self._growth_factor)))
+
 
-            Creates a new array with half the capacity of the old one.
-            Copies all elements from the old array into the new smaller array.
+    def capacity(self) -> int:
         '''
+        Return the number of elements the array can hold before it needs to grow.
 
-        assert(self._capacity > 1 and self._size <= self._capacity/4) # Invariant: this is called only when capacity > 1 and size <= capacity/4
-        old_array = self._array
-        self._array = core.Array(self._capacity // 2, self._typecode)
-        self._capacity //= 2
-        for i in range(self._size):
-            self._array[i] = old_array[i]
+        Parameters:
+            None
 
-        assert(self._array._size == self._capacity) # Invariant: the size of the new static array should be equal to the new capacity
+        Returns:
+            int: The current capacity of the array.
+        '''
+
+        return self._capacity
+
+
+    def reserve(self, capacity: int) -> None:
+        '''
+        Make sure the array can hold at least `capacity` elements without growing.
+
+        Parameters:
+            capacity (int): The minimum capacity needed.
+
+        Returns:
+            None
+
+        Functionality:
+            If the current capacity is smaller than `capacity`, grows the array with a single resize.
+            Otherwise, does nothing. Use it before inserting many elements, to avoid intermediate resizes.
+        '''
+
+        if capacity > self._capacity:
+            self._resize(capacity)
+
+
+    def shrink_to_fit(self) -> None:
+        '''
+        Reduce the capacity of the array to the number of elements it holds.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        Functionality:
+            Frees the unused capacity (the capacity is never reduced below 1).
+        '''
+
+        new_capacity = max(1, self._size)
+        if new_capacity < self._capacity:
+            self._resize(new_capacity)
 
 
     def is_empty(self):
@@ -196,13 +296,55 @@ class DynamicArray:
         '''
 
         if self._is_full():
-            self._double_size()
+            self._grow()
 
         # By now, we are sure that self._size < len(self._array)
         self._array[self._size] = value
         self._size += 1
 
 
+    def extend(self, values: Iterable[Union[int, float]]) -> None:
+        '''
+        Insert all the values in an iterable at the end of the array.
+
+        Parameters:
+            values (Iterable): The values to insert, in order.
+
+        Returns:
+            None
+
+        Functionality:
+            Converts the values to the array's type first, then grows the array at most once,
+            to at least the capacity needed, and finally copies all values with a single bulk write.
+        '''
+
+        new_values = array.array(self._typecode, values)
+        new_size = self._size + len(new_values)
+        if new_size > self._capacity:
+            self._resize(max(new_size, int(self._capacity * self._growth_factor)))
+        self._array[self._size:new_size] = new_values
+        self._size = new_size
+
+
+    def _shrink_to_size(self) -> None:
+        '''
+        Shrink the array until its capacity is consistent with its size, with a single resize.
+
+        Parameters:
+            None
+
+        Functionality:
+            Computes the capacity the array would have after shrinking it repeatedly, and
+            resizes it only once.
+        '''
+
+        new_capacity = self._capacity
+        while self._shrink_ratio > 0 and new_capacity > 1 and self._size <= new_capacity * self._shrink_ratio:
+            new_capacity = max(1, int(new_capacity / self._growth_factor))
+        if new_capacity != self._capacity:
+            self._resize(new_capacity)
+
+
     def find(self, target: Union[int, float]) -> Union[int, None]:
         '''
         Search for a target value in the unsorted array.
@@ -217,13 +359,105 @@ class DynamicArray:
             Performs a linear search over the values in the sorted array.
             Returns the index of the leftmost occurrence of the target value, if found.
             Otherwise returns None.
+            The scan runs over the underlying buffer, through `kernels.find`.
         '''
 
-        for i in range(self._size):
-            if self._array[i] == target:
-                return i
-        # Element not found, reached the end of the array
-        return None
+        return kernels.find(self._array, self._size, target)
+
+
+    def find_all(self, target: Union[int, float]) -> List[int]:
+        '''
+        Find all the occurrences of a target value in the dynamic array.
+
+        Parameters:
+            target (Union[int, float]): The value to search for.
+
+        Returns:
+            List[int]: The indices of all the entries equal to the target, in increasing order.
+        '''
+
+        return kernels.find_all(self._array, self._size, target)
+
+
+    def count(self, target: Union[int, float]) -> int:
+        '''
+        Count the occurrences of a target value in the dynamic array.
+
+        Parameters:
+            target (Union[int, float]): The value to count.
+
+        Returns:
+            int: The number of entries equal to the target.
+        '''
+
+        return kernels.count(self._array, self._size, target)
+
+
+    def min(self) -> Union[int, float]:
+        '''
+        Return the smallest value in the dynamic array.
+
+        Returns:
+            Union[int, float]: The smallest value stored.
+
+        Error Handling:
+            Raises a ValueError if the array is empty.
+        '''
+
+        return kernels.min(self._array, self._size)
+
+
+    def max(self) -> Union[int, float]:
+        '''
+        Return the largest value in the dynamic array.
+
+        Returns:
+            Union[int, float]: The largest value stored.
+
+        Error Handling:
+            Raises a ValueError if the array is empty.
+        '''
+
+        return kernels.max(self._array, self._size)
+
+
+    def sum(self) -> Union[int, float]:
+        '''
+        Return the sum of the values in the dynamic array.
+
+        Returns:
+            Union[int, float]: The sum of all the values stored, or 0 if the array is empty.
+        '''
+
+        return kernels.sum(self._array, self._size)
+
+
+    def argmin(self) -> int:
+        '''
+        Return the index of the smallest value in the dynamic array.
+
+        Returns:
+            int: The index of the first occurrence of the smallest value.
+
+        Error Handling:
+            Raises a ValueError if the array is empty.
+        '''
+
+        return kernels.argmin(self._array, self._size)
+
+
+    def argmax(self) -> int:
+        '''
+        Return the index of the largest value in the dynamic array.
+
+        Returns:
+            int: The index of the first occurrence of the largest value.
+
+        Error Handling:
+            Raises a ValueError if the array is empty.
+        '''
+
+        return kernels.argmax(self._array, self._size)
 
 
     def delete(self, target: Union[int, float]) -> None:
@@ -248,10 +482,187 @@ class DynamicArray:
             raise ValueError(f'Unable to delete element {target}: the entry is not in the array')
 
         # Must shift all the elements after the position of the target
-        for i in range(index, self._size - 1):
-            self._array[i] = self._array[i + 1]
+        self._array.copy_from(self._array, index + 1, index, self._size - index - 1)
         self._size -= 1    
 
         # Check if we should shrink the array
-        if self._capacity > 1 and self._size <= self._capacity/4:
-            self._halve_size()
+        if self._should_shrink():
+            self._shrink()
+
+
+    def delete_where(self, predicate: Callable[[Union[int, float]], bool]) -> int:
+        '''
+        Delete all the values in the array matching a predicate.
+
+        Parameters:
+            predicate (Callable): A function taking a value and returning True if it should be deleted.
+
+        Returns:
+            int: The number of values deleted.
+
+        Functionality:
+            Compacts the array in a single pass, keeping the remaining elements in the order
+            they were inserted, and then shrinks the array, if needed, with a single resize.
+        '''
+
+        kept = [value for value in self._array[:self._size] if not predicate(value)]
+        deleted = self._size - len(kept)
+        if deleted > 0:
+            self._array[0:len(kept)] = kept
+            self._size = len(kept)
+            self._shrink_to_size()
+        return deleted
+
+
+    def delete_many(self, values: Iterable[Union[int, float]]) -> int:
+        '''
+        Delete all the occurrences of any of the given values from the array.
+
+        Parameters:
+            values (Iterable): The values to delete. Values not in the array are ignored.
+
+        Returns:
+            int: The number of elements deleted.
+
+        Functionality:
+            Like `delete_where`, compacts the array in a single pass, checking each element
+            against a set of the values to delete.
+        '''
+
+        targets = set(values)
+        return self.delete_where(lambda value: value in targets)
+
+
+    def parallel_traverse(self, callback: Callable[..., Any], workers: Optional[int] = None,
+                          chunk_size: Optional[int] = None) -> List[Any]:
+        '''
+        Traverse a dynamic array in parallel, calling a callback function on each element.
+
+        Parameters:
+            callback (function): The function to call on each element. It must be picklable,
+                                 i.e. defined at the top level of a module.
+            workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+            chunk_size (int, optional): The number of elements handled by each task. Defaults to
+                                        splitting the elements evenly between the workers.
+
+        Returns:
+            List[Any]: The values returned by the callback, in the same order as the elements.
+
+        Functionality:
+            The elements are shared with a pool of worker processes through shared memory,
+            see `parallel.parallel_traverse`.
+        '''
+
+        return parallel.parallel_traverse(self._array, self._size, callback, workers, chunk_size)
+
+
+    def to_bytes(self) -> bytes:
+        '''
+        Serialize the array.
+
+        Parameters:
+            None
+
+        Returns:
+            bytes: A header (typecode, size, capacity) followed by the raw buffer
+                   of the elements, see `persistence`.
+        '''
+
+        return persistence.to_bytes(self._array, self._size, self._capacity)
+
+
+    def save(self, path: str) -> None:
+        '''
+        Save the array to a file, in the format of `to_bytes`.
+
+        Parameters:
+            path (str): The file to write. It's replaced atomically if it already exists.
+        '''
+
+        persistence.save(path, self._array, self._size, self._capacity)
+
+
+    @classmethod
+    def from_bytes(cls, data: bytes, growth_factor: float = 2, shrink_ratio: float = 0.25) -> 'DynamicArray':
+        '''
+        Deserialize an array serialized with `to_bytes`.
+
+        Parameters:
+            data (bytes): The serialized array.
+            growth_factor (float, optional): The growth factor of the new array, see `DynamicArray`. Defaults to 2.
+            shrink_ratio (float, optional): The shrink ratio of the new array, see `DynamicArray`. Defaults to 0.25.
+
+        Returns:
+            DynamicArray: A new in-memory array, with the same elements and capacity.
+
+        Error Handling:
+            Raises a ValueError if the data is not a valid serialized array.
+        '''
+
+        return cls._from_storage(*persistence.from_bytes(data), growth_factor=growth_factor,
+                                 shrink_ratio=shrink_ratio)
+
+
+    @classmethod
+    def load(cls, path: str, mapped: bool = False, growth_factor: float = 2,
+             shrink_ratio: float = 0.25) -> 'DynamicArray':
+        '''
+        Load an array saved with `save`.
+
+        Parameters:
+            path (str): The file to read.
+            mapped (bool, optional): If True, the elements are mapped from the file, copy-on-write,
+                                     instead of being read: loading takes constant time, and the
+                                     file is never modified. Defaults to False.
+            growth_factor (float, optional): The growth factor of the new array, see `DynamicArray`. Defaults to 2.
+            shrink_ratio (float, optional): The shrink ratio of the new array, see `DynamicArray`. Defaults to 0.25.
+
+        Returns:
+            DynamicArray: A new array, with the same elements and capacity.
+
+        Error Handling:
+            Raises a ValueError if the file is not a valid saved array.
+        '''
+
+        return cls._from_storage(*persistence.load(path, mapped), growth_factor=growth_factor,
+                                 shrink_ratio=shrink_ratio)
+
+
+
+    @classmethod
+    def open(cls, path: str, growth_factor: float = 2, shrink_ratio: float = 0.25) -> 'DynamicArray':
+        '''
+        Reopen an array created with a `path` (or saved with `save`), without copying its elements.
+
+        Parameters:
+            path (str): The file backing the array.
+            growth_factor (float, optional): The growth factor of the array, see `DynamicArray`. Defaults to 2.
+            shrink_ratio (float, optional): The shrink ratio of the array, see `DynamicArray`. Defaults to 0.25.
+
+        Returns:
+            DynamicArray: The array stored in the file, mapped write-through: like the array that created
+                          the file, it must be closed (or flushed) for the file to record its new size.
+
+        Error Handling:
+            Raises a ValueError if the file is not a valid saved array.
+        '''
+
+        return cls._open(path, growth_factor=growth_factor, shrink_ratio=shrink_ratio)
+
+
+    def _header(self) -> persistence.Header:
+        '''
+        Describe the content of the array, see `ArrayContainer`.
+        '''
+
+        return persistence.Header(self._typecode, self._size, self._capacity, False)
+
+
+    def _adopt(self, header: persistence.Header, storage: core.Array) -> None:
+        '''
+        Use a loaded `core.Array` as storage, see `ArrayContainer`.
+        '''
+
+        self._array = storage
+        self._capacity = header.capacity
+        self._size = header.size
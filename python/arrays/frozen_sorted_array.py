@@ -0,0 +1,168 @@
+"""Module providing a read-only sorted array, laid out for cache-friendly searches."""
+from __future__ import annotations
+from typing import Iterable, List, Optional, Union
+import arrays.core as core
+
+try:
+    import numpy as np
+except ImportError:     # pragma: no cover
+    np = None
+
+class FrozenSortedArray:
+    '''Return a new read-only array holding the given values, which must be sorted.
+
+       The values are stored in Eytzinger (breadth-first) order: slot 1 holds the root of an
+       implicit, complete binary search tree, and slots 2k and 2k+1 hold the children of slot k.
+       A search goes down the tree with the same sequence of comparisons as binary search, but
+       the first levels of the tree, visited by every search, are packed in a few adjacent slots
+       that stay in cache; the next slot to visit doesn't depend on a branch, but is computed as
+       `2k + (value < target)`, and all slots at the same depth of a batch of searches are
+       visited together, level by level.
+
+       Create one with `SortedArray.freeze()`, for read-mostly data: the snapshot doesn't change
+       when the original array is modified.
+
+        Parameters:
+            values (Iterable): The values to store, in sorted order.
+            typecode (str, optional): The typecode of the array. Defaults to 'l' for int.
+
+       '''
+
+    def __init__(self, values: Iterable[Union[int, float]], typecode: str = 'l') -> None:
+        sorted_values = list(values)
+        self._size = len(sorted_values)
+        # Slot 0 is not used: the root of the tree is in slot 1
+        self._array = core.Array(self._size + 1, typecode)
+        # For each slot, the index of its value in sorted order
+        self._ranks = core.Array(self._size + 1, 'q')
+        self._fill(sorted_values)
+
+
+    def _fill(self, sorted_values: List[Union[int, float]]) -> None:
+        '''
+        Store the sorted values in Eytzinger order.
+
+        Parameters:
+            sorted_values (List): The values to store, in sorted order.
+
+        Functionality:
+            Visits the implicit tree in-order, with an explicit stack: the k-th slot visited
+            gets the k-th smallest value.
+        '''
+
+        rank = 0
+        stack = []
+        slot = 1
+        while stack or slot <= self._size:
+            if slot <= self._size:
+                stack.append(slot)
+                slot = 2 * slot
+            else:
+                slot = stack.pop()
+                self._array[slot] = sorted_values[rank]
+                self._ranks[slot] = rank
+                rank += 1
+                slot = 2 * slot + 1
+
+
+    def __len__(self) -> int:
+        '''
+        Return the number of elements in the array.
+
+        Parameters:
+            None
+
+        Returns:
+            int: The number of elements in the array.
+        '''
+
+        return self._size
+
+
+    def __contains__(self, target: Union[int, float]) -> bool:
+        '''
+        Check if a value is in the array.
+
+        Parameters:
+            target (any): The value to search for.
+
+        Returns:
+            bool: True if the value is in the array, False otherwise.
+        '''
+
+        return self.search(target) is not None
+
+
+    def __repr__(self) -> str:
+        '''
+        Return the string representation of the array.
+
+        Parameters:
+            None
+
+        Returns:
+            str: The string representation of the array, with its values in Eytzinger order.
+        '''
+
+        return f'FrozenSortedArray({repr(self._array[1:])})'
+
+
+    def search(self, target: Union[int, float]) -> Optional[int]:
+        '''
+        Search for a target value in the array.
+
+        Parameters:
+            target (any): The value to search for.
+
+        Returns:
+            int or None: The index, in sorted order, of the leftmost occurrence of the target value
+                         if found, otherwise None.
+
+        Functionality:
+            Goes down the tree from the root, moving to the right child when the value in the current
+            slot is smaller than the target, and to the left child otherwise, until it falls off the tree.
+            The last slot where it moved left holds the smallest value not less than the target: it is
+            found by dropping the trailing 1 bits (the right moves) and one more bit from the final slot.
+        '''
+
+        slot = 1
+        while slot <= self._size:
+            slot = 2 * slot + (self._array[slot] < target)
+        slot >>= ((~slot) & (slot + 1)).bit_length()
+        if slot > 0 and self._array[slot] == target:
+            return self._ranks[slot]
+        return None
+
+
+    def search_many(self, targets: Iterable[Union[int, float]]) -> List[Optional[int]]:
+        '''
+        Search for many target values at once.
+
+        Parameters:
+            targets (Iterable): The values to search for.
+
+        Returns:
+            List[Optional[int]]: For each target, in the same order, the result of `search`.
+
+        Functionality:
+            If NumPy is installed, all the searches go down the tree together, one level at a time,
+            with vectorized operations over the whole batch. Otherwise, each target is searched separately.
+        '''
+
+        targets = list(targets)
+        if np is None or self._size == 0 or self._array.typecode() == 'u' or len(targets) == 0 \
+                or np.asarray(targets).dtype.kind not in 'iuf':
+            return [self.search(target) for target in targets]
+
+        values = np.frombuffer(self._array.as_memoryview(), dtype=self._array.typecode())
+        ranks = np.frombuffer(self._ranks.as_memoryview(), dtype='q')
+        targets = np.asarray(targets)
+        slots = np.ones(len(targets), dtype=np.int64)
+        for _ in range(self._size.bit_length()):
+            inside = slots <= self._size
+            go_right = values[np.where(inside, slots, 0)] < targets
+            slots = np.where(inside, 2 * slots + go_right, slots)
+        # Drop the trailing 1 bits and one more bit: (~s & (s + 1)) is the lowest 0 bit of s
+        slots >>= np.log2((~slots) & (slots + 1)).astype(np.int64) + 1
+        found = (slots > 0) & (values[slots] == targets)
+        return [int(rank) if hit else None for rank, hit in zip(ranks[slots], found)]
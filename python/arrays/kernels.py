@@ -0,0 +1,193 @@
+"""Module providing scan kernels over the first `size` elements of a `core.Array`.
+
+If NumPy is installed, the kernels wrap the array's buffer in a NumPy array, without copying it,
+and run vectorized over it. Otherwise, they fall back to the methods of `array.array` and to the
+built-in functions, which still loop in C rather than through Python-level, bounds-checked indexing.
+"""
+from __future__ import annotations
+import builtins
+import warnings
+from typing import Any, List, Optional, Union
+from arrays.core import Array
+
+try:
+    import numpy as np
+except ImportError:     # pragma: no cover
+    np = None
+
+
+def _as_numpy(arr: Array, size: int, target: Any = None) -> Optional[Any]:
+    '''
+    Wrap the first `size` elements of an array in a NumPy array, if possible.
+
+    Parameters:
+        arr (Array): The array to wrap.
+        size (int): The number of elements to include.
+        target (Any, optional): A value that will be compared to the elements, if any.
+
+    Returns:
+        Optional[numpy.ndarray]: A NumPy array sharing memory with `arr`, or None if NumPy
+                                 is not available, the array is empty, its typecode has no
+                                 NumPy equivalent, or `target` is not a number that can be
+                                 represented exactly in the type of the elements.
+
+    Functionality:
+        NumPy compares the elements to `target` after converting it to their type, while `array.array`
+        compares the Python values exactly: for instance, 2**53 + 1 would be rounded to 2**53 to be
+        compared to doubles. Targets that don't survive the conversion are left to the fallback.
+    '''
+
+    if np is None or size == 0 or arr.typecode() == 'u':
+        return None
+    if target is not None and not _is_exact(target, arr.typecode()):
+        return None
+    return np.frombuffer(arr.as_memoryview(), dtype=arr.typecode(), count=size)
+
+
+def _is_exact(target: Any, typecode: str) -> bool:
+    '''
+    Check if a value is a number that converts exactly to the NumPy type of a typecode.
+    '''
+
+    if np.asarray(target).dtype.kind not in 'iuf':
+        return False
+    with warnings.catch_warnings(), np.errstate(all='ignore'):
+        warnings.simplefilter('ignore')
+        try:
+            converted = np.array(target, dtype=typecode)
+        except (OverflowError, ValueError):
+            return False
+    return converted.item() == target
+
+
+def find(arr: Array, size: int, target: Union[int, float]) -> Optional[int]:
+    '''
+    Find the index of the first occurrence of a value.
+
+    Parameters:
+        arr (Array): The array to search.
+        size (int): The number of elements to search, starting from index 0.
+        target (Union[int, float]): The value to search for.
+
+    Returns:
+        Optional[int]: The index of the first occurrence of `target`, or None if it's not found.
+    '''
+
+    values = _as_numpy(arr, size, target)
+    if values is not None:
+        indices = np.flatnonzero(values == np.asarray(target))
+        return int(indices[0]) if len(indices) > 0 else None
+    try:
+        return arr[0:size].index(target)
+    except ValueError:
+        return None
+
+
+def find_all(arr: Array, size: int, target: Union[int, float]) -> List[int]:
+    '''
+    Find the indices of all the occurrences of a value.
+
+    Parameters:
+        arr (Array): The array to search.
+        size (int): The number of elements to search, starting from index 0.
+        target (Union[int, float]): The value to search for.
+
+    Returns:
+        List[int]: The indices of all the elements equal to `target`, in increasing order.
+    '''
+
+    values = _as_numpy(arr, size, target)
+    if values is not None:
+        return np.flatnonzero(values == np.asarray(target)).tolist()
+    return [i for i, value in enumerate(arr[0:size]) if value == target]
+
+
+def count(arr: Array, size: int, target: Union[int, float]) -> int:
+    '''
+    Count the occurrences of a value.
+
+    Parameters:
+        arr (Array): The array to search.
+        size (int): The number of elements to search, starting from index 0.
+        target (Union[int, float]): The value to count.
+
+    Returns:
+        int: The number of elements equal to `target`.
+    '''
+
+    values = _as_numpy(arr, size, target)
+    if values is not None:
+        return int(np.count_nonzero(values == np.asarray(target)))
+    return arr[0:size].count(target)
+
+
+def min(arr: Array, size: int) -> Union[int, float]:
+    '''
+    Return the smallest of the first `size` elements.
+
+    Error Handling:
+        Raises a ValueError if `size` is 0.
+    '''
+
+    values = _as_numpy(arr, size)
+    if values is not None:
+        return values.min().item()
+    return builtins.min(arr[0:size])
+
+
+def max(arr: Array, size: int) -> Union[int, float]:
+    '''
+    Return the largest of the first `size` elements.
+
+    Error Handling:
+        Raises a ValueError if `size` is 0.
+    '''
+
+    values = _as_numpy(arr, size)
+    if values is not None:
+        return values.max().item()
+    return builtins.max(arr[0:size])
+
+
+def sum(arr: Array, size: int) -> Union[int, float]:
+    '''
+    Return the sum of the first `size` elements (0 if `size` is 0).
+
+    Warning:
+        With NumPy, integers are summed with the precision of the array's type, and can overflow.
+    '''
+
+    values = _as_numpy(arr, size)
+    if values is not None:
+        return values.sum().item()
+    return builtins.sum(arr[0:size])
+
+
+def argmin(arr: Array, size: int) -> int:
+    '''
+    Return the index of the first occurrence of the smallest of the first `size` elements.
+
+    Error Handling:
+        Raises a ValueError if `size` is 0.
+    '''
+
+    values = _as_numpy(arr, size)
+    if values is not None:
+        return int(values.argmin())
+    values = arr[0:size]
+    return values.index(builtins.min(values))
+
+
+def argmax(arr: Array, size: int) -> int:
+    '''
+    Return the index of the first occurrence of the largest of the first `size` elements.
+
+    Error Handling:
+        Raises a ValueError if `size` is 0.
+    '''
+
+    values = _as_numpy(arr, size)
+    if values is not None:
+        return int(values.argmax())
+    values = arr[0:size]
+    return values.index(builtins.max(values))
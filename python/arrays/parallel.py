@@ -0,0 +1,105 @@
+"""Module providing parallel traversal of the elements of a `core.Array`, over a pool of processes."""
+from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, List, Optional
+from arrays.core import Array
+
+
+def _traverse_chunk(name: str, typecode: str, start: int, end: int, callback: Callable[..., Any]) -> List[Any]:
+    '''
+    Apply a callback to a range of elements stored in a shared memory block.
+    This function runs in the worker processes.
+
+    Parameters:
+        name (str): The name of the shared memory block.
+        typecode (str): The typecode of the elements in the block.
+        start (int): The index of the first element in the range.
+        end (int): The index after the last element in the range.
+        callback (Callable): The function to apply to each element.
+
+    Returns:
+        List[Any]: The results of the callback, in the same order as the elements.
+    '''
+
+    block = shared_memory.SharedMemory(name)
+    try:
+        view = block.buf.cast(typecode)
+        values = view[start:end].tolist()
+        view.release()
+    finally:
+        block.close()
+    return [callback(value) for value in values]
+
+
+def parallel_traverse(arr: Array, size: int, callback: Callable[..., Any],
+                      workers: Optional[int] = None, chunk_size: Optional[int] = None) -> List[Any]:
+    '''
+    Apply a callback to each of the first `size` elements of an array, in parallel.
+
+    Parameters:
+        arr (Array): The array to traverse.
+        size (int): The number of elements to traverse, starting from index 0.
+        callback (Callable): The function to apply to each element. It must be picklable:
+                             a function defined at the top level of a module, not a lambda.
+        workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        chunk_size (int, optional): The number of elements handled by each task. Defaults to
+                                    splitting the elements evenly between the workers.
+
+    Returns:
+        List[Any]: The results of the callback, in the same order as the elements.
+
+    Functionality:
+        Copies the elements, with a single bulk copy, into a shared memory block (unless the array
+        is already shared, in which case its own block is used), then splits them into chunks and
+        hands the chunks to a pool of processes: each task only receives the name of the block and
+        the bounds of its chunk, and reads the elements directly from shared memory, so the data
+        itself is never pickled. The results are gathered in order.
+
+    Error Handling:
+        Raises a ValueError if `workers` or `chunk_size` are not positive, or for arrays with typecode 'u'.
+    '''
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError(f'Invalid number of workers (must be positive): {workers}')
+    if chunk_size is None:
+        chunk_size = max(1, -(-size // workers))
+    if chunk_size <= 0:
+        raise ValueError(f'Invalid chunk size (must be positive): {chunk_size}')
+    typecode = arr.typecode()
+    if typecode == 'u':
+        raise ValueError("Typecode 'u' is not supported for parallel traversal")
+    if size == 0:
+        return []
+
+    if arr.is_shared():
+        return _run_chunks(arr.name(), typecode, size, callback, workers, chunk_size)
+    with arr.as_memoryview() as source:
+        nbytes = size * source.itemsize
+        block = shared_memory.SharedMemory(create=True, size=nbytes)
+        block.buf[:nbytes] = source[:size].cast('B')
+    try:
+        return _run_chunks(block.name, typecode, size, callback, workers, chunk_size)
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _run_chunks(name: str, typecode: str, size: int, callback: Callable[..., Any],
+                workers: int, chunk_size: int) -> List[Any]:
+    '''
+    Traverse the first `size` elements of a shared memory block over a pool of processes,
+    one chunk per task, and gather the results in order.
+    '''
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_traverse_chunk, name, typecode, start,
+                                   min(start + chunk_size, size), callback)
+                   for start in range(0, size, chunk_size)]
+        results = []
+        for future in futures:
+            results.extend(future.result())
+    return results
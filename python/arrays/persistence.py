@@ -0,0 +1,278 @@
+"""Module providing a binary format to save the content of a `core.Array` and load it back.
+
+A file starts with a fixed-size header (a magic string, the format version, flags, the typecode,
+the number of elements and the capacity), followed by the raw buffer of the array: `capacity`
+elements, of which only the first `size` are meaningful (the others are zeros). Loading a file
+doesn't parse its elements: they are either read with a single bulk copy, or mapped in memory.
+
+The same format is used by the file-backed containers: `create` makes a new file, mapped
+write-through after its header, `write_header` records the size of the container when it's
+flushed, and `open` maps the file again.
+"""
+from __future__ import annotations
+import array
+import os
+import stat
+import struct
+import tempfile
+from typing import List, NamedTuple, Union
+from arrays.core import Array
+
+MAGIC = b'PYDA'
+VERSION = 1
+# Flags
+SORTED = 1
+
+# Magic, version, flags, typecode, padding, size, capacity: the payload starts 8-byte aligned
+HEADER = struct.Struct('<4sBBcxQQ')
+
+
+class Header(NamedTuple):
+    '''The metadata stored at the beginning of a saved array.'''
+    typecode: str
+    size: int
+    capacity: int
+    sorted: bool
+
+
+def _pack(header: Header) -> bytes:
+    '''
+    Build the binary representation of a header.
+    '''
+
+    return HEADER.pack(MAGIC, VERSION, SORTED if header.sorted else 0, header.typecode.encode('ascii'),
+                       header.size, header.capacity)
+
+
+def _chunks(values: Union[Array, array.array], size: int, capacity: int, is_sorted: bool) -> List[bytes]:
+    '''
+    Build the pieces of the binary representation of an array, without copying its elements.
+
+    Parameters:
+        values (Union[Array, array.array]): The array holding the elements, in its first `size` slots.
+        size (int): The number of elements to save.
+        capacity (int): The number of slots to reserve when the array is loaded.
+        is_sorted (bool): Whether the elements are sorted.
+
+    Returns:
+        List[bytes]: The header, a view on the elements, and the zero padding up to `capacity`.
+
+    Error Handling:
+        Raises a ValueError if `size` is larger than `capacity`, or than the number of elements available.
+    '''
+
+    view = values.as_memoryview() if isinstance(values, Array) else memoryview(values)
+    if size < 0 or size > capacity or size > len(view):
+        raise ValueError(f'Invalid size {size} for capacity {capacity}')
+    typecode = values.typecode() if isinstance(values, Array) else values.typecode
+    header = _pack(Header(typecode, size, capacity, is_sorted))
+    return [header, view[:size].cast('B'), bytes((capacity - size) * view.itemsize)]
+
+
+def to_bytes(values: Union[Array, array.array], size: int, capacity: int, is_sorted: bool = False) -> bytes:
+    '''
+    Serialize the first `size` elements of an array.
+
+    Parameters:
+        values (Union[Array, array.array]): The array holding the elements, in its first `size` slots.
+        size (int): The number of elements to save.
+        capacity (int): The number of slots to reserve when the array is loaded.
+        is_sorted (bool, optional): Whether the elements are sorted. Defaults to False.
+
+    Returns:
+        bytes: The header followed by the raw buffer.
+    '''
+
+    return b''.join(_chunks(values, size, capacity, is_sorted))
+
+
+def save(path: str, values: Union[Array, array.array], size: int, capacity: int, is_sorted: bool = False) -> None:
+    '''
+    Save the first `size` elements of an array to a file.
+
+    Parameters:
+        path (str): The file to write.
+        values (Union[Array, array.array]): The array holding the elements, in its first `size` slots.
+        size (int): The number of elements to save.
+        capacity (int): The number of slots to reserve when the array is loaded.
+        is_sorted (bool, optional): Whether the elements are sorted. Defaults to False.
+
+    Functionality:
+        The buffer is written directly to a new, uniquely named temporary file in the same directory,
+        which then replaces `path`: an existing file is never left half-written, arrays still mapped
+        on it keep the old content, and concurrent saves don't write to the same temporary file.
+        The temporary file (created private to the user) is given the permissions of the file it
+        replaces, or the default permissions of a new file, before replacing it.
+        If writing fails, the temporary file is removed.
+    '''
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                     prefix=f'{os.path.basename(path)}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in _chunks(values, size, capacity, is_sorted):
+                f.write(chunk)
+        os.chmod(temp_path, _file_mode(path))
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _file_mode(path: str) -> int:
+    '''
+    Return the permissions of an existing file, or those `open` would give to a new file at `path`.
+    '''
+
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        # The umask can only be read by setting it: restore it right away
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def parse_header(data: bytes) -> Header:
+    '''
+    Parse and validate the header at the beginning of a binary representation.
+
+    Parameters:
+        data (bytes): At least the first `HEADER.size` bytes of the representation.
+
+    Returns:
+        Header: The typecode, size, capacity and sorted flag of the array.
+
+    Error Handling:
+        Raises a ValueError if the data doesn't start with a valid header.
+    '''
+
+    if len(data) < HEADER.size:
+        raise ValueError('Truncated array header')
+    magic, version, flags, typecode, size, capacity = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('Not a saved array, or unsupported format version')
+    if capacity <= 0 or size > capacity:
+        raise ValueError(f'Invalid size {size} for capacity {capacity}')
+    return Header(typecode.decode('ascii'), size, capacity, bool(flags & SORTED))
+
+
+def _check_payload(header: Header, nbytes: int) -> None:
+    '''
+    Check that the payload following a header has the expected length.
+    '''
+
+    expected = header.capacity * array.array(header.typecode).itemsize
+    if nbytes != expected:
+        raise ValueError(f'Invalid payload size: {nbytes} bytes instead of {expected}')
+
+
+def from_bytes(data: bytes) -> tuple[Header, Array]:
+    '''
+    Deserialize an array.
+
+    Parameters:
+        data (bytes): The output of `to_bytes`.
+
+    Returns:
+        tuple[Header, Array]: The header, and a new in-memory array with `capacity` elements.
+    '''
+
+    header = parse_header(data)
+    _check_payload(header, len(data) - HEADER.size)
+    arr = Array(header.capacity, header.typecode)
+    with arr.as_memoryview() as view:
+        view.cast('B')[:] = memoryview(data)[HEADER.size:]
+    return header, arr
+
+
+def load(path: str, mapped: bool = False) -> tuple[Header, Array]:
+    '''
+    Load an array saved to a file.
+
+    Parameters:
+        path (str): The file to read.
+        mapped (bool, optional): If True, the payload is mapped in memory, copy-on-write, rather than
+                                 read: loading takes constant time, elements are paged in when they're
+                                 first accessed, and changes are never written back to the file.
+                                 Defaults to False, to read the whole payload with a single bulk copy.
+
+    Returns:
+        tuple[Header, Array]: The header, and a new array with `capacity` elements.
+    '''
+
+    with open(path, 'rb') as f:
+        header = parse_header(f.read(HEADER.size))
+        _check_payload(header, os.fstat(f.fileno()).st_size - HEADER.size)
+        if mapped:
+            return header, Array.open(path, header.typecode, HEADER.size, copy_on_write=True)
+        arr = Array(header.capacity, header.typecode)
+        with arr.as_memoryview() as view:
+            f.readinto(view.cast('B'))
+    return header, arr
+
+
+def create(path: str, typecode: str, capacity: int, is_sorted: bool = False) -> Array:
+    '''
+    Create a new file holding an empty array, and map it in memory.
+
+    Parameters:
+        path (str): The file to create. It must not exist.
+        typecode (str): The typecode of the array.
+        capacity (int): The number of elements the file can hold.
+        is_sorted (bool, optional): The sorted flag to write in the header. Defaults to False.
+
+    Returns:
+        Array: A new array with `capacity` zeroed elements, mapped write-through on the file after its
+               header. The header records a size of 0, until it's updated with `write_header`.
+
+    Error Handling:
+        Raises a FileExistsError if the file already exists: its content is never overwritten.
+        Raises a ValueError if the capacity is not positive, or the typecode is 'u'.
+    '''
+
+    if capacity <= 0:
+        raise ValueError(f'Invalid array size (must be positive): {capacity}')
+    if typecode == 'u':
+        raise ValueError("Typecode 'u' is not supported for file-backed arrays")
+    with open(path, 'xb') as f:
+        f.write(_pack(Header(typecode, 0, capacity, is_sorted)))
+        f.truncate(HEADER.size + capacity * array.array(typecode).itemsize)
+    return Array.open(path, typecode, HEADER.size)
+
+
+def write_header(path: str, header: Header) -> None:
+    '''
+    Overwrite the header of a file created with `create`, leaving its elements untouched.
+
+    Parameters:
+        path (str): The file backing the array.
+        header (Header): The new metadata of the array.
+    '''
+
+    with open(path, 'r+b') as f:
+        f.write(_pack(header))
+
+
+def open_mapped(path: str) -> tuple[Header, Array]:
+    '''
+    Open a file created with `create` (or `save`), mapping its payload write-through.
+
+    Parameters:
+        path (str): The file to open.
+
+    Returns:
+        tuple[Header, Array]: The header, and a new array mapped on the file: changes to the array are
+                              written back to the file. Since the file is resized together with the array,
+                              but the header only when it's written, the capacity is taken from the size of
+                              the file (and the size capped to it).
+
+    Error Handling:
+        Raises a ValueError if the file doesn't start with a valid header, or its payload is not
+        a whole number of elements.
+    '''
+
+    with open(path, 'rb') as f:
+        header = parse_header(f.read(HEADER.size))
+    arr = Array.open(path, header.typecode, HEADER.size)
+    return Header(header.typecode, min(header.size, len(arr)), len(arr), header.sorted), arr
@@ -1,7 +1,14 @@
+from __future__ import annotations
+import array
 import arrays.core as core
-from typing import Union
-
-class SortedArray:
+import arrays.kernels as kernels
+import arrays.persistence as persistence
+from arrays.bitmap import Bitmap
+from arrays.container import ArrayContainer
+from arrays.frozen_sorted_array import FrozenSortedArray
+from typing import Iterable, Iterator, Optional, Union
+
+class SortedArray(ArrayContainer):
     '''Return a new sorted array whose items are restricted by typecode, and
        that can contain at most `max_size` elements.
        
@@ -25,16 +32,40 @@ class SortedArray:
            'f'         floating point     4
            'd'         floating point     8
 
+       With lazy deletion, `delete` just sets a bit in a bitmap of tombstones, instead of shifting
+       all the elements after the deleted one. Tombstones keep their values, so the array stays
+       sorted and binary search works unchanged; searches and iteration simply skip them, and
+       `insert` reuses the slot of the closest tombstone, only shifting the elements in between.
+       When the tombstones exceed `max_dead_ratio` times the number of slots used, the array is
+       compacted in a single pass, making the cost of deleting an element O(1) amortized (plus
+       the binary search). Indices are always those of the live elements, as if tombstones
+       weren't there.
+
         Parameters:
             max_size (int): The maximum number of elements the array can hold.
             typecode (str, optional): The typecode of the array. Defaults to 'l' for int.
+            path (str, optional): A new file to store the elements in, through a memory-mapped `core.Array`.
+                                  The file must not exist: use `open` to reopen it. Defaults to None,
+                                  for an in-memory array.
+            lazy_delete (bool, optional): If True, deleted elements are only marked as deleted (with a
+                                          tombstone), and removed in batches. Defaults to False.
+            max_dead_ratio (float, optional): With lazy deletion, the fraction of tombstones in the
+                                              array that triggers compaction. Defaults to 0.25.
 
        '''
-    def __init__(self, max_size: int, typecode: str = 'l'):
-        self._array = core.Array(max_size, typecode)
+    def __init__(self, max_size: int, typecode: str = 'l', path: Optional[str] = None,
+                 lazy_delete: bool = False, max_dead_ratio: float = 0.25):
+        if not 0 < max_dead_ratio <= 1:
+            raise ValueError(f'Invalid dead ratio (must be in (0, 1]): {max_dead_ratio}')
+        self._array = self._new_storage(max_size, typecode, path, is_sorted=True)
+        self._path = path
         self._max_size = max_size
-        # The actual number of elements stored in the array
+        # The number of slots used in the array, including tombstones
         self._size = 0
+        # The number of deleted elements still in the array, marked in the tombstones bitmap
+        self._dead = 0
+        self._tombstones = Bitmap(max_size) if lazy_delete else None
+        self._max_dead_ratio = max_dead_ratio
 
     
     def __len__(self) -> int:
@@ -48,7 +79,7 @@ class SortedArray:
             int: The number of elements in the array.
         '''
 
-        return self._size
+        return self._size - self._dead
 
 
     def __getitem__(self, index) -> Union[int, float]:
@@ -62,9 +93,9 @@ class SortedArray:
             Union[int, float]: The value at the given index.
         '''
 
-        if index < 0 or index >= self._size:
+        if index < 0 or index >= len(self):
             raise IndexError(f'Index out of bound: {index}')
-        return self._array[index]
+        return self._array[self._physical_index(index)]
 
 
     def __repr__(self) -> str:
@@ -78,7 +109,12 @@ class SortedArray:
             str: The string representation of the array.
         '''
 
-        return f'SortedArray({repr(self._array._array[:self._size])})'
+        if self._dead:
+            values = self._array[0:0]
+            values.extend(self)
+        else:
+            values = self._array[:self._size]
+        return f'SortedArray({repr(values)})'
     
 
     def __iter__(self):
@@ -95,7 +131,274 @@ class SortedArray:
         '''
 
         for i in range(self._size):
-            yield self._array[i]
+            if not self._is_dead(i):
+                yield self._array[i]
+
+
+    def _is_dead(self, index: int) -> bool:
+        '''
+        Check if the slot at the given (physical) index holds a deleted element.
+
+        Parameters:
+            index (int): The index of a slot in the underlying static array.
+
+        Returns:
+            bool: True if the slot is marked with a tombstone, False otherwise.
+        '''
+
+        return self._dead > 0 and self._tombstones[index]
+
+
+    def _logical_index(self, index: int) -> int:
+        '''
+        Convert the index of a slot in the underlying static array to the index of
+        the element, skipping tombstones.
+
+        Parameters:
+            index (int): The index of a slot in the underlying static array.
+
+        Returns:
+            int: The number of live elements before that slot.
+        '''
+
+        return index - self._tombstones.count(index) if self._dead else index
+
+
+    def _physical_index(self, index: int) -> int:
+        '''
+        Convert the index of an element to the index of its slot in the underlying static array.
+
+        Parameters:
+            index (int): The index of a live element.
+
+        Returns:
+            int: The index of the slot holding the element.
+
+        Functionality:
+            Without tombstones, the two indices are the same. Otherwise, the slot is the `index`-th
+            cleared bit of the tombstones bitmap, found in O(log n) with `Bitmap.select_clear`.
+        '''
+
+        if not self._dead:
+            return index
+        return self._tombstones.select_clear(index)
+
+
+    def compact(self) -> None:
+        '''
+        Remove all the tombstones from the array.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        Functionality:
+            Moves all the live elements to the beginning of the array, in a single pass,
+            and clears the tombstones. Does nothing if there is no tombstone.
+        '''
+
+        if not self._dead:
+            return
+        live = list(self)
+        self._array[0:len(live)] = live
+        self._size = len(live)
+        self._dead = 0
+        self._tombstones.clear_all()
+
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[Union[int, float]], typecode: str = 'l',
+                      max_size: Optional[int] = None) -> SortedArray:
+        '''
+        Create a new sorted array holding the given values.
+
+        Parameters:
+            values (Iterable): The values to store in the array, in any order.
+            typecode (str, optional): The typecode of the array. Defaults to 'l' for int.
+            max_size (int, optional): The maximum number of elements the array can hold.
+                                      Defaults to the number of values (or 1, if there are none).
+
+        Returns:
+            SortedArray: A new sorted array with all the values.
+
+        Functionality:
+            Sorts the values once, in O(n log n), and writes them into the underlying
+            static array with a single bulk copy, instead of inserting them one by one.
+
+        Error Handling:
+            Raises a ValueError if `max_size` is smaller than the number of values.
+        '''
+
+        sorted_values = sorted(values)
+        if max_size is None:
+            max_size = max(1, len(sorted_values))
+        elif max_size < len(sorted_values):
+            raise ValueError(f'Too many values ({len(sorted_values)}) for maximum size {max_size}')
+        result = cls(max_size, typecode)
+        result._array[0:len(sorted_values)] = sorted_values
+        result._size = len(sorted_values)
+        return result
+
+
+    def freeze(self) -> FrozenSortedArray:
+        '''
+        Create a read-only snapshot of the sorted array, optimized for searching.
+
+        Parameters:
+            None
+
+        Returns:
+            FrozenSortedArray: A new array with the same values, stored in Eytzinger order.
+                               Later changes to this array are not reflected in the snapshot.
+        '''
+
+        return FrozenSortedArray(self, self._array.typecode())
+
+
+    def to_bytes(self) -> bytes:
+        '''
+        Serialize the array.
+
+        Parameters:
+            None
+
+        Returns:
+            bytes: A header (typecode, size, capacity, sorted flag) followed by the raw buffer
+                   of the elements, see `persistence`.
+        '''
+
+        return persistence.to_bytes(self._live_values(), len(self), self._max_size, is_sorted=True)
+
+
+    def save(self, path: str) -> None:
+        '''
+        Save the array to a file, in the format of `to_bytes`.
+
+        Parameters:
+            path (str): The file to write. It's replaced atomically if it already exists.
+        '''
+
+        persistence.save(path, self._live_values(), len(self), self._max_size, is_sorted=True)
+
+
+    @classmethod
+    def from_bytes(cls, data: bytes, lazy_delete: bool = False, max_dead_ratio: float = 0.25) -> SortedArray:
+        '''
+        Deserialize an array serialized with `to_bytes`.
+
+        Parameters:
+            data (bytes): The serialized array.
+            lazy_delete (bool, optional): Whether to use lazy deletion, see `SortedArray`. Defaults to False.
+            max_dead_ratio (float, optional): The fraction of tombstones that triggers compaction. Defaults to 0.25.
+
+        Returns:
+            SortedArray: A new in-memory array, with the same elements and capacity.
+
+        Error Handling:
+            Raises a ValueError if the data is not a valid serialized array, or is not sorted.
+        '''
+
+        return cls._from_storage(*persistence.from_bytes(data), lazy_delete=lazy_delete,
+                                 max_dead_ratio=max_dead_ratio)
+
+
+    @classmethod
+    def load(cls, path: str, mapped: bool = False, lazy_delete: bool = False,
+             max_dead_ratio: float = 0.25) -> SortedArray:
+        '''
+        Load an array saved with `save`.
+
+        Parameters:
+            path (str): The file to read.
+            mapped (bool, optional): If True, the elements are mapped from the file, copy-on-write,
+                                     instead of being read: loading takes constant time, and the
+                                     file is never modified. Defaults to False.
+            lazy_delete (bool, optional): Whether to use lazy deletion, see `SortedArray`. Defaults to False.
+            max_dead_ratio (float, optional): The fraction of tombstones that triggers compaction. Defaults to 0.25.
+
+        Returns:
+            SortedArray: A new array, with the same elements and capacity.
+
+        Error Handling:
+            Raises a ValueError if the file is not a valid saved array, or is not sorted.
+        '''
+
+        return cls._from_storage(*persistence.load(path, mapped), lazy_delete=lazy_delete,
+                                 max_dead_ratio=max_dead_ratio)
+
+
+
+    @classmethod
+    def open(cls, path: str, lazy_delete: bool = False,
+             max_dead_ratio: float = 0.25) -> SortedArray:
+        '''
+        Reopen an array created with a `path` (or saved with `save`), without copying its elements.
+
+        Parameters:
+            path (str): The file backing the array.
+            lazy_delete (bool, optional): Whether to use lazy deletion, see `SortedArray`. Defaults to False.
+            max_dead_ratio (float, optional): The fraction of tombstones that triggers compaction. Defaults to 0.25.
+
+        Returns:
+            SortedArray: The array stored in the file, mapped write-through: like the array that created
+                         the file, it must be closed (or flushed) for the file to record its new size.
+
+        Error Handling:
+            Raises a ValueError if the file is not a valid saved array, or is not sorted.
+        '''
+
+        return cls._open(path, lazy_delete=lazy_delete, max_dead_ratio=max_dead_ratio)
+
+
+    def flush(self) -> None:
+        '''
+        Write the content of a file-backed array to disk, see `ArrayContainer`.
+
+        Functionality:
+            Compacts the array first, so that the elements in the file are all live.
+        '''
+
+        if self._path is not None:
+            self.compact()
+        super().flush()
+
+
+    def _header(self) -> persistence.Header:
+        '''
+        Describe the content of the array, see `ArrayContainer`. The array must have no tombstones.
+        '''
+
+        return persistence.Header(self._array.typecode(), self._size, self._max_size, True)
+
+
+    def _adopt(self, header: persistence.Header, storage: core.Array) -> None:
+        '''
+        Use a loaded `core.Array` as storage, see `ArrayContainer`.
+
+        Error Handling:
+            Raises a ValueError if the loaded array is not sorted.
+        '''
+
+        if not header.sorted:
+            raise ValueError('The saved array is not sorted')
+        self._array = storage
+        self._max_size = header.capacity
+        self._size = header.size
+        if self._tombstones is not None:
+            self._tombstones = Bitmap(header.capacity)
+
+
+    def _live_values(self) -> Union[core.Array, array.array]:
+        '''
+        Return an array whose first `len(self)` elements are the live values, in order:
+        the underlying array itself, unless there are tombstones.
+        '''
+
+        if not self._dead:
+            return self._array
+        return array.array(self._array.typecode(), self)
 
 
     def max_size(self) -> int:
@@ -113,12 +416,64 @@ class SortedArray:
         return self._max_size
 
 
-    def insert(self, value: Union[int, float]) -> None:
+    def _bisect_left(self, target: Union[int, float]) -> int:
+        '''
+        Find the leftmost position where a target value could be inserted keeping the array sorted.
+
+        Parameters:
+            target (any): The value to locate.
+
+        Returns:
+            int: The index of the first element greater than or equal to the target,
+                 or the size of the array if there is no such element.
+
+        Functionality:
+            Performs a binary search, like `binary_search`, but instead of stopping when it finds
+            the target, it keeps narrowing the range to the left until it's empty.
+        '''
+
+        left = 0
+        right = self._size
+        while left < right:
+            mid_index = (left + right) // 2
+            if self._array[mid_index] < target:
+                left = mid_index + 1
+            else:
+                right = mid_index
+        return left
+
+
+    def _bisect_right(self, target: Union[int, float]) -> int:
+        '''
+        Find the rightmost position where a target value could be inserted keeping the array sorted.
+
+        Parameters:
+            target (any): The value to locate.
+
+        Returns:
+            int: The index of the first element strictly greater than the target,
+                 or the size of the array if there is no such element.
+        '''
+
+        left = 0
+        right = self._size
+        while left < right:
+            mid_index = (left + right) // 2
+            if self._array[mid_index] <= target:
+                left = mid_index + 1
+            else:
+                right = mid_index
+        return left
+
+
+    def insert(self, value: Union[int, float], side: str = 'right') -> None:
         '''
         Insert a new value into the sorted array.
 
         Parameters:
             value (any): The value to insert into the sorted array.
+            side (str, optional): Where to insert the value with respect to elements equal to it:
+                                  'left' puts it before them, 'right' after them. Defaults to 'right'.
 
         Returns:
             None
@@ -126,25 +481,86 @@ class SortedArray:
         Functionality:
             Inserts the given value into the sorted array while maintaining the sorted order.
             If the array is already full, raises a ValueError.
-            Otherwise, shifts elements to the right to make room for the new value and inserts 
-            it in the correct position to keep the array sorted.
+            Otherwise, finds the right position for the new value with a binary search,
+            then shifts all the elements after that position one place to the right, with
+            a single bulk move, to make room for the new value.
+            With lazy deletion, if there are tombstones, the slot of the closest one is reused
+            instead: only the elements between that slot and the new value's position are
+            shifted, towards the slot, and its tombstone is cleared in O(log n).
         '''
 
-        if self._size >= self._max_size:
+        if side not in ('left', 'right'):
+            raise ValueError(f"Invalid side (must be 'left' or 'right'): {side}")
+        if not self._dead and self._size >= self._max_size:
             raise ValueError(f'The array is already full, maximum size: {self._max_size}')
-        for i in range(self._size, 0, -1):
-            if self._array[i-1] <= value:
-                # Found the right place for the element
-                self._array[i] = value
-                self._size += 1
-                return
-            else:
-                self._array[i] = self._array[i-1]
-        # If it gets here, it means we need to add the new value as the first entry
-        self._array[0] = value
+        index = self._bisect_left(value) if side == 'left' else self._bisect_right(value)
+        if self._dead:
+            self._insert_into_tombstone(index, value)
+            return
+        # Writing the value in the first free slot checks its type before anything is moved
+        self._array[self._size] = value
+        self._array.copy_from(self._array, index, index + 1, self._size - index)
+        self._array[index] = value
         self._size += 1
+
+
+    def _insert_into_tombstone(self, index: int, value: Union[int, float]) -> None:
+        '''
+        Insert a value before the slot at `index`, reusing the slot of the closest tombstone
+        after it (or, if there is none, before it). There must be at least one tombstone.
+
+        Parameters:
+            index (int): The position of the new value in the underlying static array.
+            value (any): The value to insert.
+        '''
+
+        dead_before = self._tombstones.count(index)
+        if dead_before < self._dead:
+            # Shift the slots [index, slot) one place right, into the tombstone
+            slot = self._tombstones.select_set(dead_before)
+            # Writing the value in the dead slot checks its type before anything is moved
+            self._array[slot] = value
+            self._array.copy_from(self._array, index, index + 1, slot - index)
+        else:
+            # Shift the slots (slot, index) one place left, into the tombstone
+            slot = self._tombstones.select_set(dead_before - 1)
+            self._array[slot] = value
+            self._array.copy_from(self._array, slot + 1, slot, index - slot - 1)
+            index -= 1
+        self._array[index] = value
+        self._tombstones.clear(slot)
+        self._dead -= 1
         
     
+    def merge(self, other: SortedArray) -> None:
+        '''
+        Insert all the values from another sorted array into this one.
+
+        Parameters:
+            other (SortedArray): The sorted array whose values are added. It is not modified.
+
+        Returns:
+            None
+
+        Functionality:
+            Concatenates the two sorted sequences and sorts the result: Timsort recognizes
+            the two sorted runs and merges them in linear time. The merged values are then
+            written into the underlying static array with a single bulk copy.
+
+        Error Handling:
+            Raises a ValueError if the merged values don't fit in the array.
+        '''
+
+        new_size = len(self) + len(other)
+        if new_size > self._max_size:
+            raise ValueError(f'Not enough room to merge {len(other)} values, maximum size: {self._max_size}')
+        self.compact()
+        merged = self._array[0:self._size].tolist() + list(other)
+        merged.sort()
+        self._array[0:new_size] = merged
+        self._size = new_size
+
+
     def linear_search(self, target: Union[int, float]) -> Union[int, None]:
         '''
         Search for a target value in the sorted array using a naive linear search.
@@ -157,19 +573,18 @@ class SortedArray:
 
         Functionality:
             Performs a linear search over the values in the sorted array.
-            Since the array is sorted, we can stop searching once we pass the point 
-            where the target value would be located.
+            The scan doesn't stop early once it passes the point where the target value would be:
+            the whole prefix of stored elements is scanned by `kernels.find`, on the underlying
+            buffer, which is faster than checking each element with Python code.
             Returns the index of the target value if found, otherwise returns None.
         '''
 
-        for i in range(self._size):
-            if self._array[i] == target:
-                return i
-            elif self._array[i] > target:
-                # The array is sorted, we can't find the target in the rest of the array
-                return None
-        # Element not found, reached the end of the array
-        return None
+        if self._dead:
+            for index in kernels.find_all(self._array, self._size, target):
+                if not self._is_dead(index):
+                    return self._logical_index(index)
+            return None
+        return kernels.find(self._array, self._size, target)
 
 
     def binary_search(self, target: Union[int, float]) -> Union[int, None]:
@@ -189,8 +604,12 @@ class SortedArray:
             Otherwise, recurses on either the left or right half of the array depending on if the 
             midpoint value is greater than or less than the target.
             Returns the index if found, otherwise returns None if the target is not found.
+            If there are tombstones, looks for the first live element equal to the target instead.
         '''
 
+        if self._dead:
+            index = self._find_live(target)
+            return self._logical_index(index) if index is not None else None
         left = 0
         right = self._size - 1
         while left <= right:
@@ -204,6 +623,193 @@ class SortedArray:
                 left = mid_index + 1
         return None
 
+
+    def _find_live(self, target: Union[int, float]) -> Optional[int]:
+        '''
+        Find the slot of the first live element equal to the target.
+
+        Parameters:
+            target (any): The value to search for.
+
+        Returns:
+            Optional[int]: The index of the slot in the underlying static array, or None if there is
+                           no live element equal to the target.
+        '''
+
+        index = self._live_at_or_after(self._bisect_left(target))
+        return index if index is not None and self._array[index] == target else None
+
+
+    def _live_at_or_after(self, index: int) -> Optional[int]:
+        '''
+        Find the first slot, starting from `index`, not marked with a tombstone.
+
+        Parameters:
+            index (int): The index of the slot to start from.
+
+        Returns:
+            Optional[int]: The index of the slot, or None if there are no live elements from `index` on.
+
+        Functionality:
+            Counts the live elements before `index` and selects the next one, with `_logical_index`
+            and `_physical_index`, in O(log n) whatever the number of tombstones.
+        '''
+
+        if index >= self._size:
+            return None
+        rank = self._logical_index(index)
+        return self._physical_index(rank) if rank < len(self) else None
+
+
+    def _live_at_or_before(self, index: int) -> Optional[int]:
+        '''
+        Find the last slot, up to `index`, not marked with a tombstone.
+
+        Parameters:
+            index (int): The index of the slot to start from, going backwards.
+
+        Returns:
+            Optional[int]: The index of the slot, or None if there are no live elements up to `index`.
+
+        Functionality:
+            Counts the live elements up to `index` and selects the last one, with `_logical_index`
+            and `_physical_index`, in O(log n) whatever the number of tombstones.
+        '''
+
+        if index < 0:
+            return None
+        rank = self._logical_index(index + 1)
+        return self._physical_index(rank - 1) if rank > 0 else None
+
+
+    def range(self, low: Union[int, float], high: Union[int, float]) -> Iterator[Union[int, float]]:
+        '''
+        Iterate over the values in the sorted array within a range.
+
+        Parameters:
+            low (any): The lower bound of the range (inclusive).
+            high (any): The upper bound of the range (exclusive).
+
+        Returns:
+            Iterator: A lazy iterator over the values `v` such that `low <= v < high`, in sorted order.
+
+        Functionality:
+            Locates both ends of the range with a binary search, so only the matching
+            values are visited. The bounds are computed when the iterator is created:
+            the array should not be modified while iterating.
+        '''
+
+        start = self._bisect_left(low)
+        end = max(start, self._bisect_left(high))
+        return (self._array[i] for i in range(start, end) if not self._is_dead(i))
+
+
+    def count_range(self, low: Union[int, float], high: Union[int, float]) -> int:
+        '''
+        Count the values in the sorted array within a range.
+
+        Parameters:
+            low (any): The lower bound of the range (inclusive).
+            high (any): The upper bound of the range (exclusive).
+
+        Returns:
+            int: The number of values `v` such that `low <= v < high`.
+        '''
+
+        return max(0, self._logical_index(self._bisect_left(high)) - self._logical_index(self._bisect_left(low)))
+
+
+    def rank(self, target: Union[int, float]) -> int:
+        '''
+        Return the rank of a value, the number of elements in the sorted array smaller than it.
+
+        Parameters:
+            target (any): The value to rank. It doesn't need to be in the array.
+
+        Returns:
+            int: The number of elements strictly smaller than the target.
+        '''
+
+        return self._logical_index(self._bisect_left(target))
+
+
+    def select(self, k: int) -> Union[int, float]:
+        '''
+        Return the k-th smallest value in the sorted array.
+
+        Parameters:
+            k (int): The rank of the value to return, starting from 0.
+
+        Returns:
+            Union[int, float]: The value with rank `k`.
+
+        Error Handling:
+            Raises an IndexError if `k` is not a valid index.
+        '''
+
+        return self[k]
+
+
+    def floor(self, target: Union[int, float]) -> Optional[Union[int, float]]:
+        '''
+        Return the largest value in the sorted array that is smaller than or equal to the target.
+
+        Parameters:
+            target (any): The value to compare to.
+
+        Returns:
+            Optional[Union[int, float]]: The largest element `v` such that `v <= target`, or None if there is none.
+        '''
+
+        index = self._live_at_or_before(self._bisect_right(target) - 1)
+        return self._array[index] if index is not None else None
+
+
+    def ceiling(self, target: Union[int, float]) -> Optional[Union[int, float]]:
+        '''
+        Return the smallest value in the sorted array that is larger than or equal to the target.
+
+        Parameters:
+            target (any): The value to compare to.
+
+        Returns:
+            Optional[Union[int, float]]: The smallest element `v` such that `v >= target`, or None if there is none.
+        '''
+
+        index = self._live_at_or_after(self._bisect_left(target))
+        return self._array[index] if index is not None else None
+
+
+    def predecessor(self, target: Union[int, float]) -> Optional[Union[int, float]]:
+        '''
+        Return the largest value in the sorted array that is strictly smaller than the target.
+
+        Parameters:
+            target (any): The value to compare to.
+
+        Returns:
+            Optional[Union[int, float]]: The largest element `v` such that `v < target`, or None if there is none.
+        '''
+
+        index = self._live_at_or_before(self._bisect_left(target) - 1)
+        return self._array[index] if index is not None else None
+
+
+    def successor(self, target: Union[int, float]) -> Optional[Union[int, float]]:
+        '''
+        Return the smallest value in the sorted array that is strictly larger than the target.
+
+        Parameters:
+            target (any): The value to compare to.
+
+        Returns:
+            Optional[Union[int, float]]: The smallest element `v` such that `v > target`, or None if there is none.
+        '''
+
+        index = self._live_at_or_after(self._bisect_right(target))
+        return self._array[index] if index is not None else None
+
+
     def delete(self, target: Union[int, float]) -> None:
         '''
         Delete a target value from the sorted array.
@@ -219,13 +825,25 @@ class SortedArray:
             If the target is not found, raises a ValueError.
             Otherwise, shifts all elements after the target to the left to fill in the gap.
             If it succeeds, it decrements the size of the array by 1.
+
+            With lazy deletion, instead, marks the first live element equal to the target
+            with a tombstone, and compacts the array if there are too many tombstones.
         '''
 
+        if self._tombstones is not None:
+            index = self._find_live(target)
+            if index is None:
+                raise ValueError(f'Unable to delete element {target}: the entry is not in the array')
+            self._tombstones.set(index)
+            self._dead += 1
+            if self._dead > self._size * self._max_dead_ratio:
+                self.compact()
+            return
+
         index = self.binary_search(target)
         if index is None:
             raise ValueError(f'Unable to delete element {target}: the entry is not in the array')
 
         # Must shift all the elements after the position of the target
-        for i in range(index, self._size - 1):
-            self._array[i] = self._array[i + 1]
+        self._array.copy_from(self._array, index + 1, index, self._size - index - 1)
         self._size -= 1
@@ -1,7 +1,15 @@
-from typing import Union
+from typing import Any, Callable, Dict, List, Optional, Set, Union
 from arrays.core import Array
+import arrays.kernels as kernels
+import arrays.persistence as persistence
+import arrays.parallel as parallel
+from arrays.container import ArrayContainer
 
-class UnsortedArray:
+# The key of all the NaN values in the index of the values: since NaN is not equal to itself,
+# each NaN read back from the array would otherwise be a new key, that can't be found again
+_NAN = float('nan')
+
+class UnsortedArray(ArrayContainer):
     '''Return a new unsorted array whose items are restricted by typecode, and
        that can contain at most `max_size` elements.
        
@@ -28,13 +36,25 @@ class UnsortedArray:
         Parameters:
             max_size (int): The maximum number of elements the array can hold.
             typecode (str, optional): The typecode of the array. Defaults to 'l' for int.
+            path (str, optional): A new file to store the elements in, through a memory-mapped `core.Array`.
+                                  The file must not exist: use `open` to reopen it. Defaults to None,
+                                  for an in-memory array.
+            index_values (bool, optional): If True, keeps an index from each value to the positions
+                                           where it's stored, so that `find` and `delete_value` take time
+                                           proportional to the number of occurrences of the value, instead
+                                           of the size of the array, at the cost of extra memory.
+                                           Defaults to False.
 
        '''
-    def __init__(self, max_size: int, typecode: str = 'l'):
-        self._array = Array(max_size, typecode)
+    def __init__(self, max_size: int, typecode: str = 'l', path: Optional[str] = None,
+                 index_values: bool = False):
+        self._array = self._new_storage(max_size, typecode, path)
+        self._path = path
         self._max_size = max_size
         # The actual number of elements stored in the array
         self._size = 0
+        # For each value stored, the set of indices where it's stored (only if indexing is enabled)
+        self._positions: Optional[Dict[Union[int, float], Set[int]]] = {} if index_values else None
 
 
     def __len__(self) -> int:
@@ -78,7 +98,7 @@ class UnsortedArray:
             str: The string representation of the array.
         '''
 
-        return f'UnsortedArray({repr(self._array._array[:self._size])})'
+        return f'UnsortedArray({repr(self._array[:self._size])})'
 
 
     def max_size(self) -> int:
@@ -108,15 +128,54 @@ class UnsortedArray:
             raise ValueError('The array is already full')
         else:
             self._array[self._size] = new_entry
+            if self._positions is not None:
+                # Index the value as stored, after conversion to the array's type
+                self._index(self._array[self._size], self._size)
             self._size += 1
 
 
+    def _index(self, value: Union[int, float], index: int) -> None:
+        '''
+        Add a position to the index of the values. Indexing must be enabled.
+
+        Parameters:
+            value (Union[int, float]): The value stored at the position. All NaN values share the same key.
+            index (int): The position to add.
+        '''
+
+        if value != value:
+            value = _NAN
+        self._positions.setdefault(value, set()).add(index)
+
+
+    def _unindex(self, value: Union[int, float], index: int) -> None:
+        '''
+        Remove a position from the index of the values, if indexing is enabled.
+
+        Parameters:
+            value (Union[int, float]): The value stored at the position. All NaN values share the same key.
+            index (int): The position to remove.
+        '''
+
+        if self._positions is not None:
+            if value != value:
+                value = _NAN
+            positions = self._positions[value]
+            positions.discard(index)
+            if not positions:
+                del self._positions[value]
+
+
     def delete(self, index) -> None:
         '''
         Delete an entry at the given index from an unsorted array.
 
         Parameters:
             index (int): The index of the entry to delete.
+
+        Functionality:
+            Since the order of the entries doesn't matter, the last entry is moved
+            into the position of the deleted one, in constant time.
         '''
 
         if self._size == 0:
@@ -124,10 +183,64 @@ class UnsortedArray:
         elif index < 0 or index >= self._size:
             raise ValueError(f'Index {index} out of range.') 
         else:
-            self._array[index] = self._array[self._size-1]
+            last = self._size - 1
+            if self._positions is not None:
+                self._unindex(self._array[index], index)
+                if index != last:
+                    self._unindex(self._array[last], last)
+                    self._index(self._array[last], index)
+            self._array[index] = self._array[last]
             self._size -= 1
 
 
+    def delete_value(self, target: Union[int, float]) -> None:
+        '''
+        Delete the first occurrence of a value from an unsorted array: the one reported by `find`.
+
+        Parameters:
+            target (Union[int, float]): The value to delete.
+
+        Functionality:
+            Finds the position of the value with `find`, then deletes the entry at that position,
+            in constant time.
+
+        Error Handling:
+            Raises a ValueError if the value is not in the array.
+        '''
+
+        index = self.find(target)
+        if index is None:
+            raise ValueError(f'Unable to delete element {target}: the entry is not in the array')
+        self.delete(index)
+
+
+    def compact(self, predicate: Callable[[Union[int, float]], bool]) -> int:
+        '''
+        Delete all the entries matching a predicate, in a single sweep.
+
+        Parameters:
+            predicate (Callable): A function taking an entry and returning True if it should be deleted.
+
+        Returns:
+            int: The number of entries deleted.
+
+        Functionality:
+            Writes the remaining entries back at the beginning of the array with a single bulk copy,
+            keeping their relative order, and rebuilds the index of the values, if enabled.
+        '''
+
+        kept = [value for value in self._array[0:self._size] if not predicate(value)]
+        deleted = self._size - len(kept)
+        if deleted > 0:
+            self._array[0:len(kept)] = kept
+            self._size = len(kept)
+            if self._positions is not None:
+                self._positions = {}
+                for index, value in enumerate(kept):
+                    self._index(value, index)
+        return deleted
+
+
     def find(self, target) -> int:
         '''
         Find the index of a target entry in an unsorted array.
@@ -137,13 +250,111 @@ class UnsortedArray:
 
         Returns:
             int: The index of the first occurrence of the target entry, if found, else None.
+
+        Functionality:
+            With indexing enabled, takes the smallest of the positions of the target in the index,
+            in time proportional to the number of occurrences of the target; otherwise, scans the array.
         '''
 
-        for index in range(0, self._size):
-            if self._array[index] == target:
-                return index
-        # Couldn't find the target
-        return None
+        if self._positions is not None:
+            positions = self._positions.get(target)
+            return min(positions) if positions else None
+        return kernels.find(self._array, self._size, target)
+
+
+    def find_all(self, target: Union[int, float]) -> List[int]:
+        '''
+        Find all the occurrences of a target value in the unsorted array.
+
+        Parameters:
+            target (Union[int, float]): The value to search for.
+
+        Returns:
+            List[int]: The indices of all the entries equal to the target, in increasing order.
+        '''
+
+        return kernels.find_all(self._array, self._size, target)
+
+
+    def count(self, target: Union[int, float]) -> int:
+        '''
+        Count the occurrences of a target value in the unsorted array.
+
+        Parameters:
+            target (Union[int, float]): The value to count.
+
+        Returns:
+            int: The number of entries equal to the target.
+        '''
+
+        return kernels.count(self._array, self._size, target)
+
+
+    def min(self) -> Union[int, float]:
+        '''
+        Return the smallest value in the unsorted array.
+
+        Returns:
+            Union[int, float]: The smallest value stored.
+
+        Error Handling:
+            Raises a ValueError if the array is empty.
+        '''
+
+        return kernels.min(self._array, self._size)
+
+
+    def max(self) -> Union[int, float]:
+        '''
+        Return the largest value in the unsorted array.
+
+        Returns:
+            Union[int, float]: The largest value stored.
+
+        Error Handling:
+            Raises a ValueError if the array is empty.
+        '''
+
+        return kernels.max(self._array, self._size)
+
+
+    def sum(self) -> Union[int, float]:
+        '''
+        Return the sum of the values in the unsorted array.
+
+        Returns:
+            Union[int, float]: The sum of all the values stored, or 0 if the array is empty.
+        '''
+
+        return kernels.sum(self._array, self._size)
+
+
+    def argmin(self) -> int:
+        '''
+        Return the index of the smallest value in the unsorted array.
+
+        Returns:
+            int: The index of the first occurrence of the smallest value.
+
+        Error Handling:
+            Raises a ValueError if the array is empty.
+        '''
+
+        return kernels.argmin(self._array, self._size)
+
+
+    def argmax(self) -> int:
+        '''
+        Return the index of the largest value in the unsorted array.
+
+        Returns:
+            int: The index of the first occurrence of the largest value.
+
+        Error Handling:
+            Raises a ValueError if the array is empty.
+        '''
+
+        return kernels.argmax(self._array, self._size)
 
     def traverse(self, callback):
         '''
@@ -155,3 +366,135 @@ class UnsortedArray:
 
         for index in range(self._size):
             callback(self._array[index])
+
+
+    def parallel_traverse(self, callback: Callable[..., Any], workers: Optional[int] = None,
+                          chunk_size: Optional[int] = None) -> List[Any]:
+        '''
+        Traverse an unsorted array in parallel, calling a callback function on each element.
+
+        Parameters:
+            callback (function): The function to call on each element. It must be picklable,
+                                 i.e. defined at the top level of a module.
+            workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+            chunk_size (int, optional): The number of elements handled by each task. Defaults to
+                                        splitting the elements evenly between the workers.
+
+        Returns:
+            List[Any]: The values returned by the callback, in the same order as the elements.
+
+        Functionality:
+            The elements are shared with a pool of worker processes through shared memory,
+            see `parallel.parallel_traverse`.
+        '''
+
+        return parallel.parallel_traverse(self._array, self._size, callback, workers, chunk_size)
+
+
+    def to_bytes(self) -> bytes:
+        '''
+        Serialize the array.
+
+        Parameters:
+            None
+
+        Returns:
+            bytes: A header (typecode, size, capacity) followed by the raw buffer
+                   of the elements, see `persistence`.
+        '''
+
+        return persistence.to_bytes(self._array, self._size, self._max_size)
+
+
+    def save(self, path: str) -> None:
+        '''
+        Save the array to a file, in the format of `to_bytes`.
+
+        Parameters:
+            path (str): The file to write. It's replaced atomically if it already exists.
+        '''
+
+        persistence.save(path, self._array, self._size, self._max_size)
+
+
+    @classmethod
+    def from_bytes(cls, data: bytes, index_values: bool = False) -> 'UnsortedArray':
+        '''
+        Deserialize an array serialized with `to_bytes`.
+
+        Parameters:
+            data (bytes): The serialized array.
+            index_values (bool, optional): Whether to index the values, see `UnsortedArray`. Defaults to False.
+
+        Returns:
+            UnsortedArray: A new in-memory array, with the same elements and capacity.
+
+        Error Handling:
+            Raises a ValueError if the data is not a valid serialized array.
+        '''
+
+        return cls._from_storage(*persistence.from_bytes(data), index_values=index_values)
+
+
+    @classmethod
+    def load(cls, path: str, mapped: bool = False, index_values: bool = False) -> 'UnsortedArray':
+        '''
+        Load an array saved with `save`.
+
+        Parameters:
+            path (str): The file to read.
+            mapped (bool, optional): If True, the elements are mapped from the file, copy-on-write,
+                                     instead of being read: loading takes constant time, and the
+                                     file is never modified. Defaults to False.
+            index_values (bool, optional): Whether to index the values, see `UnsortedArray`. Defaults to False.
+
+        Returns:
+            UnsortedArray: A new array, with the same elements and capacity.
+
+        Error Handling:
+            Raises a ValueError if the file is not a valid saved array.
+        '''
+
+        return cls._from_storage(*persistence.load(path, mapped), index_values=index_values)
+
+
+
+    @classmethod
+    def open(cls, path: str, index_values: bool = False) -> 'UnsortedArray':
+        '''
+        Reopen an array created with a `path` (or saved with `save`), without copying its elements.
+
+        Parameters:
+            path (str): The file backing the array.
+            index_values (bool, optional): Whether to index the values, see `UnsortedArray`. Defaults to False.
+
+        Returns:
+            UnsortedArray: The array stored in the file, mapped write-through: like the array that created
+                           the file, it must be closed (or flushed) for the file to record its new size.
+
+        Error Handling:
+            Raises a ValueError if the file is not a valid saved array.
+        '''
+
+        return cls._open(path, index_values=index_values)
+
+
+    def _header(self) -> persistence.Header:
+        '''
+        Describe the content of the array, see `ArrayContainer`.
+        '''
+
+        return persistence.Header(self._array.typecode(), self._size, self._max_size, False)
+
+
+    def _adopt(self, header: persistence.Header, storage: Array) -> None:
+        '''
+        Use a loaded `core.Array` as storage, see `ArrayContainer`, and index its values if requested.
+        '''
+
+        self._array = storage
+        self._max_size = header.capacity
+        self._size = header.size
+        if self._positions is not None:
+            for index, value in enumerate(storage[0:header.size]):
+                self._index(value, index)
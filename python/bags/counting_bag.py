@@ -0,0 +1,171 @@
+"""Module providing an implementation for bag that counts the occurrences of each value."""
+
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from queues.heap import Heap
+
+class CountingBag:
+    """ A class modeling the bag container as a multiset: each distinct value is stored once,
+        together with the number of times it was inserted.
+    """
+    def __init__(self) -> None:
+        """ Creates an empty bag.
+        """
+        self._counts: Dict[Any, int] = {}
+        self._size = 0
+
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate over the values in the bag.
+
+        Parameters:
+            None
+
+        Returns:
+            Iterator: An iterator over the values in the bag, each one repeated as many times
+                      as it was inserted.
+        """
+
+        for value, count in self._counts.items():
+            for _ in range(count):
+                yield value
+
+
+    def __len__(self) -> int:
+        """
+        Return the size of the bag, in constant time.
+
+        Parameters:
+            None
+
+        Returns:
+            int: The number of values stored in the bag, counting duplicates.
+        """
+        return self._size
+
+
+    def __contains__(self, value: Any) -> bool:
+        """
+        Check if a value is in the bag, in constant time.
+
+        Parameters:
+            value (Any): The value to search for.
+
+        Returns:
+            bool: True if the value was inserted at least once, False otherwise.
+        """
+        return value in self._counts
+
+
+    def __str__(self) -> str:
+        """
+        Return the string representation of the bag.
+
+        Parameters:
+            None
+
+        Returns:
+            str: The string representation of the bag.
+        """
+        return str(','.join(map(str, self)))
+
+
+    def __repr__(self) -> str:
+        """
+        Return the string (internal) representation of the bag.
+
+        Parameters:
+            None
+
+        Returns:
+            str: The string representation of the bag, with the count of each distinct value.
+        """
+        return f'CountingBag({repr(self._counts)})'
+
+
+    def is_empty(self) -> bool:
+        """
+        Check if the bag is empty.
+
+        Parameters:
+            None
+
+        Returns:
+            bool: True if the bag is empty, False otherwise.
+        """
+
+        return self._size == 0
+
+
+    def insert(self, value: Any, times: int = 1) -> None:
+        """
+        Insert a value into the bag, one or more times, in constant time.
+
+        Parameters:
+            value (Any): The value to insert into the bag. It must be hashable.
+            times (int, optional): The number of occurrences to add. Defaults to 1.
+
+        Returns:
+            None
+
+        Error Handling:
+            Raises a ValueError if `times` is not positive.
+        """
+        if times <= 0:
+            raise ValueError(f'Invalid number of occurrences (must be positive): {times}')
+        self._counts[value] = self._counts.get(value, 0) + times
+        self._size += times
+
+
+    def count(self, value: Any) -> int:
+        """
+        Return the number of occurrences of a value, in constant time.
+
+        Parameters:
+            value (Any): The value to count.
+
+        Returns:
+            int: The number of times the value was inserted, 0 if it's not in the bag.
+        """
+        return self._counts.get(value, 0)
+
+
+    def distinct(self) -> Set[Any]:
+        """
+        Return the distinct values in the bag.
+
+        Parameters:
+            None
+
+        Returns:
+            Set[Any]: The values inserted at least once, each one only once.
+        """
+        return set(self._counts)
+
+
+    def most_common(self, k: Optional[int] = None) -> List[Tuple[Any, int]]:
+        """
+        Return the most frequent values in the bag, with their counts.
+
+        Parameters:
+            k (int, optional): The number of values to return. Defaults to None, for all the distinct values.
+
+        Returns:
+            List[Tuple[Any, int]]: Up to `k` (value, count) pairs, from the most to the least frequent.
+                                   The order of values with the same count is not specified.
+
+        Functionality:
+            Builds a heap over the distinct values, in linear time, and extracts its top `k` elements:
+            with d distinct values, this takes O(d + k log d) time.
+
+        Error Handling:
+            Raises a ValueError if `k` is negative.
+        """
+        if k is None:
+            k = len(self._counts)
+        if k < 0:
+            raise ValueError(f'Invalid number of values (must be non-negative): {k}')
+        if k == 0 or not self._counts:
+            return []
+        heap = Heap(list(self._counts.items()), element_priority=lambda item: item[1])
+        return [heap.top() for _ in range(min(k, len(heap)))]
@@ -0,0 +1,204 @@
+"""Module providing the policies containers can use to protect the data they hand out on reads."""
+from __future__ import annotations
+import copy
+import operator
+from enum import Enum
+from typing import Any, Callable, Iterator
+
+# Types whose instances can't be modified: they are returned as they are by every policy
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, frozenset, range)
+
+# Methods of the built-in containers that modify them in place
+_MUTATING_METHODS = frozenset({
+    'append', 'extend', 'insert', 'pop', 'remove', 'clear', 'sort', 'reverse',
+    'update', 'setdefault', 'popitem', 'add', 'discard',
+    'intersection_update', 'difference_update', 'symmetric_difference_update',
+    # Special methods that modify their object, when they're accessed explicitly
+    '__iadd__', '__isub__', '__imul__', '__imatmul__', '__itruediv__', '__ifloordiv__', '__imod__',
+    '__ipow__', '__ilshift__', '__irshift__', '__iand__', '__ixor__', '__ior__',
+    '__setitem__', '__delitem__', '__setattr__', '__delattr__', '__setstate__', '__set__', '__delete__',
+})
+
+
+class CopyPolicy(Enum):
+    """
+    How a container returns the data it stores, on reads like `get` or `peek`.
+
+    - NONE: the stored object itself. Fastest, but callers can modify the container's data.
+    - SHALLOW: a shallow copy (`copy.copy`): the outer object is copied, the objects it holds are shared.
+    - DEEP: a deep copy (`copy.deepcopy`): fully safe, but allocates a copy of the whole object on every read.
+    - FROZEN: a read-only view of the stored object (see `ReadOnlyProxy`), that doesn't copy anything.
+    """
+
+    NONE = 'none'
+    SHALLOW = 'shallow'
+    DEEP = 'deep'
+    FROZEN = 'frozen'
+
+
+def _binary_operator(function: Callable[[Any, Any], Any], reflected: bool = False) -> Callable[..., Any]:
+    """
+    Build a method of `ReadOnlyProxy` applying a binary operator to the wrapped object.
+
+    Parameters:
+        function (Callable): The operator, from the `operator` module.
+        reflected (bool, optional): Whether the wrapped object is the right operand. Defaults to False.
+
+    Returns:
+        Callable: A method that unwraps its other operand, if it's a view too, and returns
+                  a read-only view of the result.
+    """
+
+    def method(self: ReadOnlyProxy, other: Any) -> Any:
+        if isinstance(other, ReadOnlyProxy):
+            other = other._target
+        return frozen_view(function(other, self._target) if reflected else function(self._target, other))
+    return method
+
+
+class ReadOnlyProxy:
+    """
+    A read-only view of an object.
+
+    Reads (attributes, items, iteration, length, membership, comparison, calls, and the operators
+    that build a new object, like `+` or `|`) are forwarded to the wrapped object, and the values they
+    return are wrapped in turn, so that nested objects are read-only too. Assigning or deleting
+    attributes and items raises a TypeError, and so does accessing the in-place methods of the built-in
+    containers (`append`, `update`, `add`, ...) and the special methods that modify an object
+    (`__iadd__`, `__setitem__`, ...). In-place operators, like `view += other`, leave the wrapped
+    object alone: they rebind the name to a view of a new object instead.
+
+    Warning:
+        This is a guard against accidental changes, not a security boundary: methods of custom
+        classes that modify their object are still forwarded.
+    """
+
+    __slots__ = ('_target',)
+
+    def __init__(self, target: Any) -> None:
+        object.__setattr__(self, '_target', target)
+
+
+    def __getattr__(self, name: str) -> Any:
+        if name in _MUTATING_METHODS:
+            raise TypeError(f"'{name}' is not allowed on a read-only view")
+        return frozen_view(getattr(self._target, name))
+
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise TypeError('Cannot assign attributes of a read-only view')
+
+
+    def __delattr__(self, name: str) -> None:
+        raise TypeError('Cannot delete attributes of a read-only view')
+
+
+    def __getitem__(self, key: Any) -> Any:
+        return frozen_view(self._target[key])
+
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        raise TypeError('Cannot assign items of a read-only view')
+
+
+    def __delitem__(self, key: Any) -> None:
+        raise TypeError('Cannot delete items of a read-only view')
+
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return frozen_view(self._target(*args, **kwargs))
+
+
+    def __iter__(self) -> Iterator[Any]:
+        for value in self._target:
+            yield frozen_view(value)
+
+
+    def __len__(self) -> int:
+        return len(self._target)
+
+
+    def __bool__(self) -> bool:
+        return bool(self._target)
+
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._target
+
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ReadOnlyProxy):
+            other = other._target
+        return self._target == other
+
+
+    def __hash__(self) -> int:
+        return hash(self._target)
+
+
+    def __reversed__(self) -> Iterator[Any]:
+        for value in reversed(self._target):
+            yield frozen_view(value)
+
+
+    __lt__ = _binary_operator(operator.lt)
+    __le__ = _binary_operator(operator.le)
+    __gt__ = _binary_operator(operator.gt)
+    __ge__ = _binary_operator(operator.ge)
+    __add__ = _binary_operator(operator.add)
+    __radd__ = _binary_operator(operator.add, reflected=True)
+    __sub__ = _binary_operator(operator.sub)
+    __rsub__ = _binary_operator(operator.sub, reflected=True)
+    __mul__ = _binary_operator(operator.mul)
+    __rmul__ = _binary_operator(operator.mul, reflected=True)
+    __and__ = _binary_operator(operator.and_)
+    __rand__ = _binary_operator(operator.and_, reflected=True)
+    __or__ = _binary_operator(operator.or_)
+    __ror__ = _binary_operator(operator.or_, reflected=True)
+    __xor__ = _binary_operator(operator.xor)
+    __rxor__ = _binary_operator(operator.xor, reflected=True)
+
+
+    def __str__(self) -> str:
+        return str(self._target)
+
+
+    def __repr__(self) -> str:
+        return f'ReadOnlyProxy({repr(self._target)})'
+
+
+def frozen_view(value: Any) -> Any:
+    """
+    Return a read-only view of a value, without copying it.
+
+    Parameters:
+        value (Any): The value to protect.
+
+    Returns:
+        Any: The value itself if it's immutable, otherwise a `ReadOnlyProxy` wrapping it.
+    """
+
+    if isinstance(value, _IMMUTABLE_TYPES) or isinstance(value, ReadOnlyProxy):
+        return value
+    return ReadOnlyProxy(value)
+
+
+def apply_policy(policy: CopyPolicy, value: Any) -> Any:
+    """
+    Return a value as prescribed by a copy policy.
+
+    Parameters:
+        policy (CopyPolicy): The policy to apply.
+        value (Any): The value stored in the container.
+
+    Returns:
+        Any: The value itself, a copy, or a read-only view of it.
+    """
+
+    if policy is CopyPolicy.NONE or isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if policy is CopyPolicy.SHALLOW:
+        return copy.copy(value)
+    if policy is CopyPolicy.DEEP:
+        return copy.deepcopy(value)
+    return frozen_view(value)
@@ -28,12 +28,14 @@ class HashTable:
         self._m = buckets
         self._data = [SinglyLinkedList() for _ in range(buckets)]
         self._extract_key = extract_key
+        # The number of values stored, across all the chains
+        self._size = 0
 
 
     def __len__(self):
         """ Return the size of the hash table.
         """
-        return sum((len(bucket) for bucket in self._data))
+        return self._size
 
 
     def _hash(self, key: int):
@@ -71,6 +73,7 @@ class HashTable:
         """
         index = self._hash(self._extract_key(value))
         self._data[index].insert_in_front(value)
+        self._size += 1
 
 
     def contains(self, value: Any) -> bool:
@@ -96,3 +99,4 @@ class HashTable:
             self._data[index].delete(value)
         except ValueError as exc:
             raise ValueError(f'No element with value {value} was found in the hash table.') from exc
+        self._size -= 1
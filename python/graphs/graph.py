@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, Type, Tuple
+from typing import Any, Iterator, Type, Tuple
 from linked_lists.singly_linked_list import SinglyLinkedList
 from queues.queue import Queue
 from stacks.stack import Stack
@@ -71,7 +71,24 @@ class Graph:
                 list[Tuple[Any, Any]]: A list of tuples of the form (source, destination).
                     For both vertices we return their keys.
             """
-            return [(self.id, v.id) for v in self._adj_list]
+            return list(self.iter_outgoing_edges())
+
+        def iter_outgoing_edges(self) -> Iterator[Tuple[Any, Any]]:
+            """Lazily iterate over the outgoing edges from this vertex, without building a list.
+
+            Returns:
+                Iterator[Tuple[Any, Any]]: A one-shot iterator over tuples of the form (source, destination).
+                    For both vertices we return their keys.
+            """
+            return self._adj_list.map(lambda v: (self.id, v.id))
+
+        def out_degree(self) -> int:
+            """Get the number of outgoing edges from this vertex.
+
+            Returns:
+                int: The number of outgoing edges from this vertex.
+            """
+            return len(self._adj_list)
 
 
     def __init__(self):
@@ -82,7 +99,7 @@ class Graph:
         def edges_repr(edges):
             return f"[{', '.join((f'->{u}' for (_, u) in edges))}]"
 
-        adj_lst_repr = (f'{repr(v)}: {edges_repr(v.outgoing_edges())}' for v in self._adj.values())
+        adj_lst_repr = (f'{repr(v)}: {edges_repr(v.iter_outgoing_edges())}' for v in self._adj.values())
         return f'Graph({" | ".join(adj_lst_repr)})'
 
 
@@ -208,7 +225,7 @@ class Graph:
             set[tuple[Any, Any]]: A list of all edges in the graph. 
                 Each edge is returned as a (source, destination) pair of vertex keys.
         """
-        return set(e for v in self._adj.values() for e in v.outgoing_edges())
+        return set(e for v in self._adj.values() for e in v.iter_outgoing_edges())
 
 
     def edge_count(self) -> int:
@@ -217,7 +234,7 @@ class Graph:
         Returns:
             int: The number of edges in the graph.
         """
-        return sum(len(v.outgoing_edges()) for v in self._adj.values())
+        return sum(v.out_degree() for v in self._adj.values())
 
 
     def bfs(self, start_vertex: Any, target_vertex: Any) -> list[Any]:
@@ -261,7 +278,7 @@ class Graph:
                 return reconstruct_path(predecessor, target_vertex)
 
             # For each of u's neighbors, we check if there was already a shorter path to them
-            for (_, v) in self._get_vertex(u).outgoing_edges():
+            for (_, v) in self._get_vertex(u).iter_outgoing_edges():
                 if distance[v] == float('inf'):
                     distance[v] = distance[u] + 1
                     predecessor[v] = u
@@ -300,6 +317,6 @@ class Graph:
             elif col == 'white':
                 color[v] = 'grey'
                 stack.push((True, v))
-                for (_, w) in self._get_vertex(v).outgoing_edges():
+                for (_, w) in self._get_vertex(v).iter_outgoing_edges():
                     stack.push((False, w))
         return acyclic, color
@@ -1,9 +1,10 @@
 """Module providing an implementation for doubly-linked list."""
 from __future__ import annotations
-import copy
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Union
+from copy_policy import CopyPolicy, apply_policy
+from linked_lists.streaming import StreamingMixin
 
-class DoublyLinkedList:
+class DoublyLinkedList(StreamingMixin):
     """
     This class models a doubly-linked list data structure.
 
@@ -26,8 +27,13 @@ class DoublyLinkedList:
             data: The data held in the node. Can be any arbitrary object.
             _next: A reference to the next node in the list.
             _prev: A reference to the previous node in the list.
+
+        Nodes are slotted: they have no per-instance `__dict__`, which makes them
+        smaller and faster to allocate.
         """
 
+        __slots__ = ('_data', '_next', '_prev')
+
         def __init__(self, data: Any) -> None:
             """
             Initialize a new Node object. The links to previous and next nodes are set to None,
@@ -174,18 +180,23 @@ class DoublyLinkedList:
     # --- DoublyLinkedList methods ---
 
 
-    def __init__(self) -> None:
+    def __init__(self, copy_policy: Union[CopyPolicy, str] = CopyPolicy.DEEP) -> None:
         """
         Initialize a new empty DoublyLinkedList.
 
         Parameters:
-            None
+            copy_policy (Union[CopyPolicy, str], optional): How `get` returns the data stored in the list:
+                                                            the data itself ('none'), a shallow copy ('shallow'),
+                                                            a deep copy ('deep') or a read-only view ('frozen').
+                                                            Defaults to CopyPolicy.DEEP.
 
         Attributes:
             _head (Node): The head node of the list. Initialized to None.
+            _copy_policy (CopyPolicy): The policy applied by `get`.
         """
 
         self._head = None
+        self._copy_policy = CopyPolicy(copy_policy)
         self._tail = None
 
 
@@ -200,7 +211,7 @@ class DoublyLinkedList:
             int: The number of nodes in the linked list.
         """
 
-        return len(self.traverse(lambda x: x))
+        return self.size()
 
 
     def __repr__(self) -> str:
@@ -214,7 +225,7 @@ class DoublyLinkedList:
             str: The string representation of the linked list nodes.
         """
 
-        return f'DoublyLinkedList({"<->".join(self.traverse(repr))})'
+        return f'DoublyLinkedList({"<->".join(self.itraverse(repr))})'
 
 
     def __str__(self) -> str:
@@ -228,12 +239,12 @@ class DoublyLinkedList:
             str: The string representation of the linked list nodes.
 
         Functionality:
-            Traverses the linked list using the traverse() method, 
+            Traverses the linked list lazily using the itraverse() method, 
             passing in repr() to convert each node to a string.
             Joins the node string representations with '->' and returns the result.
         """
 
-        return '<->'.join(self.traverse(str))
+        return '<->'.join(self.itraverse(str))
 
 
     def __iter__(self):
@@ -255,6 +266,18 @@ class DoublyLinkedList:
             yield data
 
 
+    def _nodes(self) -> Iterator[DoublyLinkedList.Node]:
+        """
+        Iterate over the nodes in the list, from the head to the tail.
+        """
+
+        current = self._head
+        while current is not None:
+            following = current.next()
+            yield current
+            current = following
+
+
     def size(self) -> int:
         """
         Return the length of the linked list.
@@ -266,12 +289,7 @@ class DoublyLinkedList:
             int: The number of nodes in the linked list.
         """
 
-        size = 0
-        current = self._head
-        while current is not None:
-            size += 1
-            current = current.next()
-        return size
+        return sum(1 for _ in self._nodes())
 
 
     def is_empty(self) -> bool:
@@ -288,39 +306,274 @@ class DoublyLinkedList:
         return self._head is None
 
 
-    def insert_in_front(self, data: Any) -> None:
+    def insert_in_front(self, data: Any) -> DoublyLinkedList.Node:
         """
         Add a node to the beginning of the list.
 
         Parameters:
         - data (Any): The data for the new node to add.
+
+        Returns:
+        - Node: The new node. It can be used as a handle to delete or move the node
+                in constant time, with `delete_node`, `move_to_front` and `move_to_back`.
+        """
+
+        node = DoublyLinkedList.Node(data)
+        self._link_front(node)
+        return node
+
+
+    def insert_to_back(self, data: Any) -> DoublyLinkedList.Node:
+        """
+        Append a node to the end of the list, in constant time.
+
+        Parameters:
+        - data (Any): The data for the new node to append.
+
+        Returns:
+        - Node: The new node, usable as a handle (see `insert_in_front`).
+        """
+
+        node = DoublyLinkedList.Node(data)
+        self._link_back(node)
+        return node
+
+
+    def _link_front(self, node: DoublyLinkedList.Node) -> None:
+        """
+        Link a detached node at the beginning of the list.
         """
 
         if self._head is None:
-            self._tail = self._head = DoublyLinkedList.Node(data)
+            self._tail = node
+        else:
+            node.append(self._head)
+        self._head = node
+
+
+    def _link_back(self, node: DoublyLinkedList.Node) -> None:
+        """
+        Link a detached node at the end of the list.
+        """
+
+        if self._tail is None:
+            self._head = node
         else:
-            old_head = self._head
-            self._head = DoublyLinkedList.Node(data)
-            self._head.append(old_head)
+            node.prepend(self._tail)
+        self._tail = node
 
 
-    def insert_to_back(self, data: Any) -> None:
+    def _unlink(self, node: DoublyLinkedList.Node) -> None:
         """
-        Append a node to the end of the list.
+        Detach a node from the list, in constant time, and clear its links.
 
         Parameters:
-        - data (Any): The data for the new node to append.
-        
-        Warning: this method requires traversing a linear number (O(n))
-        of nodes.
+            node (Node): A node of this list.
+
+        Error Handling:
+            Raises a ValueError if the node is detached, e.g. because it was already deleted.
+        """
+
+        previous, following = node.prev(), node.next()
+        if previous is None and node is not self._head:
+            raise ValueError('The node is not in the list.')
+        if previous is None:
+            self._head = following
+        else:
+            previous.append(following)
+        if following is None:
+            self._tail = previous
+        else:
+            following.prepend(previous)
+        node._prev = node._next = None
+
+
+    def delete_node(self, node: DoublyLinkedList.Node) -> Any:
+        """
+        Delete a node from the list, in constant time, and return the data it held.
+
+        Parameters:
+            node (Node): A node of this list, as returned by the insert methods.
+
+        Returns:
+            Any: The data held by the node.
+
+        Error Handling:
+            Raises a ValueError if the node was already deleted.
+
+        Warning:
+            The node must belong to this list: this can't be checked without walking the list.
+        """
+
+        self._unlink(node)
+        return node.data()
+
+
+    def move_to_front(self, node: DoublyLinkedList.Node) -> None:
+        """
+        Move a node to the beginning of the list, in constant time. The node stays the same object,
+        so handles on it remain valid.
+
+        Parameters:
+            node (Node): A node of this list, as returned by the insert methods.
+
+        Error Handling:
+            Raises a ValueError if the node was deleted.
+        """
+
+        if node is not self._head:
+            self._unlink(node)
+            self._link_front(node)
+
+
+    def move_to_back(self, node: DoublyLinkedList.Node) -> None:
+        """
+        Move a node to the end of the list, in constant time. The node stays the same object,
+        so handles on it remain valid.
+
+        Parameters:
+            node (Node): A node of this list, as returned by the insert methods.
+
+        Error Handling:
+            Raises a ValueError if the node was deleted.
         """
 
+        if node is not self._tail:
+            self._unlink(node)
+            self._link_back(node)
+
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[Any],
+                      copy_policy: Union[CopyPolicy, str] = CopyPolicy.DEEP) -> DoublyLinkedList:
+        """
+        Create a new list holding the given values, in the same order.
+
+        Parameters:
+            values (Iterable): The values to store in the list.
+            copy_policy (Union[CopyPolicy, str], optional): The copy policy of the new list.
+                                                            Defaults to CopyPolicy.DEEP.
+
+        Returns:
+            DoublyLinkedList: A new list with a node for each value.
+        """
+
+        result = cls(copy_policy)
+        result.extend(values)
+        return result
+
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """
+        Append all the given values to the end of the list, in order.
+
+        Parameters:
+            values (Iterable): The values to append.
+
+        Functionality:
+            The new nodes are linked to each other in a single pass, then the whole chain is
+            attached to the tail of the list. To move the nodes of another list instead of
+            copying its values, use `splice`.
+        """
+
+        head = tail = None
+        for value in values:
+            node = DoublyLinkedList.Node(value)
+            if tail is None:
+                head = node
+            else:
+                tail.append(node)
+            tail = node
+        if head is None:
+            return
         if self._tail is None:
-            self._tail = self._head = DoublyLinkedList.Node(data)
+            self._head = head
+        else:
+            self._tail.append(head)
+        self._tail = tail
+
+
+    def splice(self, other: DoublyLinkedList, after: Optional[DoublyLinkedList.Node] = None) -> None:
+        """
+        Move all the nodes of another list into this one, in constant time.
+
+        Parameters:
+            other (DoublyLinkedList): The list whose nodes are moved. It's left empty.
+            after (Node, optional): The node of this list after which the nodes are inserted.
+                                    Defaults to None, to insert them at the end of the list.
+
+        Functionality:
+            Relinks the head and the tail of `other` with the neighbours of the insertion point,
+            without walking either list.
+
+        Error Handling:
+            Raises a ValueError if `other` is this same list.
+        """
+
+        if other is self:
+            raise ValueError('Cannot splice a list into itself.')
+        if other._head is None:
+            return
+        if after is None:
+            after = self._tail
+        if after is None:
+            self._head, self._tail = other._head, other._tail
         else:
-            old_tail = self._tail
-            self._tail = DoublyLinkedList.Node(data)
-            self._tail.prepend(old_tail)
+            following = after.next()
+            after.append(other._head)
+            other._tail.append(following)
+            if following is None:
+                self._tail = other._tail
+        other._head = other._tail = None
+
+
+    @classmethod
+    def concat(cls, *lists: DoublyLinkedList) -> DoublyLinkedList:
+        """
+        Concatenate several lists into a new one, by relinking their nodes.
+
+        Parameters:
+            lists (DoublyLinkedList): The lists to concatenate, in order. They're all left empty.
+
+        Returns:
+            DoublyLinkedList: A new list with all the nodes of the lists. It has the copy policy of the
+                              first list, or the default one if no list is passed.
+
+        Functionality:
+            Each list is spliced in constant time, so the cost only depends on the number of lists,
+            not on their length.
+        """
+
+        result = cls(lists[0]._copy_policy) if lists else cls()
+        for linked_list in lists:
+            result.splice(linked_list)
+        return result
+
+
+    def split_at(self, node: DoublyLinkedList.Node) -> DoublyLinkedList:
+        """
+        Split the list in two, in constant time.
+
+        Parameters:
+            node (Node): A node of this list. It becomes the head of the new list.
+
+        Returns:
+            DoublyLinkedList: A new list with `node` and all the nodes after it, which are
+                              removed from this list. It has the same copy policy as this list.
+
+        Warning:
+            The node must belong to this list: this can't be checked without walking the list.
+        """
+
+        result = type(self)(self._copy_policy)
+        result._head, result._tail = node, self._tail
+        self._tail = node.prev()
+        if self._tail is None:
+            self._head = None
+        else:
+            self._tail.append(None)
+            node.prepend(None)
+        return result
 
 
     def traverse(self, functor: Callable[..., Any]) -> List[Any]:
@@ -335,12 +588,7 @@ class DoublyLinkedList:
                     to each node's data.
         """
 
-        current = self._head
-        result = []
-        while current is not None:
-            result.append(functor(current.data()))
-            current = current.next()
-        return result
+        return list(self.itraverse(functor))
 
 
     def get(self, index):
@@ -351,7 +599,8 @@ class DoublyLinkedList:
             index (int): The index of the element to retrieve, starting from the head of the list.
         
         Returns:
-            Any: A deep copy of the data at the given index if found.
+            Any: The data at the given index if found, copied or wrapped according to the copy policy
+                 of the list (by default, a deep copy).
         
         Error Handling:
             Raising an IndexError if index is invalid.
@@ -366,7 +615,7 @@ class DoublyLinkedList:
         if current is None:
             raise IndexError("Index out of bounds")
         # Here we know that we are at the right index
-        return copy.deepcopy(current.data())
+        return apply_policy(self._copy_policy, current.data())
 
 
     def _search(self, target: Any) -> Optional[DoublyLinkedList.Node]:
@@ -424,23 +673,7 @@ class DoublyLinkedList:
         node = self._search(target)
         if node is None:
             raise ValueError(f'No element with value {target} was found in the list.')
-
-        if node.prev() is None:
-            # Delete node from front
-            self._head = node.next()
-            if self._head is None:
-                # In case the list's head was the only element in the list
-                self._tail = None
-            else:
-                self._head.prepend(None)
-        elif node.next() is None:
-            # Delete node from back
-            self._tail = node.prev()
-            # We know tail can't be None, because node.prev() != None
-            self._tail.append(None)
-        else:
-            node.prev().append(node.next())
-            del node
+        self._unlink(node)
 
 
     def delete_from_front(self) -> Any:
@@ -459,13 +692,9 @@ class DoublyLinkedList:
 
         if self.is_empty():
             raise ValueError('Delete on an empty list.')
-        data = self._head.data()
-        self._head = self._head.next()
-        if self._head is None:
-            self._tail = None
-        else:
-            self._head.prepend(None)
-        return data
+        node = self._head
+        self._unlink(node)
+        return node.data()
 
 
     def delete_from_back(self) -> Any:
@@ -484,10 +713,6 @@ class DoublyLinkedList:
 
         if self.is_empty():
             raise ValueError('Delete on an empty list.')
-        data = self._tail.data()
-        self._tail = self._tail.prev()
-        if self._tail is None:
-            self._head = None
-        else:
-            self._tail.append(None)
-        return data
+        node = self._tail
+        self._unlink(node)
+        return node.data()
@@ -0,0 +1,552 @@
+"""Module providing singly- and doubly-linked lists whose nodes are stored in parallel typed arrays."""
+from __future__ import annotations
+import array
+from typing import Any, Callable, Iterator, List, Optional, Union
+from copy_policy import CopyPolicy, apply_policy
+from linked_lists.streaming import StreamingMixin
+
+# The index used as a null link
+NIL = -1
+
+class PooledSinglyLinkedList(StreamingMixin):
+    """
+    A singly-linked list with the same API as `SinglyLinkedList`, whose nodes are not objects,
+    but slots in a pool of parallel arrays.
+
+    Node `i` holds its data in `_data[i]` and the index of its successor in `_next[i]` (NIL for the
+    last node). Links are stored in a typed array of 64-bit integers, so creating a node doesn't
+    allocate any object, and the garbage collector has nothing to track but a couple of arrays.
+    Slots of deleted nodes are chained in a free list (through `_next`), and reused by the next
+    insertions: the pool never shrinks, and grows only when the free list is empty.
+
+    If a `typecode` is passed, the data are stored in a typed array as well, restricted to the type,
+    like `arrays.core.Array`; otherwise, they are stored in a Python list, and can be any object.
+
+    Functionality:
+
+    - Stores nodes containing arbitrary data, or data of a single C type.
+    - Supports common linked list operations like insertion, deletion search and traversal.
+    """
+
+    def __init__(self, typecode: Optional[str] = None,
+                 copy_policy: Union[CopyPolicy, str] = CopyPolicy.DEEP) -> None:
+        """
+        Initialize a new empty list.
+
+        Parameters:
+            typecode (str, optional): The typecode of the data stored in the list, as in `array.array`.
+                                      Defaults to None, to store arbitrary objects.
+            copy_policy (Union[CopyPolicy, str], optional): How `get` returns the data stored in the list.
+                                                            Defaults to CopyPolicy.DEEP.
+
+        Attributes:
+            _next (array.array): For each slot, the index of the next node.
+            _data (Union[list, array.array]): For each slot, the data of the node.
+            _head (int): The slot of the first node, or NIL if the list is empty.
+            _tail (int): The slot of the last node, or NIL if the list is empty.
+            _free (int): The first slot in the free list, or NIL if there are no free slots.
+            _size (int): The number of nodes in the list.
+        """
+
+        self._next = array.array('q')
+        self._data = [] if typecode is None else array.array(typecode)
+        self._head = NIL
+        self._tail = NIL
+        self._free = NIL
+        self._size = 0
+        self._copy_policy = CopyPolicy(copy_policy)
+
+
+    def __len__(self) -> int:
+        """
+        Return the length of the linked list.
+
+        Parameters:
+            None
+
+        Returns:
+            int: The number of nodes in the linked list.
+        """
+
+        return self._size
+
+
+    def __repr__(self) -> str:
+        """
+        Return the string (internal) representation of the linked list.
+
+        Parameters:
+            None
+
+        Returns:
+            str: The string representation of the linked list nodes.
+        """
+
+        return f'{type(self).__name__}({self._separator().join(self.itraverse(repr))})'
+
+
+    def __str__(self) -> str:
+        """
+        Return the string representation of the linked list.
+
+        Parameters:
+            None
+
+        Returns:
+            str: The string representation of the linked list nodes.
+        """
+
+        return self._separator().join(self.itraverse(str))
+
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate over the values in the linked list, from the head to the tail.
+
+        Parameters:
+            None
+        """
+
+        data = self._data
+        for slot in self._slots():
+            yield data[slot]
+
+
+    def _separator(self) -> str:
+        """
+        Return the string used between nodes by `__str__` and `__repr__`.
+        """
+
+        return '->'
+
+
+    def _slots(self) -> Iterator[int]:
+        """
+        Iterate over the slots of the nodes in the list, from the head to the tail.
+        """
+
+        next_slots = self._next
+        slot = self._head
+        while slot != NIL:
+            following = next_slots[slot]
+            yield slot
+            slot = following
+
+
+    def _allocate(self, data: Any) -> int:
+        """
+        Store data in a free slot, taken from the free list if possible, or added to the pool.
+
+        Parameters:
+            data (Any): The data of the new node.
+
+        Returns:
+            int: The slot of the new node. Its link is set to NIL.
+
+        Error Handling:
+            For typed lists, raises a TypeError or an OverflowError if the data doesn't fit the typecode;
+            the list is left unchanged.
+        """
+
+        if self._free == NIL:
+            self._data.append(data)
+            self._next.append(NIL)
+            return len(self._next) - 1
+        slot = self._free
+        self._data[slot] = data
+        self._free = self._next[slot]
+        self._next[slot] = NIL
+        return slot
+
+
+    def _release(self, slot: int) -> None:
+        """
+        Put the slot of a deleted node in the free list.
+
+        Parameters:
+            slot (int): The slot to release.
+        """
+
+        if isinstance(self._data, list):
+            # Drop the reference to the data, so that it can be garbage collected
+            self._data[slot] = None
+        self._next[slot] = self._free
+        self._free = slot
+
+
+    def capacity(self) -> int:
+        """
+        Return the number of slots in the pool, used or free.
+
+        Parameters:
+            None
+
+        Returns:
+            int: The number of nodes the list can hold before the pool needs to grow.
+        """
+
+        return len(self._next)
+
+
+    def size(self) -> int:
+        """
+        Return the length of the linked list.
+
+        Parameters:
+            None
+
+        Returns:
+            int: The number of nodes in the linked list.
+        """
+
+        return self._size
+
+
+    def is_empty(self) -> bool:
+        """
+        Check if the linked list is empty.
+
+        Parameters:
+            None
+
+        Returns:
+            bool: True if the linked list is empty, False otherwise.
+        """
+
+        return self._head == NIL
+
+
+    def insert_in_front(self, data: Any) -> None:
+        """
+        Add a node to the beginning of the list.
+
+        Parameters:
+        - data (Any): The data for the new node to add.
+        """
+
+        slot = self._allocate(data)
+        self._next[slot] = self._head
+        if self._head == NIL:
+            self._tail = slot
+        self._head = slot
+        self._size += 1
+
+
+    def insert_to_back(self, data: Any) -> None:
+        """
+        Append a node to the end of the list, in constant time.
+
+        Parameters:
+        - data (Any): The data for the new node to append.
+        """
+
+        slot = self._allocate(data)
+        if self._tail == NIL:
+            self._head = slot
+        else:
+            self._next[self._tail] = slot
+        self._tail = slot
+        self._size += 1
+
+
+    def get(self, index: int) -> Any:
+        """
+        Get the data at the given index.
+
+        Parameters:
+            index (int): The index of the element to retrieve, starting from the head of the list.
+
+        Returns:
+            Any: The data at the given index if found, copied or wrapped according to the copy policy
+                 of the list (by default, a deep copy).
+
+        Error Handling:
+            Raising an IndexError if index is invalid.
+        """
+
+        if index < 0:
+            raise IndexError("Index must be non-negative")
+        if index >= self._size:
+            raise IndexError("Index out of bounds")
+        slot = self._head
+        for _ in range(index):
+            slot = self._next[slot]
+        return apply_policy(self._copy_policy, self._data[slot])
+
+
+    def traverse(self, functor: Callable[..., Any]) -> List[Any]:
+        """
+        Traverse the linked list and apply a function to each node's data.
+
+        Parameters:
+            functor (Callable): The function (or functor) to apply to each node's data.
+
+        Returns:
+            List[Any]: A list containing the result of applying the function
+                    to each node's data.
+        """
+
+        return list(self.itraverse(functor))
+
+
+    def _search(self, target: Any) -> int:
+        """
+        Search the list for a node with the data matching `target`, and return its slot.
+
+        Parameters:
+        - target (Any): The data to search for in the list.
+
+        Returns:
+        - int: The slot of the first node containing the target data if found, otherwise NIL.
+        """
+
+        data = self._data
+        for slot in self._slots():
+            if data[slot] == target:
+                return slot
+        return NIL
+
+
+    def search(self, predicate: Callable[..., Any]) -> Optional[Any]:
+        """
+        Search the list for the first node whose data matches the predicate function.
+
+        Parameters:
+            predicate (Callable): The predicate function to evaluate node data against.
+                                Should accept a single parameter for the node data.
+
+        Returns:
+            Optional[Any]: The first element for which predicate(element) is True,
+                        or None if no match is found.
+        """
+
+        for data in self:
+            if predicate(data):
+                return data
+        return None
+
+
+    def delete(self, target: Any) -> None:
+        """
+        Delete the first node with the given data from the list.
+
+        Parameters:
+            target (Any): The data value to delete from the list.
+
+        Returns:
+            None
+
+        Error Handling:
+            If no match is found after full traversal, raises a ValueError.
+        """
+
+        data = self._data
+        previous = NIL
+        for slot in self._slots():
+            if data[slot] == target:
+                if previous == NIL:
+                    self._head = self._next[slot]
+                else:
+                    self._next[previous] = self._next[slot]
+                if slot == self._tail:
+                    self._tail = previous
+                self._size -= 1
+                self._release(slot)
+                return
+            previous = slot
+        # If it gets here, it hasn't found the target
+        raise ValueError(f'No element with value {target} was found in the list.')
+
+
+    def delete_from_front(self) -> Any:
+        """
+        Delete the first node in the list and return the data it held.
+
+        Parameters:
+            None
+
+        Returns:
+            The data held by the node that was deleted from the front.
+
+        Error Handling:
+            If the list is empty, raises a ValueError.
+        """
+
+        if self.is_empty():
+            raise ValueError('Delete on an empty list.')
+        slot = self._head
+        data = self._data[slot]
+        self._head = self._next[slot]
+        if self._head == NIL:
+            self._tail = NIL
+        self._size -= 1
+        self._release(slot)
+        return data
+
+
+class PooledDoublyLinkedList(PooledSinglyLinkedList):
+    """
+    A doubly-linked list with the same API as `DoublyLinkedList`, whose nodes are slots in a pool
+    of parallel arrays: on top of the arrays of `PooledSinglyLinkedList`, `_prev[i]` holds the index
+    of the predecessor of node `i` (NIL for the first node).
+
+    Functionality:
+
+    - Stores nodes containing arbitrary data, or data of a single C type.
+    - Supports common linked list operations like insertion, deletion search and traversal.
+    """
+
+    def __init__(self, typecode: Optional[str] = None,
+                 copy_policy: Union[CopyPolicy, str] = CopyPolicy.DEEP) -> None:
+        """
+        Initialize a new empty list.
+
+        Parameters:
+            typecode (str, optional): The typecode of the data stored in the list, as in `array.array`.
+                                      Defaults to None, to store arbitrary objects.
+            copy_policy (Union[CopyPolicy, str], optional): How `get` returns the data stored in the list.
+                                                            Defaults to CopyPolicy.DEEP.
+        """
+
+        super().__init__(typecode, copy_policy)
+        self._prev = array.array('q')
+
+
+    def _separator(self) -> str:
+        """
+        Return the string used between nodes by `__str__` and `__repr__`.
+        """
+
+        return '<->'
+
+
+    def _allocate(self, data: Any) -> int:
+        """
+        Store data in a free slot, and set both its links to NIL.
+        """
+
+        slot = super()._allocate(data)
+        if slot == len(self._prev):
+            self._prev.append(NIL)
+        else:
+            self._prev[slot] = NIL
+        return slot
+
+
+    def _unlink(self, slot: int) -> None:
+        """
+        Remove a node from the list, in constant time, and release its slot.
+
+        Parameters:
+            slot (int): The slot of a node in the list.
+        """
+
+        previous, following = self._prev[slot], self._next[slot]
+        if previous == NIL:
+            self._head = following
+        else:
+            self._next[previous] = following
+        if following == NIL:
+            self._tail = previous
+        else:
+            self._prev[following] = previous
+        self._size -= 1
+        self._release(slot)
+
+
+    def insert_in_front(self, data: Any) -> None:
+        """
+        Add a node to the beginning of the list.
+
+        Parameters:
+        - data (Any): The data for the new node to add.
+        """
+
+        slot = self._allocate(data)
+        if self._head == NIL:
+            self._tail = slot
+        else:
+            self._next[slot] = self._head
+            self._prev[self._head] = slot
+        self._head = slot
+        self._size += 1
+
+
+    def insert_to_back(self, data: Any) -> None:
+        """
+        Append a node to the end of the list, in constant time.
+
+        Parameters:
+        - data (Any): The data for the new node to append.
+        """
+
+        slot = self._allocate(data)
+        if self._tail == NIL:
+            self._head = slot
+        else:
+            self._prev[slot] = self._tail
+            self._next[self._tail] = slot
+        self._tail = slot
+        self._size += 1
+
+
+    def delete(self, target: Any) -> None:
+        """
+        Delete the first node with the given data from the list.
+
+        Parameters:
+            target (Any): The data value to delete from the list.
+
+        Returns:
+            None
+
+        Error Handling:
+            If no match is found after full traversal, raises a ValueError.
+        """
+
+        slot = self._search(target)
+        if slot == NIL:
+            raise ValueError(f'No element with value {target} was found in the list.')
+        self._unlink(slot)
+
+
+    def delete_from_front(self) -> Any:
+        """
+        Delete the first node in the list and return the data it held.
+
+        Parameters:
+            None
+
+        Returns:
+            The data held by the node that was deleted from the front.
+
+        Error Handling:
+            If the list is empty, raises a ValueError.
+        """
+
+        if self.is_empty():
+            raise ValueError('Delete on an empty list.')
+        data = self._data[self._head]
+        self._unlink(self._head)
+        return data
+
+
+    def delete_from_back(self) -> Any:
+        """
+        Delete the last node in the list and return the data it held.
+
+        Parameters:
+            None
+
+        Returns:
+            The data held by the node that was deleted from the back of the list.
+
+        Error Handling:
+            If the list is empty, raises a ValueError.
+        """
+
+        if self.is_empty():
+            raise ValueError('Delete on an empty list.')
+        data = self._data[self._tail]
+        self._unlink(self._tail)
+        return data
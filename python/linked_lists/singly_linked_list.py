@@ -1,9 +1,10 @@
 """Module providing an implementation for singly-linked list."""
 from __future__ import annotations
-import copy
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, List, Optional, Union
+from copy_policy import CopyPolicy, apply_policy
+from linked_lists.streaming import StreamingMixin
 
-class SinglyLinkedList:
+class SinglyLinkedList(StreamingMixin):
     """
     This class models a singly-linked list data structure.
 
@@ -25,8 +26,13 @@ class SinglyLinkedList:
 
             data: The data held in the node. Can be any arbitrary object.
             _next: A reference to the next node in the list.
+
+        Nodes are slotted: they have no per-instance `__dict__`, which makes them
+        smaller and faster to allocate.
         """
 
+        __slots__ = ('_data', '_next')
+
         def __init__(self, data: Any, next_node: SinglyLinkedList.Node = None) -> None:
             """
             Initialize a new Node object.
@@ -126,18 +132,29 @@ class SinglyLinkedList:
     # --- SinglyLinkedList methods ---
 
 
-    def __init__(self) -> None:
+    def __init__(self, copy_policy: Union[CopyPolicy, str] = CopyPolicy.DEEP) -> None:
         """
         Initialize a new empty SinglyLinkedList.
 
         Parameters:
-            None
+            copy_policy (Union[CopyPolicy, str], optional): How `get` returns the data stored in the list:
+                                                            the data itself ('none'), a shallow copy ('shallow'),
+                                                            a deep copy ('deep') or a read-only view ('frozen').
+                                                            Defaults to CopyPolicy.DEEP.
 
         Attributes:
             _head (Node): The head node of the list. Initialized to None.
+            _tail (Node): The last node of the list, so that appending doesn't require a traversal.
+                          Initialized to None.
+            _size (int): The number of nodes in the list, kept up to date by all the methods
+                         changing the list. Initialized to 0.
+            _copy_policy (CopyPolicy): The policy applied by `get`.
         """
 
         self._head = None
+        self._tail = None
+        self._size = 0
+        self._copy_policy = CopyPolicy(copy_policy)
 
 
     def __len__(self):
@@ -151,7 +168,7 @@ class SinglyLinkedList:
             int: The number of nodes in the linked list.
         """
 
-        return len(self.traverse(lambda x: x))
+        return self._size
 
 
     def __repr__(self) -> str:
@@ -165,7 +182,7 @@ class SinglyLinkedList:
             str: The string representation of the linked list nodes.
         """
 
-        return f'SinglyLinkedList({"->".join(self.traverse(repr))})'
+        return f'SinglyLinkedList({"->".join(self.itraverse(repr))})'
 
 
     def __str__(self) -> str:
@@ -179,12 +196,12 @@ class SinglyLinkedList:
             str: The string representation of the linked list nodes.
 
         Functionality:
-            Traverses the linked list using the traverse() method, 
+            Traverses the linked list lazily using the itraverse() method, 
             passing in repr() to convert each node to a string.
             Joins the node string representations with '->' and returns the result.
         """
 
-        return '->'.join(self.traverse(str))
+        return '->'.join(self.itraverse(str))
 
 
     def __iter__(self):
@@ -217,12 +234,7 @@ class SinglyLinkedList:
             int: The number of nodes in the linked list.
         """
 
-        size = 0
-        current = self._head
-        while current is not None:
-            size += 1
-            current = current.next()
-        return size
+        return self._size
 
 
     def is_empty(self) -> bool:
@@ -249,6 +261,9 @@ class SinglyLinkedList:
 
         old_head = self._head
         self._head = SinglyLinkedList.Node(data, old_head)
+        if old_head is None:
+            self._tail = self._head
+        self._size += 1
 
 
     def insert_to_back(self, data: Any) -> None:
@@ -257,18 +272,18 @@ class SinglyLinkedList:
 
         Parameters:
         - data (Any): The data for the new node to append.
-        
-        Warning: this method requires traversing a linear number (O(n))
-        of nodes.
+
+        Functionality:
+            Links the new node after the tail of the list, in constant time.
         """
 
-        current = self._head
-        if current is None:
-            self._head = SinglyLinkedList.Node(data)
+        new_node = SinglyLinkedList.Node(data)
+        if self._tail is None:
+            self._head = new_node
         else:
-            while current.next() is not None:
-                current = current.next()
-            current.append(SinglyLinkedList.Node(data))
+            self._tail.append(new_node)
+        self._tail = new_node
+        self._size += 1
 
 
     def get(self, index):
@@ -279,7 +294,8 @@ class SinglyLinkedList:
             index (int): The index of the element to retrieve, starting from the head of the list.
         
         Returns:
-            Any: A deep copy of the data at the given index if found.
+            Any: The data at the given index if found, copied or wrapped according to the copy policy
+                 of the list (by default, a deep copy).
         
         Error Handling:
             Raising an IndexError if index is invalid.
@@ -294,7 +310,7 @@ class SinglyLinkedList:
         if current is None:
             raise IndexError("Index out of bounds")
         # Here we know that we are at the right index
-        return copy.deepcopy(current.data())
+        return apply_policy(self._copy_policy, current.data())
 
 
     def traverse(self, functor: Callable[..., Any]) -> List[Any]:
@@ -309,12 +325,7 @@ class SinglyLinkedList:
                     to each node's data.
         """
 
-        current = self._head
-        result = []
-        while current is not None:
-            result.append(functor(current.data()))
-            current = current.next()
-        return result
+        return list(self.itraverse(functor))
 
 
     def _search(self, target: Any) -> Optional[SinglyLinkedList.Node]:
@@ -378,6 +389,9 @@ class SinglyLinkedList:
                     self._head = current.next()
                 else:
                     previous.append(current.next())
+                if current is self._tail:
+                    self._tail = previous
+                self._size -= 1
                 return
             previous = current
             current = current.next()
@@ -403,4 +417,7 @@ class SinglyLinkedList:
             raise ValueError('Delete on an empty list.')
         data = self._head.data()
         self._head = self._head.next()
+        if self._head is None:
+            self._tail = None
+        self._size -= 1
         return data
@@ -1,6 +1,29 @@
-from typing import Any
+from typing import Any, Iterable, Iterator
+from queues.heap import Heap
 from .singly_linked_list import SinglyLinkedList
 
+class _Smallest:
+    """ A heap priority that ranks smaller values higher, to turn the max-heap `Heap` into a min-heap.
+        Ties between equal values are broken by the index of the list they come from.
+    """
+    __slots__ = ('_value', '_index')
+
+    def __init__(self, value: Any, index: int) -> None:
+        self._value = value
+        self._index = index
+
+    def _precedes(self, other: '_Smallest') -> bool:
+        if self._value < other._value:
+            return True
+        return not other._value < self._value and self._index < other._index
+
+    def __lt__(self, other: '_Smallest') -> bool:
+        return other._precedes(self)
+
+    def __gt__(self, other: '_Smallest') -> bool:
+        return self._precedes(other)
+
+
 class SortedSinglyLinkedList(SinglyLinkedList):
     """ A sorted version of the singly-linked lists.
     """
@@ -29,10 +52,85 @@ class SortedSinglyLinkedList(SinglyLinkedList):
                     self._head = SinglyLinkedList.Node(new_data, current)    # Add the element at the beginning of the list
                 else:
                     previous.append(SinglyLinkedList.Node(new_data, current))    # General case
+                self._size += 1
                 return
             previous = current
             current = current.next()
+        self._tail = SinglyLinkedList.Node(new_data)
         if previous is None:
-            self._head = SinglyLinkedList.Node(new_data)    # The list is empty
+            self._head = self._tail    # The list is empty
         else:
-            previous.append(SinglyLinkedList.Node(new_data, None))    # Add the element at the end of the list
+            previous.append(self._tail)    # Add the element at the end of the list
+        self._size += 1
+
+
+    def insert_sorted_batch(self, values: Iterable[Any]) -> None:
+        """
+        Insert a batch of values, given in sorted order, into the sorted list.
+
+        Parameters:
+            values (Iterable): The values to insert, sorted in ascending order.
+
+        Returns:
+            None
+
+        Functionality:
+            Merges the batch into the list in a single pass: the scan for each value resumes from
+            where the previous value was inserted, instead of restarting from the head, so inserting
+            k values into a list of n elements takes O(n + k) steps instead of O(n * k).
+            If a value is smaller than the previous one, the scan restarts from the head for it:
+            an unsorted batch is still inserted correctly, only more slowly.
+        """
+        previous = None
+        current = self._head
+        last_value = None
+        for index, new_data in enumerate(values):
+            if index > 0 and new_data < last_value:
+                previous = None
+                current = self._head
+            while current is not None and current.data() < new_data:
+                previous = current
+                current = current.next()
+            new_node = SinglyLinkedList.Node(new_data, current)
+            if previous is None:
+                self._head = new_node
+            else:
+                previous.append(new_node)
+            if current is None:
+                self._tail = new_node
+            self._size += 1
+            previous = new_node
+            last_value = new_data
+
+
+    @staticmethod
+    def merge_k(lists: Iterable[Iterable[Any]]) -> Iterator[Any]:
+        """
+        Lazily merge many sorted lists into a single sorted stream.
+
+        Parameters:
+            lists (Iterable): The lists to merge. Each one must be sorted in ascending order:
+                              sorted linked lists, or any other iterable in sorted order.
+
+        Returns:
+            Iterator[Any]: A generator yielding all the values of all the lists, in sorted order.
+                           Equal values are yielded in the order of the lists they come from.
+
+        Functionality:
+            Keeps the next value of each list in a heap, and repeatedly yields the smallest one
+            and replaces it with the following value from the same list: merging k lists with
+            n values overall takes O(n log k) time, and only O(k) extra memory.
+        """
+        heads = []
+        for index, values in enumerate(lists):
+            iterator = iter(values)
+            for value in iterator:
+                heads.append((_Smallest(value, index), iterator))
+                break
+        heap = Heap(heads, element_priority=lambda head: head[0])
+        while not heap.is_empty():
+            key, iterator = heap.top()
+            yield key._value
+            for following in iterator:
+                heap.insert((_Smallest(following, key._index), iterator))
+                break
@@ -0,0 +1,328 @@
+"""Module providing a sorted linked list with skip pointers, for logarithmic inserts, deletes and searches."""
+from __future__ import annotations
+import random
+from typing import Any, Iterable, List, Optional, Union
+from copy_policy import CopyPolicy
+from .sorted_singly_linked_list import SortedSinglyLinkedList
+
+class SortedSkipList(SortedSinglyLinkedList):
+    """ A sorted singly-linked list, with express lanes to skip over the nodes.
+
+    The nodes form the same sorted singly-linked list as in `SortedSinglyLinkedList` (level 0),
+    so iteration, `get`, `traverse` and the other read methods work unchanged. In addition, each
+    node is also linked, with probability `probability^k`, into the sparser lists of levels 1 to k:
+    searches start on the sparsest level and move down one level each time they would overshoot
+    the target, which takes O(log n) steps on average for `insert`, `delete` and membership tests.
+    """
+
+    class Node:
+        """
+        A node in a skip list, holding its successor on each of the levels it belongs to.
+
+        It has the same interface as `SinglyLinkedList.Node`, so that the methods inherited from
+        `SortedSinglyLinkedList` can walk the list, but its successor on level 0 is stored in
+        `_forward[0]`: nodes only have the `_data` and `_forward` slots.
+        """
+
+        __slots__ = ('_data', '_forward')
+
+        def __init__(self, data: Any, height: int) -> None:
+            """
+            Initialize a node with the given data, linked to no other node.
+
+            Parameters:
+                data (Any): The data to store in the node.
+                height (int): The number of levels the node belongs to.
+            """
+
+            self._data = data
+            self._forward = [None] * height
+
+
+        def __str__(self) -> str:
+            """
+            Return a string representation of the node's data.
+            """
+
+            return str(self._data)
+
+
+        def __repr__(self) -> str:
+            """
+            Return a string (internal) representation of the node's data.
+            """
+
+            return repr(self._data)
+
+
+        def data(self) -> Any:
+            """
+            Get the data stored in this node.
+
+            Returns:
+                Any: The data stored in this node.
+            """
+
+            return self._data
+
+
+        def next(self) -> Optional[SortedSkipList.Node]:
+            """
+            Return the next node on level 0, that is, the next node in sorted order.
+
+            Returns:
+                Node: The next node, or None if this is the last node.
+            """
+
+            return self._forward[0]
+
+
+        def has_next(self) -> bool:
+            """
+            Check if this node has a next node on level 0.
+
+            Returns:
+                bool: True if this node has a next node, False otherwise.
+            """
+
+            return self._forward[0] is not None
+
+
+        def append(self, next_node: Optional[SortedSkipList.Node]) -> None:
+            """
+            Set the next node on level 0.
+
+            Parameters:
+                next_node (Node): The next node to link to this node.
+            """
+
+            self._forward[0] = next_node
+
+
+        def height(self) -> int:
+            """
+            Return the number of levels the node belongs to.
+            """
+
+            return len(self._forward)
+
+
+    def __init__(self, probability: float = 0.5, max_level: int = 32, seed: Optional[int] = None,
+                 copy_policy: Union[CopyPolicy, str] = CopyPolicy.DEEP) -> None:
+        """
+        Initialize an empty skip list.
+
+        Parameters:
+            probability (float, optional): The probability that a node on level k is also linked on
+                                           level k+1. Lower values use less memory, higher values
+                                           make searches shorter. Defaults to 0.5.
+            max_level (int, optional): The maximum number of levels. Defaults to 32, enough for
+                                       about 2^32 elements with the default probability.
+            seed (int, optional): The seed for the generator of node heights, to get the same
+                                  structure on every run. Defaults to None, for a random seed.
+            copy_policy (Union[CopyPolicy, str], optional): How `get` returns the stored data.
+                                                            Defaults to CopyPolicy.DEEP.
+
+        Error Handling:
+            Raises a ValueError if `probability` is not strictly between 0 and 1, or if `max_level`
+            is not positive.
+        """
+
+        if not 0 < probability < 1:
+            raise ValueError(f'Invalid probability (must be between 0 and 1): {probability}')
+        if max_level <= 0:
+            raise ValueError(f'Invalid number of levels (must be positive): {max_level}')
+        super().__init__(copy_policy)
+        self._probability = probability
+        self._max_level = max_level
+        self._random = random.Random(seed)
+        # A sentinel node, before the first node, on all levels
+        self._header = SortedSkipList.Node(None, max_level)
+        # The number of levels with at least one node (at least 1)
+        self._level = 1
+
+
+    def __repr__(self) -> str:
+        """
+        Return the string (internal) representation of the skip list.
+
+        Parameters:
+            None
+
+        Returns:
+            str: The string representation of the skip list nodes.
+        """
+
+        return f'SortedSkipList({"->".join(self.itraverse(repr))})'
+
+
+    def __contains__(self, target: Any) -> bool:
+        """
+        Check if a value is in the list, in O(log n) expected time.
+
+        Parameters:
+            target (Any): The value to search for.
+
+        Returns:
+            bool: True if the value is in the list, False otherwise.
+        """
+
+        return self._search(target) is not None
+
+
+    def _random_height(self) -> int:
+        """
+        Draw the number of levels of a new node: each level is added with probability `probability`.
+        """
+
+        height = 1
+        while height < self._max_level and self._random.random() < self._probability:
+            height += 1
+        return height
+
+
+    def _predecessors(self, target: Any) -> List[SortedSkipList.Node]:
+        """
+        Find, on each level in use, the last node holding a value smaller than `target`.
+
+        Parameters:
+            target (Any): The value to search for.
+
+        Returns:
+            List[Node]: For each level, from 0 up, the last node before `target` (possibly the header).
+        """
+
+        predecessors = [self._header] * self._level
+        node = self._header
+        for level in range(self._level - 1, -1, -1):
+            following = node._forward[level]
+            while following is not None and following._data < target:
+                node = following
+                following = node._forward[level]
+            predecessors[level] = node
+        return predecessors
+
+
+    def insert(self, new_data: Any) -> None:
+        """
+        Insert a new value into the sorted list, in O(log n) expected time.
+
+        Parameters:
+            new_data (Any): The new data value to insert.
+
+        Returns:
+            None
+
+        Functionality:
+            Like in `SortedSinglyLinkedList`, the new value goes before the values equal to it.
+        """
+
+        predecessors = self._predecessors(new_data)
+        height = self._random_height()
+        if height > self._level:
+            predecessors.extend([self._header] * (height - self._level))
+            self._level = height
+        new_node = SortedSkipList.Node(new_data, height)
+        for level in range(height):
+            previous = predecessors[level]
+            new_node._forward[level] = previous._forward[level]
+            previous._forward[level] = new_node
+        if new_node.next() is None:
+            self._tail = new_node
+        self._head = self._header.next()
+        self._size += 1
+
+
+    def insert_sorted_batch(self, values: Iterable[Any]) -> None:
+        """
+        Insert a batch of values into the sorted list.
+
+        Parameters:
+            values (Iterable): The values to insert, in any order.
+
+        Returns:
+            None
+
+        Functionality:
+            Inserts the values one by one: each insert already takes O(log n) expected time,
+            and a single merge pass would have to rebuild the express levels anyway.
+        """
+
+        for new_data in values:
+            self.insert(new_data)
+
+
+    def _search(self, target: Any) -> Optional[SortedSkipList.Node]:
+        """
+        Search the list for a node with the data matching `target`, in O(log n) expected time.
+
+        Parameters:
+        - target (Any): The data to search for in the list.
+
+        Returns:
+        - Optional[Node]: The first node containing the target data if found,
+                            otherwise None.
+        """
+
+        candidate = self._predecessors(target)[0].next()
+        if candidate is not None and candidate.data() == target:
+            return candidate
+        return None
+
+
+    def delete(self, target: Any) -> None:
+        """
+        Delete the first node with the given data from the list, in O(log n) expected time.
+
+        Parameters:
+            target (Any): The data value to delete from the list.
+
+        Returns:
+            None
+
+        Error Handling:
+            If no match is found, raises a ValueError.
+        """
+
+        predecessors = self._predecessors(target)
+        node = predecessors[0].next()
+        if node is None or node.data() != target:
+            raise ValueError(f'No element with value {target} was found in the list.')
+        self._unlink(node, predecessors)
+
+
+    def delete_from_front(self) -> Any:
+        """
+        Delete the first node in the list and return the data it held.
+
+        Parameters:
+            None
+
+        Returns:
+            The data held by the node that was deleted from the front.
+
+        Error Handling:
+            If the list is empty, raises a ValueError.
+        """
+
+        if self.is_empty():
+            raise ValueError('Delete on an empty list.')
+        node = self._head
+        # The first node is the first one on each of its levels
+        self._unlink(node, [self._header] * node.height())
+        return node.data()
+
+
+    def _unlink(self, node: SortedSkipList.Node, predecessors: List[SortedSkipList.Node]) -> None:
+        """
+        Remove a node from all its levels, given its predecessor on each of them.
+        """
+
+        for level in range(node.height()):
+            predecessors[level]._forward[level] = node._forward[level]
+        if node is self._tail:
+            self._tail = None if predecessors[0] is self._header else predecessors[0]
+        while self._level > 1 and self._header._forward[self._level - 1] is None:
+            self._level -= 1
+        self._head = self._header.next()
+        self._size -= 1
@@ -0,0 +1,92 @@
+"""Module providing lazy, streaming traversals shared by the linked lists."""
+from __future__ import annotations
+import itertools
+from typing import Any, Callable, Iterator
+
+
+class StreamingMixin:
+    """
+    Lazy traversals for any container that iterates over its values, from the first to the last.
+
+    Each method returns an iterator that visits the nodes one at a time, as it is consumed:
+    no intermediate list is built, and the methods that can stop early (`take_while`, `first_n`)
+    don't visit the nodes after the last value they yield.
+    """
+
+    def itraverse(self, functor: Callable[..., Any]) -> Iterator[Any]:
+        """
+        Lazily traverse the list and apply a function to each node's data.
+
+        Parameters:
+            functor (Callable): The function (or functor) to apply to each node's data.
+
+        Returns:
+            Iterator[Any]: An iterator yielding the result of applying the function to each
+                           node's data, one node at a time, without building a list.
+        """
+
+        return map(functor, self)
+
+
+    def map(self, functor: Callable[..., Any]) -> Iterator[Any]:
+        """
+        Lazily apply a function to each node's data: the same as `itraverse`.
+
+        Parameters:
+            functor (Callable): The function (or functor) to apply to each node's data.
+
+        Returns:
+            Iterator[Any]: An iterator yielding the results, from the head to the tail.
+        """
+
+        return self.itraverse(functor)
+
+
+    def filter(self, predicate: Callable[..., Any]) -> Iterator[Any]:
+        """
+        Lazily select the elements matching a predicate.
+
+        Parameters:
+            predicate (Callable): The predicate function to evaluate node data against.
+
+        Returns:
+            Iterator[Any]: An iterator yielding, from the head to the tail, the elements
+                           for which predicate(element) is True.
+        """
+
+        return filter(predicate, self)
+
+
+    def take_while(self, predicate: Callable[..., Any]) -> Iterator[Any]:
+        """
+        Lazily yield the elements from the head of the list, as long as they match a predicate.
+
+        Parameters:
+            predicate (Callable): The predicate function to evaluate node data against.
+
+        Returns:
+            Iterator[Any]: An iterator yielding the elements before the first one for which
+                           predicate(element) is False. The nodes after that one are never visited.
+        """
+
+        return itertools.takewhile(predicate, self)
+
+
+    def first_n(self, n: int) -> Iterator[Any]:
+        """
+        Lazily yield the first `n` elements of the list.
+
+        Parameters:
+            n (int): The maximum number of elements to yield.
+
+        Returns:
+            Iterator[Any]: An iterator yielding the first `n` elements, or all of them if the
+                           list is shorter. The nodes after them are never visited.
+
+        Error Handling:
+            Raises a ValueError if `n` is negative.
+        """
+
+        if n < 0:
+            raise ValueError(f'Invalid number of elements (must be non-negative): {n}')
+        return itertools.islice(self, n)
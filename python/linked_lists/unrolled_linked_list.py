@@ -0,0 +1,454 @@
+"""Module providing an unrolled linked list: a linked list of blocks, each holding many values in a typed array."""
+from __future__ import annotations
+import array
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
+from arrays.core import Array
+from linked_lists.streaming import StreamingMixin
+
+class UnrolledLinkedList(StreamingMixin):
+    """ A singly-linked list whose nodes each store up to `block_capacity` values in a `core.Array`.
+
+    Storing the values in typed arrays, instead of one Python object per node, saves the memory of
+    the nodes and of the boxed values, and keeps neighbouring values next to each other in memory:
+    iteration reads whole blocks, and indexed access skips over whole blocks at a time.
+    The lazy traversals of `StreamingMixin` (`map`, `filter`, `take_while`, `first_n`) walk the
+    list one block at a time too.
+    Every block but the last is kept at least half full: a full block is split in two when a value
+    is inserted in its middle, and a block that falls below half after a delete is merged with
+    the next block, or takes values from it.
+    """
+
+    class Node:
+        """A block of values in an unrolled linked list."""
+
+        __slots__ = ('_block', '_count', '_next')
+
+        def __init__(self, capacity: int, typecode: str) -> None:
+            """
+            Initialize an empty block, linked to no other node.
+
+            Parameters:
+                capacity (int): The maximum number of values in the block.
+                typecode (str): The typecode of the values.
+            """
+
+            self._block = Array(capacity, typecode)
+            self._count = 0
+            self._next = None
+
+
+        def __repr__(self) -> str:
+            """
+            Return the string (internal) representation of the node.
+
+            Returns:
+                str: The string representation of the values in the block.
+            """
+
+            return repr(self.values().tolist())
+
+
+        def values(self) -> array.array:
+            """
+            Return a copy of the values in the block.
+
+            Returns:
+                array.array: The values stored in the block, in order.
+            """
+
+            return self._block[:self._count]
+
+
+        def count(self) -> int:
+            """
+            Return the number of values in the block.
+            """
+
+            return self._count
+
+
+        def next(self) -> Optional[UnrolledLinkedList.Node]:
+            """
+            Return the next node in the list.
+
+            Returns:
+                Node: The next node, or None if this is the last node.
+            """
+
+            return self._next
+
+
+        def _insert_at(self, offset: int, data: Union[int, float]) -> None:
+            """
+            Insert a value at a position in the block, shifting the following values right.
+            The block must not be full.
+            """
+
+            self._block.copy_from(self._block, offset, offset + 1, self._count - offset)
+            self._block[offset] = data
+            self._count += 1
+
+
+        def _delete_at(self, offset: int) -> None:
+            """
+            Delete the value at a position in the block, shifting the following values left.
+            """
+
+            self._block.copy_from(self._block, offset + 1, offset, self._count - offset - 1)
+            self._count -= 1
+
+
+    def __init__(self, block_capacity: int = 64, typecode: str = 'l') -> None:
+        """
+        Initialize an empty unrolled linked list.
+
+        Parameters:
+            block_capacity (int, optional): The maximum number of values in each node. Defaults to 64.
+            typecode (str, optional): The typecode of the values, as in `core.Array`. Defaults to 'l' for int.
+
+        Error Handling:
+            Raises a ValueError if `block_capacity` is smaller than 2.
+        """
+
+        if block_capacity < 2:
+            raise ValueError(f'Invalid block capacity (must be at least 2): {block_capacity}')
+        self._block_capacity = block_capacity
+        self._typecode = typecode
+        self._head = None
+        self._tail = None
+        self._size = 0
+
+
+    def __len__(self) -> int:
+        """
+        Return the length of the linked list.
+
+        Parameters:
+            None
+
+        Returns:
+            int: The number of values in the linked list.
+        """
+
+        return self._size
+
+
+    def __repr__(self) -> str:
+        """
+        Return the string (internal) representation of the linked list.
+
+        Parameters:
+            None
+
+        Returns:
+            str: The string representation of the linked list blocks.
+        """
+
+        return f'UnrolledLinkedList({"->".join(repr(node) for node in self._nodes())})'
+
+
+    def __str__(self) -> str:
+        """
+        Return the string representation of the linked list.
+
+        Parameters:
+            None
+
+        Returns:
+            str: The values in the list, joined with '->'.
+        """
+
+        return '->'.join(self.itraverse(str))
+
+
+    def __iter__(self) -> Iterator[Union[int, float]]:
+        """
+        Iterate over the values in the linked list, from the head to the tail.
+
+        Parameters:
+            None
+
+        Functionality:
+            Copies each block with a single slice, then yields its values.
+        """
+
+        for node in self._nodes():
+            yield from node.values()
+
+
+    def traverse(self, functor: Callable[..., Any]) -> List[Any]:
+        """
+        Traverse the linked list and apply a function to each value.
+
+        Parameters:
+            functor (Callable): The function (or functor) to apply to each value.
+
+        Returns:
+            List[Any]: A list containing the result of applying the function
+                    to each value.
+        """
+
+        result = []
+        for node in self._nodes():
+            result.extend(map(functor, node.values()))
+        return result
+
+
+    def itraverse(self, functor: Callable[..., Any]) -> Iterator[Any]:
+        """
+        Lazily traverse the linked list and apply a function to each value.
+
+        Parameters:
+            functor (Callable): The function (or functor) to apply to each value.
+
+        Returns:
+            Iterator[Any]: A generator yielding the result of applying the function to each
+                           value, one block at a time, without building a list.
+        """
+
+        for node in self._nodes():
+            yield from map(functor, node.values())
+
+
+    def _nodes(self) -> Iterator[UnrolledLinkedList.Node]:
+        """
+        Iterate over the nodes in the list, from the head to the tail.
+        """
+
+        node = self._head
+        while node is not None:
+            following = node._next
+            yield node
+            node = following
+
+
+    def _new_node(self) -> UnrolledLinkedList.Node:
+        """
+        Create an empty node, with the capacity and typecode of this list.
+        """
+
+        return UnrolledLinkedList.Node(self._block_capacity, self._typecode)
+
+
+    def size(self) -> int:
+        """
+        Return the length of the linked list.
+
+        Parameters:
+            None
+
+        Returns:
+            int: The number of values in the linked list.
+        """
+
+        return self._size
+
+
+    def is_empty(self) -> bool:
+        """
+        Check if the linked list is empty.
+
+        Parameters:
+            None
+
+        Returns:
+            bool: True if the linked list is empty, False otherwise.
+        """
+
+        return self._size == 0
+
+
+    def insert_in_front(self, data: Union[int, float]) -> None:
+        """
+        Add a value to the beginning of the list.
+
+        Parameters:
+            data (Union[int, float]): The value to add.
+
+        Functionality:
+            Shifts the values in the first block right, with a single slice move, after splitting
+            the block if it's full.
+        """
+
+        if self._head is None:
+            self._head = self._tail = self._new_node()
+        elif self._head._count == self._block_capacity:
+            self._split(self._head)
+        self._head._insert_at(0, data)
+        self._size += 1
+
+
+    def insert_to_back(self, data: Union[int, float]) -> None:
+        """
+        Append a value to the end of the list, in constant time.
+
+        Parameters:
+            data (Union[int, float]): The value to append.
+
+        Functionality:
+            If the last block is full, a new block is linked after it.
+        """
+
+        if self._tail is None or self._tail._count == self._block_capacity:
+            node = self._new_node()
+            if self._tail is None:
+                self._head = node
+            else:
+                self._tail._next = node
+            self._tail = node
+        self._tail._block[self._tail._count] = data
+        self._tail._count += 1
+        self._size += 1
+
+
+    def insert(self, index: int, data: Union[int, float]) -> None:
+        """
+        Insert a value at the given index.
+
+        Parameters:
+            index (int): The position of the new value, between 0 and the length of the list.
+            data (Union[int, float]): The value to insert.
+
+        Functionality:
+            Finds the block holding the index, skipping over whole blocks. If that block is full,
+            it is split: the second half of its values is moved to a new block linked after it.
+
+        Error Handling:
+            Raises an IndexError if index is invalid.
+        """
+
+        if index < 0 or index > self._size:
+            raise IndexError('Index out of bounds')
+        if index == self._size:
+            self.insert_to_back(data)
+            return
+        node, offset = self._locate(index)
+        if node._count == self._block_capacity:
+            half = self._split(node)
+            if offset > half:
+                node = node._next
+                offset -= half
+        node._insert_at(offset, data)
+        self._size += 1
+
+
+    def _split(self, node: UnrolledLinkedList.Node) -> int:
+        """
+        Move the second half of the values of a node to a new node, linked after it.
+
+        Returns:
+            int: The number of values left in the first node.
+        """
+
+        half = node._count // 2
+        new_node = self._new_node()
+        new_node._block.copy_from(node._block, half, 0, node._count - half)
+        new_node._count = node._count - half
+        node._count = half
+        new_node._next = node._next
+        node._next = new_node
+        if node is self._tail:
+            self._tail = new_node
+        return half
+
+
+    def _locate(self, index: int) -> Tuple[UnrolledLinkedList.Node, int]:
+        """
+        Find the node holding the value at an index, and the position of the value in its block.
+        The index must be valid.
+        """
+
+        node = self._head
+        while index >= node._count:
+            index -= node._count
+            node = node._next
+        return node, index
+
+
+    def get(self, index: int) -> Union[int, float]:
+        """
+        Get the value at the given index.
+
+        Parameters:
+            index (int): The index of the element to retrieve, starting from the head of the list.
+
+        Returns:
+            Union[int, float]: The value at the given index.
+
+        Error Handling:
+            Raising an IndexError if index is invalid.
+        """
+
+        if index < 0:
+            raise IndexError("Index must be non-negative")
+        if index >= self._size:
+            raise IndexError("Index out of bounds")
+        node, offset = self._locate(index)
+        return node._block[offset]
+
+
+    def delete(self, target: Union[int, float]) -> None:
+        """
+        Delete the first occurrence of a value from the list.
+
+        Parameters:
+            target (Union[int, float]): The value to delete from the list.
+
+        Returns:
+            None
+
+        Functionality:
+            Removes the value from its block, shifting the following values left. If the block is
+            left less than half full, it's merged with the next block when their values fit in a
+            single block, otherwise it takes values from the start of the next block.
+
+        Error Handling:
+            If no match is found after full traversal, raises a ValueError.
+        """
+
+        previous = None
+        node = self._head
+        while node is not None:
+            values = node.values()
+            if target in values:
+                node._delete_at(values.index(target))
+                self._size -= 1
+                self._rebalance(previous, node)
+                return
+            previous = node
+            node = node._next
+        # If it gets here, it hasn't found the target
+        raise ValueError(f'No element with value {target} was found in the list.')
+
+
+    def _rebalance(self, previous: Optional[UnrolledLinkedList.Node], node: UnrolledLinkedList.Node) -> None:
+        """
+        Restore the minimum occupancy of a node after a delete, given its predecessor.
+        """
+
+        minimum = self._block_capacity // 2
+        following = node._next
+        if node._count >= minimum:
+            return
+        if following is not None:
+            if node._count + following._count <= self._block_capacity:
+                # Merge the next node into this one
+                node._block.copy_from(following._block, 0, node._count, following._count)
+                node._count += following._count
+                node._next = following._next
+                if following is self._tail:
+                    self._tail = node
+            else:
+                # Borrow values from the start of the next node
+                moved = minimum - node._count
+                node._block.copy_from(following._block, 0, node._count, moved)
+                node._count += moved
+                following._block.copy_from(following._block, moved, 0, following._count - moved)
+                following._count -= moved
+        elif node._count == 0:
+            # The last node is empty: unlink it
+            if previous is None:
+                self._head = None
+            else:
+                previous._next = None
+            self._tail = previous
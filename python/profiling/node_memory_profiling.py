@@ -0,0 +1,42 @@
+"""Measure the memory used by each node of the linked lists and of the binary search tree."""
+import tracemalloc
+
+from typing import Callable
+from linked_lists.singly_linked_list import SinglyLinkedList
+from linked_lists.doubly_linked_list import DoublyLinkedList
+from trees.bst import BinarySearchTree
+
+NODES = 100000
+
+
+def bytes_per_node(make_node: Callable[[int], object], nodes: int) -> float:
+    """Return the average number of bytes allocated to create a node (not counting its data)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [make_node(None) for _ in range(nodes)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Subtract the list holding the nodes: one pointer per node
+    return (after - before) / len(kept) - 8
+
+
+def unslotted(node_class: type) -> type:
+    """Return a copy of a node class without `__slots__`, whose instances store their attributes in a `__dict__`."""
+    slots = set(node_class.__slots__)
+    namespace = {key: value for key, value in node_class.__dict__.items()
+                 if key != '__slots__' and key not in slots}
+    return type(node_class.__name__, node_class.__bases__, namespace)
+
+
+if __name__ == '__main__':
+    # Run from the `python` folder with: python -m profiling.node_memory_profiling
+    node_classes = {
+        'SinglyLinkedList.Node': SinglyLinkedList.Node,
+        'DoublyLinkedList.Node': DoublyLinkedList.Node,
+        'BinarySearchTree.Node': BinarySearchTree.Node,
+    }
+    print(f'{"Node class":<24}{"with __dict__":>16}{"slotted":>10}')
+    for name, node_class in node_classes.items():
+        slotted_size = bytes_per_node(node_class, NODES)
+        dict_size = bytes_per_node(unslotted(node_class), NODES)
+        print(f'{name:<24}{dict_size:>16.1f}{slotted_size:>10.1f}')
@@ -1,15 +1,22 @@
 """Module providing an implementation for stack, using singly-linked lists to store the elements."""
 
-import copy
-from typing import Any
+from typing import Any, Union
+from copy_policy import CopyPolicy, apply_policy
 from linked_lists.singly_linked_list import SinglyLinkedList
 
 class Stack:
     """ A class modeling the stack container.
     """
-    def __init__(self) -> None:
+    def __init__(self, copy_policy: Union[CopyPolicy, str] = CopyPolicy.DEEP) -> None:
         """ Creates an empty stack.
+
+        Parameters:
+            copy_policy (Union[CopyPolicy, str], optional): How `peek` returns the value at the top of the stack:
+                                                            the value itself ('none'), a shallow copy ('shallow'),
+                                                            a deep copy ('deep') or a read-only view ('frozen').
+                                                            Defaults to CopyPolicy.DEEP.
         """
+        self._copy_policy = CopyPolicy(copy_policy)
         self._data = SinglyLinkedList()
 
 
@@ -113,13 +120,14 @@ class Stack:
             None
 
         Returns:
-            Any: The value at the top of the stack.
+            Any: The value at the top of the stack, copied or wrapped according to the copy policy
+                 of the stack (by default, a deep copy).
 
         Raises:
             ValueError: If the stack is empty.
         """
         if self.is_empty():
             raise ValueError("Cannot peek at an empty stack")
-        # We need to deepcopy the data from the list, otherwise
-        # anyone with a reference can change the underlying data.
-        return copy.deepcopy(self._data._head.data())
+        # Unless the policy is NONE, the value is copied or wrapped, so that
+        # callers can't change the data stored in the stack.
+        return apply_policy(self._copy_policy, self._data._head.data())
@@ -0,0 +1,81 @@
+import unittest
+from arrays.bitmap import Bitmap
+
+class TestBitmap(unittest.TestCase):
+    def test_init(self):
+        bitmap = Bitmap(10)
+        self.assertEqual(len(bitmap), 10)
+        self.assertFalse(any(bitmap[i] for i in range(10)))
+        with self.assertRaises(ValueError):
+            Bitmap(0)
+
+    def test_set_clear(self):
+        bitmap = Bitmap(12)
+        bitmap.set(0)
+        bitmap.set(9)
+        bitmap.set(11)
+        self.assertEqual([i for i in range(12) if bitmap[i]], [0, 9, 11])
+        bitmap.clear(9)
+        self.assertEqual([i for i in range(12) if bitmap[i]], [0, 11])
+        bitmap.clear_all()
+        self.assertEqual(bitmap.count(), 0)
+
+    def test_index_out_of_range(self):
+        bitmap = Bitmap(5)
+        with self.assertRaises(IndexError):
+            bitmap[5]
+        with self.assertRaises(IndexError):
+            bitmap.set(-1)
+        with self.assertRaises(IndexError):
+            bitmap.clear(5)
+
+    def test_count(self):
+        bitmap = Bitmap(20)
+        for i in (1, 3, 8, 15, 19):
+            bitmap.set(i)
+        self.assertEqual(bitmap.count(), 5)
+        self.assertEqual(bitmap.count(0), 0)
+        self.assertEqual(bitmap.count(2), 1)
+        self.assertEqual(bitmap.count(8), 2)
+        self.assertEqual(bitmap.count(9), 3)
+        self.assertEqual(bitmap.count(16), 4)
+        self.assertEqual(bitmap.count(20), 5)
+
+    def test_count_across_blocks(self):
+        bitmap = Bitmap(1000)
+        positions = [0, 5, 127, 128, 300, 511, 512, 999]
+        for i in positions:
+            bitmap.set(i)
+        # Setting a bit twice doesn't count it twice
+        bitmap.set(300)
+        for end in range(1001):
+            self.assertEqual(bitmap.count(end), sum(1 for i in positions if i < end))
+        bitmap.clear(128)
+        bitmap.clear(128)
+        self.assertEqual(bitmap.count(), 7)
+        self.assertEqual(bitmap.count(200), 3)
+
+    def test_select_clear(self):
+        bitmap = Bitmap(700)
+        set_bits = {1, 2, 3, 130, 256, 257, 699}
+        for i in set_bits:
+            bitmap.set(i)
+        cleared = [i for i in range(700) if i not in set_bits]
+        for k, index in enumerate(cleared):
+            self.assertEqual(bitmap.select_clear(k), index)
+        with self.assertRaises(IndexError):
+            bitmap.select_clear(len(cleared))
+        with self.assertRaises(IndexError):
+            bitmap.select_clear(-1)
+
+    def test_select_set(self):
+        bitmap = Bitmap(700)
+        set_bits = [1, 2, 3, 130, 256, 257, 699]
+        for i in set_bits:
+            bitmap.set(i)
+        for k, index in enumerate(set_bits):
+            self.assertEqual(bitmap.select_set(k), index)
+        with self.assertRaises(IndexError):
+            bitmap.select_set(len(set_bits))
+        with self.assertRaises(IndexError):
+            bitmap.select_set(-1)
@@ -3,6 +3,12 @@ from trees.bst import BinarySearchTree
 
 class TestBinarySearchTree(unittest.TestCase):
 
+    def test_node_slots(self):
+        node = BinarySearchTree.Node(1)
+        self.assertFalse(hasattr(node, '__dict__'))
+        with self.assertRaises(AttributeError):
+            node.extra = 1
+
     def test_repr(self):
         bst = BinarySearchTree()
         self.assertEqual(repr(bst), 'BinarySearchTree()')
@@ -0,0 +1,119 @@
+import unittest
+from copy_policy import CopyPolicy, ReadOnlyProxy, apply_policy, frozen_view
+
+class TestCopyPolicy(unittest.TestCase):
+    def test_policies(self):
+        value = [['a'], 1]
+        self.assertIs(apply_policy(CopyPolicy.NONE, value), value)
+        shallow = apply_policy(CopyPolicy.SHALLOW, value)
+        self.assertEqual(shallow, value)
+        self.assertIsNot(shallow, value)
+        self.assertIs(shallow[0], value[0])
+        deep = apply_policy(CopyPolicy.DEEP, value)
+        self.assertEqual(deep, value)
+        self.assertIsNot(deep[0], value[0])
+        self.assertIsInstance(apply_policy(CopyPolicy.FROZEN, value), ReadOnlyProxy)
+
+    def test_immutable_values(self):
+        for policy in CopyPolicy:
+            self.assertEqual(apply_policy(policy, 3), 3)
+            self.assertEqual(apply_policy(policy, 'abc'), 'abc')
+        self.assertIs(frozen_view(None), None)
+
+    def test_policy_names(self):
+        self.assertIs(CopyPolicy('frozen'), CopyPolicy.FROZEN)
+        with self.assertRaises(ValueError):
+            CopyPolicy('copy')
+
+
+class TestReadOnlyProxy(unittest.TestCase):
+    def test_reads(self):
+        value = {'a': [1, 2], 'b': 3}
+        view = frozen_view(value)
+        self.assertEqual(view, value)
+        self.assertEqual(len(view), 2)
+        self.assertIn('a', view)
+        self.assertEqual(view['a'], [1, 2])
+        self.assertEqual(view.get('b'), 3)
+        self.assertEqual(sorted(view), ['a', 'b'])
+        self.assertEqual(str(view), str(value))
+        self.assertEqual(repr(view), f'ReadOnlyProxy({value!r})')
+        # Changes to the wrapped object are visible through the view
+        value['b'] = 4
+        self.assertEqual(view['b'], 4)
+
+    def test_truth(self):
+        class Empty:
+            pass
+        self.assertTrue(frozen_view(Empty()))
+        self.assertFalse(frozen_view([]))
+        self.assertTrue(frozen_view([0]))
+        self.assertFalse(frozen_view({}))
+
+    def test_writes(self):
+        value = {'a': [1, 2]}
+        view = frozen_view(value)
+        with self.assertRaises(TypeError):
+            view['b'] = 1
+        with self.assertRaises(TypeError):
+            del view['a']
+        with self.assertRaises(TypeError):
+            view.update({'b': 1})
+        # Nested objects are read-only too
+        with self.assertRaises(TypeError):
+            view['a'].append(3)
+        with self.assertRaises(TypeError):
+            view['a'][0] = 0
+        self.assertEqual(value, {'a': [1, 2]})
+
+    def test_attributes(self):
+        class Point:
+            def __init__(self):
+                self.x = 1
+                self.tags = ['origin']
+        point = Point()
+        view = frozen_view(point)
+        self.assertEqual(view.x, 1)
+        with self.assertRaises(TypeError):
+            view.x = 2
+        with self.assertRaises(TypeError):
+            del view.x
+        with self.assertRaises(TypeError):
+            view.tags.append('new')
+        self.assertEqual(point.x, 1)
+
+    def test_mutating_special_methods(self):
+        value = [1, 2]
+        view = frozen_view(value)
+        for name in ('__iadd__', '__imul__', '__ior__'):
+            with self.assertRaises(TypeError):
+                getattr(view, name)
+        with self.assertRaises(TypeError):
+            view.__setitem__(0, 5)
+        with self.assertRaises(TypeError):
+            view.__delitem__(0)
+        # In-place operators rebind the name to a view of a new object
+        alias = view
+        alias += [3]
+        self.assertEqual(alias, [1, 2, 3])
+        self.assertEqual(value, [1, 2])
+
+    def test_operators(self):
+        view = frozen_view([1, [2]])
+        self.assertTrue(view < [2])
+        self.assertTrue(view <= [1, [2]])
+        self.assertFalse(view > frozen_view([1, [3]]))
+        self.assertTrue(view >= [1])
+        self.assertEqual(view + [3], [1, [2], 3])
+        self.assertEqual([0] + view, [0, 1, [2]])
+        self.assertEqual(2 * view, [1, [2], 1, [2]])
+        self.assertEqual(list(reversed(view)), [[2], 1])
+        # The results share nested objects, so they're read-only views too
+        self.assertIsInstance(view + [3], ReadOnlyProxy)
+        with self.assertRaises(TypeError):
+            (view * 2)[1].append(3)
+        items = frozen_view({1, 2})
+        self.assertEqual(items | {3}, {1, 2, 3})
+        self.assertEqual({2, 3} & items, {2})
+        self.assertEqual(items - {1}, {2})
+        self.assertEqual(items ^ {2, 3}, {1, 3})
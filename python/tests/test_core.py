@@ -1,3 +1,6 @@
+import os
+import pickle
+import tempfile
 import unittest
 from arrays.core import Array
 
@@ -94,3 +97,265 @@ class TestArray(unittest.TestCase):
         arr[1] = 2
         arr[3] = -2
         self.assertEqual(repr(arr), "array('l', [1, 2, 0, -2, 0])")
+
+
+    # slices
+
+    def test_get_slice(self):
+        """Test getting a range of values with a slice"""
+        arr = Array(5)
+        for i in range(5):
+            arr[i] = i * 10
+        self.assertEqual(list(arr[1:4]), [10, 20, 30])
+        self.assertEqual(list(arr[:]), [0, 10, 20, 30, 40])
+        self.assertEqual(list(arr[::2]), [0, 20, 40])
+        self.assertEqual(list(arr[4:2]), [])
+
+    def test_set_slice(self):
+        """Test overwriting a range of values with a slice"""
+        arr = Array(5)
+        arr[1:4] = [7, 8, 9]
+        self.assertEqual(list(arr[:]), [0, 7, 8, 9, 0])
+        arr = Array(3, 'd')
+        arr[0:2] = (1.5, 2.5)
+        self.assertEqual(list(arr[:]), [1.5, 2.5, 0.0])
+
+    def test_set_slice_invalid(self):
+        """Test that slice assignment can't change the size of the array"""
+        arr = Array(5)
+        with self.assertRaises(ValueError):
+            arr[1:3] = [1, 2, 3]
+        with self.assertRaises(ValueError):
+            arr[0:5] = []
+        self.assertEqual(len(arr), 5)
+
+    # typecode
+
+    def test_typecode(self):
+        """Test getting the typecode of the array"""
+        self.assertEqual(Array(5).typecode(), 'l')
+        self.assertEqual(Array(5, 'd').typecode(), 'd')
+
+    # copy_from
+
+    def test_copy_from(self):
+        """Test copying a range of values from another array"""
+        source = Array(4)
+        source[0:4] = [1, 2, 3, 4]
+        arr = Array(6)
+        arr.copy_from(source)
+        self.assertEqual(list(arr[:]), [1, 2, 3, 4, 0, 0])
+        arr.copy_from(source, 1, 3, 3)
+        self.assertEqual(list(arr[:]), [1, 2, 3, 2, 3, 4])
+
+    def test_copy_from_overlapping(self):
+        """Test shifting values within the same array"""
+        arr = Array(5)
+        arr[0:5] = [1, 2, 3, 4, 5]
+        arr.copy_from(arr, 1, 0, 4)
+        self.assertEqual(list(arr[:]), [2, 3, 4, 5, 5])
+        arr.copy_from(arr, 0, 1, 4)
+        self.assertEqual(list(arr[:]), [2, 2, 3, 4, 5])
+
+    def test_copy_from_invalid_range(self):
+        """Test copying with ranges out of bounds"""
+        arr = Array(3)
+        with self.assertRaises(IndexError):
+            arr.copy_from(Array(4))
+        with self.assertRaises(IndexError):
+            arr.copy_from(Array(3), 2, 0, 2)
+        with self.assertRaises(IndexError):
+            arr.copy_from(Array(3), 0, -1, 2)
+
+    # fill
+
+    def test_fill(self):
+        """Test setting a range of values to the same value"""
+        arr = Array(5)
+        arr.fill(3)
+        self.assertEqual(list(arr[:]), [3, 3, 3, 3, 3])
+        arr.fill(-1, 1, 3)
+        self.assertEqual(list(arr[:]), [3, -1, -1, 3, 3])
+        with self.assertRaises(IndexError):
+            arr.fill(0, 2, 6)
+
+    # as_memoryview
+
+    def test_as_memoryview(self):
+        """Test that the memoryview shares memory with the array"""
+        arr = Array(3)
+        view = arr.as_memoryview()
+        self.assertEqual(len(view), 3)
+        view[1] = 42
+        self.assertEqual(arr[1], 42)
+        arr[2] = -7
+        self.assertEqual(view[2], -7)
+        view.release()
+
+
+    # resize
+
+    def test_resize(self):
+        """Test growing and shrinking the array in place"""
+        arr = Array(3)
+        arr[0:3] = [1, 2, 3]
+        arr.resize(5)
+        self.assertEqual(len(arr), 5)
+        self.assertEqual(list(arr[:]), [1, 2, 3, 0, 0])
+        arr.resize(2)
+        self.assertEqual(len(arr), 2)
+        self.assertEqual(list(arr[:]), [1, 2])
+        with self.assertRaises(IndexError):
+            arr[2]
+        with self.assertRaises(ValueError):
+            arr.resize(0)
+
+    def test_resize_with_exported_view(self):
+        """Test that the array can't be resized while a memoryview is alive"""
+        arr = Array(3)
+        view = arr.as_memoryview()
+        with self.assertRaises(BufferError):
+            arr.resize(6)
+        view.release()
+        arr.resize(6)
+        self.assertEqual(len(arr), 6)
+
+    # file-backed arrays
+
+    def test_file_backed(self):
+        """Test creating and using an array backed by a file"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'array.bin')
+            arr = Array(4, 'q', path)
+            self.assertTrue(arr.is_file_backed())
+            self.assertEqual(os.path.getsize(path), 32)
+            self.assertEqual(arr[0], 0)
+            arr[1] = 2**40
+            arr[2:4] = [-3, 7]
+            self.assertEqual(arr[1], 2**40)
+            self.assertEqual(list(arr[:]), [0, 2**40, -3, 7])
+            self.assertEqual(repr(arr), f"array('q', [0, {2**40}, -3, 7])")
+            with self.assertRaises(IndexError):
+                arr[4]
+            arr.close()
+            self.assertFalse(Array(4).is_file_backed())
+
+    def test_file_backed_reopen(self):
+        """Test that the content of a file-backed array persists"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'array.bin')
+            arr = Array(3, 'd', path)
+            arr[0:3] = [1.5, -2.5, 3.25]
+            arr.close()
+
+            arr = Array.open(path, 'd')
+            self.assertEqual(len(arr), 3)
+            self.assertEqual(list(arr[:]), [1.5, -2.5, 3.25])
+            arr.close()
+
+            # Reopening with a larger size keeps the content
+            arr = Array(5, 'd', path)
+            self.assertEqual(list(arr[:]), [1.5, -2.5, 3.25, 0.0, 0.0])
+            arr.close()
+
+    def test_file_backed_resize(self):
+        """Test resizing a file-backed array"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'array.bin')
+            arr = Array(2, 'q', path)
+            arr[0:2] = [4, 5]
+            arr.resize(4)
+            self.assertEqual(list(arr[:]), [4, 5, 0, 0])
+            self.assertEqual(os.path.getsize(path), 32)
+            arr.resize(1)
+            self.assertEqual(list(arr[:]), [4])
+            arr.close()
+
+    def test_file_backed_invalid(self):
+        """Test invalid file-backed arrays"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'array.bin')
+            with self.assertRaises(ValueError):
+                Array(3, 'u', path)
+            with open(path, 'wb') as f:
+                f.write(b'123')
+            with self.assertRaises(ValueError):
+                Array.open(path, 'l')
+
+    # shared arrays
+
+    def test_shared(self):
+        """Test creating a shared array and attaching to it by name"""
+        arr = Array(4, 'q', shared=True)
+        self.assertTrue(arr.is_shared())
+        self.assertFalse(arr.is_file_backed())
+        arr[0:4] = [1, 2**40, -3, 7]
+        other = Array.attach(arr.name(), 'q', 4)
+        self.assertEqual(list(other[:]), [1, 2**40, -3, 7])
+        other[0] = 5
+        self.assertEqual(arr[0], 5)
+        self.assertEqual(repr(arr), f"array('q', [5, {2**40}, -3, 7])")
+        with self.assertRaises(IndexError):
+            other[4]
+        other.close()
+        self.assertEqual(arr[0], 5)
+        name = arr.name()
+        arr.close()
+        with self.assertRaises(FileNotFoundError):
+            Array.attach(name, 'q')
+        self.assertFalse(Array(4).is_shared())
+        self.assertIsNone(Array(4).name())
+
+    def test_shared_pickle(self):
+        """Test that pickling a shared array only pickles the name of its block"""
+        arr = Array(1000, 'd', shared=True)
+        arr[999] = 1.5
+        data = pickle.dumps(arr)
+        self.assertLess(len(data), 1000)
+        other = pickle.loads(data)
+        self.assertEqual(other.name(), arr.name())
+        self.assertEqual(other[999], 1.5)
+        other.close()
+        arr.close()
+        # In-memory arrays are still pickled with their elements
+        arr = Array(3)
+        arr[0:3] = [1, 2, 3]
+        self.assertEqual(list(pickle.loads(pickle.dumps(arr))[:]), [1, 2, 3])
+
+    def test_share(self):
+        """Test copying an array into shared memory"""
+        arr = Array(3, 'i')
+        arr[0:3] = [4, 5, 6]
+        shared = arr.share()
+        self.assertTrue(shared.is_shared())
+        self.assertEqual(shared.typecode(), 'i')
+        self.assertEqual(list(shared[:]), [4, 5, 6])
+        shared[0] = 0
+        self.assertEqual(arr[0], 4)
+        shared.close()
+
+    def test_shared_resize(self):
+        """Test resizing a shared array, which moves it to a new block"""
+        arr = Array(2, 'q', shared=True)
+        arr[0:2] = [4, 5]
+        name = arr.name()
+        arr.resize(4)
+        self.assertNotEqual(arr.name(), name)
+        self.assertEqual(list(arr[:]), [4, 5, 0, 0])
+        arr.resize(1)
+        self.assertEqual(list(arr[:]), [4])
+        arr.close()
+        with self.assertRaises(FileNotFoundError):
+            Array.attach(name, 'q')
+
+    def test_shared_invalid(self):
+        """Test invalid shared arrays"""
+        with self.assertRaises(ValueError):
+            Array(3, 'u', shared=True)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(ValueError):
+                Array(3, 'l', os.path.join(tmp_dir, 'array.bin'), shared=True)
+        arr = Array(2, 'q', shared=True)
+        with self.assertRaises(ValueError):
+            Array.attach(arr.name(), 'q', 1000)
+        arr.close()
@@ -0,0 +1,73 @@
+import unittest
+from bags.counting_bag import CountingBag
+
+class TestCountingBag(unittest.TestCase):
+
+    def test_init(self):
+        bag = CountingBag()
+        self.assertEqual(len(bag), 0)
+        self.assertTrue(bag.is_empty())
+        self.assertEqual(list(bag), [])
+
+
+    def test_insert_and_len(self):
+        bag = CountingBag()
+        bag.insert(1)
+        bag.insert(2)
+        bag.insert(2)
+        self.assertEqual(len(bag), 3)
+        bag.insert('a', times=10**9)
+        self.assertEqual(len(bag), 10**9 + 3)
+        self.assertFalse(bag.is_empty())
+
+        with self.assertRaises(ValueError):
+            bag.insert(1, times=0)
+        with self.assertRaises(ValueError):
+            bag.insert(1, times=-2)
+        self.assertEqual(len(bag), 10**9 + 3)
+
+
+    def test_count_and_distinct(self):
+        bag = CountingBag()
+        for value in [1, 2, 2, 3.14, 2]:
+            bag.insert(value)
+        bag.insert(1, times=4)
+        self.assertEqual(bag.count(1), 5)
+        self.assertEqual(bag.count(2), 3)
+        self.assertEqual(bag.count(3.14), 1)
+        self.assertEqual(bag.count('missing'), 0)
+        self.assertIn(2, bag)
+        self.assertNotIn('missing', bag)
+        self.assertSetEqual(bag.distinct(), {1, 2, 3.14})
+
+
+    def test_iter(self):
+        bag = CountingBag()
+        bag.insert('a', times=2)
+        bag.insert('b')
+        self.assertEqual(sorted(bag), ['a', 'a', 'b'])
+
+
+    def test_repr_and_str(self):
+        bag = CountingBag()
+        self.assertEqual(repr(bag), 'CountingBag({})')
+        self.assertEqual(str(bag), '')
+        bag.insert(1, times=2)
+        self.assertEqual(repr(bag), 'CountingBag({1: 2})')
+        self.assertEqual(str(bag), '1,1')
+
+
+    def test_most_common(self):
+        bag = CountingBag()
+        self.assertEqual(bag.most_common(3), [])
+        for value, times in [('a', 5), ('b', 1), ('c', 7), ('d', 3)]:
+            bag.insert(value, times)
+        self.assertEqual(bag.most_common(2), [('c', 7), ('a', 5)])
+        self.assertEqual(bag.most_common(), [('c', 7), ('a', 5), ('d', 3), ('b', 1)])
+        self.assertEqual(bag.most_common(10), bag.most_common())
+        self.assertEqual(bag.most_common(0), [])
+        with self.assertRaises(ValueError):
+            bag.most_common(-1)
+        # Reads don't change the bag
+        self.assertEqual(bag.count('c'), 7)
+        self.assertEqual(len(bag), 16)
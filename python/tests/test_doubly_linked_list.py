@@ -1,4 +1,5 @@
 import unittest
+from copy_policy import CopyPolicy
 from linked_lists.doubly_linked_list import DoublyLinkedList
 
 class TestDoublyLinkedList(unittest.TestCase):
@@ -66,6 +67,36 @@ class TestDoublyLinkedList(unittest.TestCase):
         self.assertEqual(list(linked_list), expected)
 
 
+    def test_streaming(self):
+        linked_list = DoublyLinkedList()
+        self.assertEqual(list(linked_list.itraverse(str)), [])
+        self.assertEqual(list(linked_list.first_n(3)), [])
+        for value in [1, 2, 3, 4, 5, 6]:
+            linked_list.insert_to_back(value)
+
+        stream = linked_list.itraverse(lambda x: x * 10)
+        self.assertNotIsInstance(stream, list)
+        self.assertEqual(next(stream), 10)
+        self.assertEqual(list(stream), [20, 30, 40, 50, 60])
+        self.assertEqual(list(linked_list.map(str)), ['1', '2', '3', '4', '5', '6'])
+        self.assertEqual(list(linked_list.filter(lambda x: x % 2 == 0)), [2, 4, 6])
+        self.assertEqual(list(linked_list.take_while(lambda x: x < 4)), [1, 2, 3])
+        self.assertEqual(list(linked_list.take_while(lambda x: x > 4)), [])
+        self.assertEqual(list(linked_list.first_n(2)), [1, 2])
+        self.assertEqual(list(linked_list.first_n(0)), [])
+        self.assertEqual(list(linked_list.first_n(10)), [1, 2, 3, 4, 5, 6])
+        with self.assertRaises(ValueError):
+            linked_list.first_n(-1)
+
+        # Streams stop visiting nodes as soon as they are done
+        visited = []
+        def below_three(x):
+            visited.append(x)
+            return x < 3
+        self.assertEqual(list(linked_list.take_while(below_three)), [1, 2])
+        self.assertEqual(visited, [1, 2, 3])
+
+
     def test_size(self):
         linked_list = DoublyLinkedList()
         self.assertEqual(linked_list.size(), 0)
@@ -153,6 +184,31 @@ class TestDoublyLinkedList(unittest.TestCase):
         retrieved[0].append('c')
         self.assertEqual(linked_list.get(0), [['a', 'b'], 1, 2])
 
+    def test_get_copy_policies(self):
+        data = [['a', 'b'], 1]
+        linked_list = DoublyLinkedList(copy_policy='none')
+        linked_list.insert_in_front(data)
+        self.assertIs(linked_list.get(0), data)
+
+        linked_list = DoublyLinkedList(copy_policy=CopyPolicy.SHALLOW)
+        linked_list.insert_in_front(data)
+        retrieved = linked_list.get(0)
+        self.assertIsNot(retrieved, data)
+        self.assertIs(retrieved[0], data[0])
+
+        linked_list = DoublyLinkedList(copy_policy=CopyPolicy.FROZEN)
+        linked_list.insert_in_front(data)
+        retrieved = linked_list.get(0)
+        self.assertEqual(retrieved, data)
+        with self.assertRaises(TypeError):
+            retrieved.append(3)
+        with self.assertRaises(TypeError):
+            retrieved[0].append('c')
+        self.assertEqual(data, [['a', 'b'], 1])
+
+        with self.assertRaises(ValueError):
+            DoublyLinkedList(copy_policy='unknown')
+
 
     def test_internal_search(self):
         linked_list = DoublyLinkedList()
@@ -359,6 +415,153 @@ class TestDoublyLinkedList(unittest.TestCase):
         self.assertIsNone(linked_list._tail.next())
 
 
+    def assert_links(self, linked_list, values):
+        """Check the values of a list, walking it both forward and backward."""
+        self.assertEqual(list(linked_list), values)
+        backward = []
+        node = linked_list._tail
+        while node is not None:
+            backward.append(node.data())
+            node = node.prev()
+        self.assertEqual(backward, values[::-1])
+        if not values:
+            self.assertIsNone(linked_list._head)
+
+    def test_from_iterable(self):
+        self.assert_links(DoublyLinkedList.from_iterable([1, 2, 3]), [1, 2, 3])
+        self.assert_links(DoublyLinkedList.from_iterable([]), [])
+        linked_list = DoublyLinkedList.from_iterable(range(2), copy_policy='none')
+        self.assertEqual(linked_list._copy_policy, CopyPolicy.NONE)
+
+    def test_extend(self):
+        linked_list = DoublyLinkedList()
+        linked_list.extend([])
+        self.assert_links(linked_list, [])
+        linked_list.extend([1, 2])
+        self.assert_links(linked_list, [1, 2])
+        linked_list.extend(x for x in [3, 4])
+        self.assert_links(linked_list, [1, 2, 3, 4])
+
+    def test_splice(self):
+        linked_list = DoublyLinkedList.from_iterable([1, 2])
+        other = DoublyLinkedList.from_iterable([3, 4])
+        linked_list.splice(other)
+        self.assert_links(linked_list, [1, 2, 3, 4])
+        self.assert_links(other, [])
+
+        # Splicing an empty list, or into an empty list
+        linked_list.splice(other)
+        self.assert_links(linked_list, [1, 2, 3, 4])
+        other.splice(linked_list)
+        self.assert_links(other, [1, 2, 3, 4])
+        self.assert_links(linked_list, [])
+
+        with self.assertRaises(ValueError):
+            other.splice(other)
+
+    def test_splice_after(self):
+        linked_list = DoublyLinkedList.from_iterable([1, 4])
+        linked_list.splice(DoublyLinkedList.from_iterable([2, 3]), linked_list._search(1))
+        self.assert_links(linked_list, [1, 2, 3, 4])
+        linked_list.splice(DoublyLinkedList.from_iterable([5]), linked_list._search(4))
+        self.assert_links(linked_list, [1, 2, 3, 4, 5])
+
+    def test_concat(self):
+        lists = [DoublyLinkedList.from_iterable(values) for values in [[1], [], [2, 3], [4]]]
+        result = DoublyLinkedList.concat(*lists)
+        self.assert_links(result, [1, 2, 3, 4])
+        for linked_list in lists:
+            self.assert_links(linked_list, [])
+        self.assert_links(DoublyLinkedList.concat(), [])
+
+    def test_split_at(self):
+        linked_list = DoublyLinkedList.from_iterable([1, 2, 3, 4])
+        tail = linked_list.split_at(linked_list._search(3))
+        self.assert_links(linked_list, [1, 2])
+        self.assert_links(tail, [3, 4])
+
+        # Splitting at the tail, then at the head
+        last = tail.split_at(tail._search(4))
+        self.assert_links(tail, [3])
+        self.assert_links(last, [4])
+        everything = linked_list.split_at(linked_list._search(1))
+        self.assert_links(linked_list, [])
+        self.assert_links(everything, [1, 2])
+
+
+    def test_insert_returns_handle(self):
+        linked_list = DoublyLinkedList()
+        second = linked_list.insert_in_front(2)
+        first = linked_list.insert_in_front(1)
+        third = linked_list.insert_to_back(3)
+        self.assertEqual([first.data(), second.data(), third.data()], [1, 2, 3])
+        self.assertIs(linked_list._head, first)
+        self.assertIs(linked_list._tail, third)
+
+    def test_delete_node(self):
+        linked_list = DoublyLinkedList()
+        nodes = [linked_list.insert_to_back(value) for value in [1, 2, 3, 4]]
+        self.assertEqual(linked_list.delete_node(nodes[1]), 2)
+        self.assert_links(linked_list, [1, 3, 4])
+        self.assertEqual(linked_list.delete_node(nodes[0]), 1)
+        self.assert_links(linked_list, [3, 4])
+        self.assertEqual(linked_list.delete_node(nodes[3]), 4)
+        self.assert_links(linked_list, [3])
+        self.assertEqual(linked_list.delete_node(nodes[2]), 3)
+        self.assert_links(linked_list, [])
+
+        # Deleting a node twice
+        with self.assertRaises(ValueError):
+            linked_list.delete_node(nodes[1])
+
+    def test_handles_after_delete_from_ends(self):
+        linked_list = DoublyLinkedList()
+        nodes = [linked_list.insert_to_back(value) for value in [1, 2, 3]]
+        self.assertEqual(linked_list.delete_from_back(), 3)
+        self.assertIsNone(nodes[2].prev())
+        self.assertIsNone(nodes[2].next())
+        with self.assertRaises(ValueError):
+            linked_list.move_to_front(nodes[2])
+        with self.assertRaises(ValueError):
+            linked_list.delete_node(nodes[2])
+        self.assert_links(linked_list, [1, 2])
+
+        self.assertEqual(linked_list.delete_from_front(), 1)
+        self.assertIsNone(nodes[0].next())
+        with self.assertRaises(ValueError):
+            linked_list.move_to_back(nodes[0])
+        with self.assertRaises(ValueError):
+            linked_list.delete_node(nodes[0])
+        self.assert_links(linked_list, [2])
+
+        self.assertEqual(linked_list.delete_from_back(), 2)
+        self.assert_links(linked_list, [])
+        with self.assertRaises(ValueError):
+            linked_list.delete_node(nodes[1])
+
+    def test_move_to_front_and_back(self):
+        linked_list = DoublyLinkedList()
+        nodes = [linked_list.insert_to_back(value) for value in [1, 2, 3, 4]]
+        linked_list.move_to_front(nodes[2])
+        self.assert_links(linked_list, [3, 1, 2, 4])
+        linked_list.move_to_front(nodes[2])
+        self.assert_links(linked_list, [3, 1, 2, 4])
+        linked_list.move_to_front(nodes[3])
+        self.assert_links(linked_list, [4, 3, 1, 2])
+        linked_list.move_to_back(nodes[3])
+        self.assert_links(linked_list, [3, 1, 2, 4])
+        linked_list.move_to_back(nodes[0])
+        self.assert_links(linked_list, [3, 2, 4, 1])
+        linked_list.move_to_back(nodes[0])
+        self.assert_links(linked_list, [3, 2, 4, 1])
+
+        # Handles stay valid after moves
+        linked_list.delete_node(nodes[1])
+        self.assert_links(linked_list, [3, 4, 1])
+        with self.assertRaises(ValueError):
+            linked_list.move_to_front(nodes[1])
+
+
 class TestNode(unittest.TestCase):
 
     def test_init(self):
@@ -367,6 +570,12 @@ class TestNode(unittest.TestCase):
         self.assertEqual(node.data(), data)
         self.assertIsNone(node.next())
 
+    def test_slots(self):
+        node = DoublyLinkedList.Node('test')
+        self.assertFalse(hasattr(node, '__dict__'))
+        with self.assertRaises(AttributeError):
+            node.extra = 1
+
     def test_str(self):
         data = 'test'
         node = DoublyLinkedList.Node(data)
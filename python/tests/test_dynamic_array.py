@@ -1,5 +1,9 @@
+import os
+import pickle
+import tempfile
 import unittest
 from arrays.dynamic_array import DynamicArray
+from arrays.persistence import HEADER
 
 class TestDynamicArray(unittest.TestCase):
     # __init__
@@ -338,3 +342,235 @@ class TestDynamicArray(unittest.TestCase):
         array.delete(3)
         self.assertEqual(len(array), 0)
         self.assertEqual(array._capacity, 1)
+
+    # file-backed
+
+    def test_file_backed(self):
+        """Test a dynamic array stored in a memory-mapped file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'array.bin')
+            array = DynamicArray(typecode='q', path=path)
+            for value in range(10):
+                array.insert(value)
+            self.assertEqual(array._capacity, 16)
+            self.assertEqual(os.path.getsize(path), HEADER.size + 16 * 8)
+            self.assertEqual(list(array), list(range(10)))
+            for value in range(8):
+                array.delete(value)
+            self.assertEqual(array._capacity, 4)
+            self.assertEqual(os.path.getsize(path), HEADER.size + 4 * 8)
+            self.assertEqual(repr(array), "array('q', [8, 9])")
+            array.close()
+            # The file is never overwritten by a new array, and can be reopened
+            with self.assertRaises(FileExistsError):
+                DynamicArray(typecode='q', path=path)
+            array = DynamicArray.open(path)
+            self.assertEqual(repr(array), "array('q', [8, 9])")
+            self.assertEqual(array.capacity(), 4)
+            array.extend([10, 11, 12])
+            array.close()
+            array = DynamicArray.open(path)
+            self.assertEqual(list(array), [8, 9, 10, 11, 12])
+            self.assertEqual(os.path.getsize(path), HEADER.size + 8 * 8)
+            array.close()
+
+    # growth policy
+
+    def test_init_invalid_growth_policy(self):
+        """Test initializing with an invalid growth factor or shrink ratio."""
+        with self.assertRaises(ValueError):
+            DynamicArray(growth_factor=1)
+        with self.assertRaises(ValueError):
+            DynamicArray(shrink_ratio=-0.1)
+        with self.assertRaises(ValueError):
+            DynamicArray(growth_factor=2, shrink_ratio=0.5)
+
+    def test_growth_factor(self):
+        """Test that the capacity grows by the growth factor."""
+        array = DynamicArray(4, 'i', growth_factor=1.5)
+        for value in range(5):
+            array.insert(value)
+        self.assertEqual(array.capacity(), 6)
+        array.insert(5)
+        array.insert(6)
+        self.assertEqual(array.capacity(), 9)
+        self.assertEqual(list(array), list(range(7)))
+
+        # The capacity always grows by at least one element
+        array = DynamicArray(1, 'i', growth_factor=1.1)
+        array.insert(1)
+        array.insert(2)
+        self.assertEqual(array.capacity(), 2)
+
+    def test_shrink_ratio(self):
+        """Test that the array shrinks according to the shrink ratio."""
+        array = DynamicArray(8, 'i', shrink_ratio=0.1)
+        for value in range(8):
+            array.insert(value)
+        for value in range(7):
+            array.delete(value)
+        self.assertEqual(array.capacity(), 8)
+        array.delete(7)
+        self.assertEqual(array.capacity(), 4)
+
+        array = DynamicArray(8, 'i', shrink_ratio=0)
+        array.insert(1)
+        array.delete(1)
+        self.assertEqual(array.capacity(), 8)
+
+    # reserve
+
+    def test_reserve(self):
+        """Test reserving capacity in advance."""
+        array = DynamicArray(typecode='i')
+        array.insert(1)
+        array.reserve(100)
+        self.assertEqual(array.capacity(), 100)
+        for value in range(2, 101):
+            array.insert(value)
+        self.assertEqual(array.capacity(), 100)
+        self.assertEqual(list(array), list(range(1, 101)))
+        array.reserve(10)
+        self.assertEqual(array.capacity(), 100)
+
+    # shrink_to_fit
+
+    def test_shrink_to_fit(self):
+        """Test releasing unused capacity."""
+        array = DynamicArray(10, 'i')
+        array.insert(1)
+        array.insert(2)
+        array.insert(3)
+        array.shrink_to_fit()
+        self.assertEqual(array.capacity(), 3)
+        self.assertEqual(list(array), [1, 2, 3])
+        array.insert(4)
+        self.assertEqual(array.capacity(), 6)
+
+        array = DynamicArray(10, 'i')
+        array.shrink_to_fit()
+        self.assertEqual(array.capacity(), 1)
+        self.assertTrue(array.is_empty())
+
+    # extend
+
+    def test_extend(self):
+        """Test inserting many values at once."""
+        array = DynamicArray(typecode='i')
+        array.insert(0)
+        array.extend([1, 2, 3, 4, 5])
+        self.assertEqual(len(array), 6)
+        self.assertEqual(array.capacity(), 6)
+        self.assertEqual(list(array), [0, 1, 2, 3, 4, 5])
+        array.extend(x * 10 for x in range(2))
+        self.assertEqual(list(array), [0, 1, 2, 3, 4, 5, 0, 10])
+        self.assertEqual(array.capacity(), 12)
+        array.extend([])
+        self.assertEqual(len(array), 8)
+
+    def test_extend_invalid(self):
+        """Test that extend doesn't change the array if a value has the wrong type."""
+        array = DynamicArray(2, 'i')
+        array.insert(1)
+        with self.assertRaises(TypeError):
+            array.extend([2, 3.5])
+        self.assertEqual(list(array), [1])
+
+    # delete_where
+
+    def test_delete_where(self):
+        """Test deleting all the values matching a predicate."""
+        array = DynamicArray(typecode='i')
+        array.extend(range(10))
+        self.assertEqual(array.delete_where(lambda x: x % 3 == 0), 4)
+        self.assertEqual(list(array), [1, 2, 4, 5, 7, 8])
+        self.assertEqual(array.capacity(), 10)
+        self.assertEqual(array.delete_where(lambda x: x > 100), 0)
+        self.assertEqual(array.delete_where(lambda x: x > 2), 4)
+        self.assertEqual(list(array), [1, 2])
+        self.assertEqual(array.capacity(), 5)
+        self.assertEqual(array.delete_where(lambda x: True), 2)
+        self.assertTrue(array.is_empty())
+        self.assertEqual(array.capacity(), 1)
+
+    # delete_many
+
+    def test_delete_many(self):
+        """Test deleting all the occurrences of several values."""
+        array = DynamicArray(typecode='i')
+        array.extend([3, 1, 3, 2, 5, 2, 4])
+        self.assertEqual(array.delete_many([2, 3, 7]), 4)
+        self.assertEqual(list(array), [1, 5, 4])
+        self.assertEqual(array.delete_many([]), 0)
+        self.assertEqual(list(array), [1, 5, 4])
+
+    # scan kernels
+
+    def test_find_all_and_count(self):
+        """Test finding and counting all the occurrences of a value."""
+        array = DynamicArray(typecode='i')
+        array.extend([3, 1, 3, 2, 3])
+        self.assertEqual(array.find_all(3), [0, 2, 4])
+        self.assertEqual(array.find_all(0), [])
+        self.assertEqual(array.count(3), 3)
+        self.assertEqual(array.count(0), 0)
+
+    def test_aggregates(self):
+        """Test min, max, sum, argmin and argmax."""
+        array = DynamicArray(8, 'd')
+        array.extend([2.5, -1.0, 4.0, -1.0])
+        self.assertEqual(array.min(), -1.0)
+        self.assertEqual(array.max(), 4.0)
+        self.assertEqual(array.sum(), 4.5)
+        self.assertEqual(array.argmin(), 1)
+        self.assertEqual(array.argmax(), 2)
+        array = DynamicArray(4, 'i')
+        self.assertEqual(array.sum(), 0)
+        with self.assertRaises(ValueError):
+            array.min()
+        with self.assertRaises(ValueError):
+            array.argmax()
+
+    # parallel_traverse
+
+    def test_parallel_traverse(self):
+        """Test traversing the array with a pool of processes."""
+        array = DynamicArray(typecode='i')
+        array.extend(range(20))
+        self.assertEqual(array.parallel_traverse(str, workers=2, chunk_size=3), [str(x) for x in range(20)])
+        self.assertEqual(DynamicArray().parallel_traverse(str, workers=2), [])
+
+    # share
+
+    def test_share(self):
+        """Test taking a snapshot of the array in shared memory."""
+        array = DynamicArray(typecode='q')
+        array.extend([3, 1, 4])
+        snapshot = array.share()
+        self.assertEqual(snapshot.capacity(), array.capacity())
+        array.insert(1)
+        self.assertEqual(list(snapshot), [3, 1, 4])
+        copy = pickle.loads(pickle.dumps(snapshot))
+        self.assertEqual(copy._array.name(), snapshot._array.name())
+        self.assertEqual(copy.find(4), 2)
+        self.assertEqual(snapshot.parallel_traverse(str, workers=2), ['3', '1', '4'])
+        copy.close()
+        snapshot.close()
+
+    # persistence
+
+    def test_save_load(self):
+        """Test saving the array to a file and loading it back."""
+        array = DynamicArray(typecode='q', growth_factor=3)
+        array.extend([5, 2**40, -1])
+        self.assertEqual(list(DynamicArray.from_bytes(array.to_bytes())), [5, 2**40, -1])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'array.bin')
+            array.save(path)
+            for mapped in (False, True):
+                loaded = DynamicArray.load(path, mapped=mapped)
+                self.assertEqual(list(loaded), [5, 2**40, -1])
+                self.assertEqual(loaded.capacity(), array.capacity())
+                loaded.extend(range(10))
+                self.assertEqual(len(loaded), 13)
+            self.assertEqual(list(DynamicArray.load(path)), [5, 2**40, -1])
@@ -0,0 +1,62 @@
+import unittest
+from unittest import mock
+import arrays.frozen_sorted_array as frozen_sorted_array
+from arrays.frozen_sorted_array import FrozenSortedArray
+from arrays.sorted_array import SortedArray
+
+class FrozenSortedArrayTestTemplate():
+    def test_init(self):
+        array = FrozenSortedArray([1, 2, 3, 4, 5, 6], 'i')
+        self.assertEqual(len(array), 6)
+        # Eytzinger order: in-order visit of the implicit tree gives the sorted values
+        self.assertEqual(repr(array), "FrozenSortedArray(array('i', [4, 2, 6, 1, 3, 5]))")
+        array = FrozenSortedArray([])
+        self.assertEqual(len(array), 0)
+
+    def test_search(self):
+        for size in range(0, 40):
+            values = [2 * i for i in range(size)]
+            array = FrozenSortedArray(values)
+            for i, value in enumerate(values):
+                self.assertEqual(array.search(value), i)
+                self.assertIn(value, array)
+            for value in range(-1, 2 * size + 1, 2):
+                self.assertIsNone(array.search(value))
+                self.assertNotIn(value, array)
+
+    def test_search_duplicates(self):
+        array = FrozenSortedArray([1, 3, 3, 3, 5, 7, 7], 'i')
+        self.assertEqual(array.search(3), 1)
+        self.assertEqual(array.search(7), 5)
+        self.assertEqual(array.search(1), 0)
+
+    def test_search_many(self):
+        for size in (0, 1, 2, 7, 8, 33):
+            values = [2 * i for i in range(size)]
+            array = FrozenSortedArray(values)
+            targets = list(range(-2, 2 * size + 2))
+            self.assertEqual(array.search_many(targets), [array.search(t) for t in targets])
+        array = FrozenSortedArray([0.5, 1.5, 2.5], 'd')
+        self.assertEqual(array.search_many([2.5, 1, 0.5, 3.0]), [2, None, 0, None])
+        self.assertEqual(array.search_many([]), [])
+
+    def test_freeze(self):
+        sorted_array = SortedArray(10, 'd')
+        for value in [3.5, -1.0, 2.0, 8.25]:
+            sorted_array.insert(value)
+        array = sorted_array.freeze()
+        self.assertEqual(array.search_many([-1.0, 2.0, 3.5, 8.25, 0.0]), [0, 1, 2, 3, None])
+        sorted_array.delete(2.0)
+        self.assertEqual(array.search(2.0), 1)
+        self.assertEqual(len(array), 4)
+
+
+class TestFrozenSortedArray(unittest.TestCase, FrozenSortedArrayTestTemplate):
+    pass
+
+
+class TestFrozenSortedArrayWithoutNumPy(unittest.TestCase, FrozenSortedArrayTestTemplate):
+    def setUp(self):
+        patcher = mock.patch.object(frozen_sorted_array, 'np', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
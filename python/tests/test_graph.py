@@ -251,6 +251,19 @@ class TestGraph(unittest.TestCase):
         self.assertSetEqual(graph.get_edges(), expected_edges)
 
 
+    def test_outgoing_edges(self):
+        graph = self.create_test_graph()
+        vertex = graph._get_vertex(1)
+        self.assertEqual(vertex.out_degree(), 3)
+        edges = vertex.outgoing_edges()
+        self.assertIsInstance(edges, list)
+        self.assertSetEqual(set(edges), set([(1, 0.23), (1, 'ABC'), (1, 'WXYZ')]))
+        lazy_edges = vertex.iter_outgoing_edges()
+        self.assertNotIsInstance(lazy_edges, list)
+        self.assertListEqual(list(lazy_edges), edges)
+        self.assertEqual(graph._get_vertex('WXYZ').out_degree(), 0)
+
+
     def test_bfs(self):
         graph = self.create_bfs_disconnected_graph()
         result = graph.bfs(4, 3)
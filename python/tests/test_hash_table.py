@@ -23,6 +23,12 @@ class TestHashTable(unittest.TestCase):
         hash_table.insert('Jsut some random string')
         self.assertEqual(len(hash_table), 5)
 
+        hash_table.delete('beta')
+        self.assertEqual(len(hash_table), 4)
+        with self.assertRaises(ValueError):
+            hash_table.delete('beta')
+        self.assertEqual(len(hash_table), 4)
+
     def test_is_empty(self):
         hash_table = HashTable(22)
         self.assertTrue(hash_table.is_empty())
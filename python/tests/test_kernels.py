@@ -0,0 +1,128 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import arrays.kernels as kernels
+from arrays.core import Array
+
+class KernelsTestTemplate():
+    def new_array(self, values, typecode='l'):
+        arr = Array(len(values) + 3, typecode)
+        arr[0:len(values)] = values
+        return arr
+
+    def test_find(self):
+        arr = self.new_array([4, -2, 7, -2])
+        self.assertEqual(kernels.find(arr, 4, -2), 1)
+        self.assertEqual(kernels.find(arr, 4, 7), 2)
+        self.assertIsNone(kernels.find(arr, 4, 5))
+        # Elements past `size` are ignored
+        self.assertIsNone(kernels.find(arr, 4, 0))
+        self.assertIsNone(kernels.find(arr, 0, 4))
+        arr = self.new_array([1.5, 3.25], 'd')
+        self.assertEqual(kernels.find(arr, 2, 3.25), 1)
+        self.assertIsNone(kernels.find(arr, 2, 'a'))
+
+    def test_find_all(self):
+        arr = self.new_array([4, -2, 7, -2])
+        self.assertEqual(kernels.find_all(arr, 4, -2), [1, 3])
+        self.assertEqual(kernels.find_all(arr, 3, -2), [1])
+        self.assertEqual(kernels.find_all(arr, 4, 0), [])
+        self.assertEqual(kernels.find_all(arr, 0, 4), [])
+
+    def test_count(self):
+        arr = self.new_array([4, -2, 7, -2])
+        self.assertEqual(kernels.count(arr, 4, -2), 2)
+        self.assertEqual(kernels.count(arr, 4, 0), 0)
+        self.assertEqual(kernels.count(arr, 7, 0), 3)
+        self.assertEqual(kernels.count(arr, 0, 4), 0)
+
+    def test_min_max(self):
+        arr = self.new_array([4, -2, 7, -2, 7])
+        self.assertEqual(kernels.min(arr, 5), -2)
+        self.assertEqual(kernels.max(arr, 5), 7)
+        self.assertEqual(kernels.argmin(arr, 5), 1)
+        self.assertEqual(kernels.argmax(arr, 5), 2)
+        self.assertEqual(kernels.min(arr, 1), 4)
+        arr = self.new_array([4, 5])
+        # Padding zeros are ignored
+        self.assertEqual(kernels.min(arr, 2), 4)
+        self.assertEqual(kernels.argmin(arr, 2), 0)
+        arr = self.new_array([2.5, -0.5], 'f')
+        self.assertEqual(kernels.min(arr, 2), -0.5)
+        self.assertEqual(kernels.max(arr, 2), 2.5)
+
+    def test_min_max_empty(self):
+        arr = self.new_array([])
+        for kernel in (kernels.min, kernels.max, kernels.argmin, kernels.argmax):
+            with self.assertRaises(ValueError):
+                kernel(arr, 0)
+
+    def test_sum(self):
+        arr = self.new_array([4, -2, 7, -2])
+        self.assertEqual(kernels.sum(arr, 4), 7)
+        self.assertEqual(kernels.sum(arr, 2), 2)
+        self.assertEqual(kernels.sum(arr, 0), 0)
+        arr = self.new_array([0.5, 0.25], 'd')
+        self.assertEqual(kernels.sum(arr, 2), 0.75)
+
+    def test_inexact_targets(self):
+        arr = self.new_array([2**53, 0.5], 'd')
+        self.assertEqual(kernels.find(arr, 2, 2**53), 0)
+        self.assertIsNone(kernels.find(arr, 2, 2**53 + 1))
+        self.assertEqual(kernels.count(arr, 2, 2**53 + 1), 0)
+        arr = self.new_array([0.5, 0.1], 'f')
+        self.assertEqual(kernels.find(arr, 2, 0.5), 0)
+        self.assertIsNone(kernels.find(arr, 2, 0.1))
+        arr = self.new_array([5, 7, 5], 'q')
+        self.assertEqual(kernels.find_all(arr, 3, 5.0), [0, 2])
+        self.assertEqual(kernels.find_all(arr, 3, 5.5), [])
+        self.assertEqual(kernels.count(arr, 3, 2**63 + 5), 0)
+        self.assertEqual(kernels.count(arr, 3, float('inf')), 0)
+        arr = self.new_array([1, 255], 'B')
+        self.assertIsNone(kernels.find(arr, 2, -1))
+        self.assertIsNone(kernels.find(arr, 2, 511))
+
+    def test_file_backed(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            arr = Array(3, 'q', os.path.join(tmp_dir, 'array.bin'))
+            arr[0:3] = [3, 1, 3]
+            self.assertEqual(kernels.find_all(arr, 3, 3), [0, 2])
+            self.assertEqual(kernels.argmin(arr, 3), 1)
+            self.assertEqual(kernels.sum(arr, 3), 7)
+            arr.close()
+
+
+class TestKernels(unittest.TestCase, KernelsTestTemplate):
+    pass
+
+
+class TestKernelsWithoutNumPy(unittest.TestCase, KernelsTestTemplate):
+    def setUp(self):
+        patcher = mock.patch.object(kernels, 'np', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestKernelsAgreement(unittest.TestCase):
+    def test_numpy_matches_fallback(self):
+        """Test that the NumPy kernels and the fallback return the same results"""
+        cases = [
+            ('d', [2**53, 1.5, -0.0, float('inf')], [2**53, 2**53 + 1, 1.5, 0, float('inf'), float('nan'), 'a']),
+            ('f', [0.5, 0.1, 16777216], [0.5, 0.1, 16777217, 16777216]),
+            ('q', [5, -2**63, 2**63 - 1], [5, 5.0, 5.5, -2**63, 2**63, -2**63 - 1, float('nan')]),
+            ('B', [0, 255], [0, 255, 256, -1, 255.0]),
+        ]
+        for typecode, values, targets in cases:
+            arr = Array(len(values), typecode)
+            arr[0:len(values)] = values
+            for target in targets:
+                with self.subTest(typecode=typecode, target=target):
+                    results = [(kernels.find(arr, len(values), target),
+                                kernels.find_all(arr, len(values), target),
+                                kernels.count(arr, len(values), target))]
+                    with mock.patch.object(kernels, 'np', None):
+                        results.append((kernels.find(arr, len(values), target),
+                                        kernels.find_all(arr, len(values), target),
+                                        kernels.count(arr, len(values), target)))
+                    self.assertEqual(results[0], results[1])
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from arrays.core import Array
+from arrays.parallel import parallel_traverse
+
+def square(x):
+    return x * x
+
+def fail_on_negative(x):
+    if x < 0:
+        raise ValueError(f'Negative value: {x}')
+    return x
+
+class TestParallelTraverse(unittest.TestCase):
+    def test_traverse(self):
+        arr = Array(10, 'q')
+        arr[0:10] = range(-5, 5)
+        self.assertEqual(parallel_traverse(arr, 10, square, workers=2), [x * x for x in range(-5, 5)])
+        self.assertEqual(parallel_traverse(arr, 7, square, workers=3, chunk_size=2), [x * x for x in range(-5, 2)])
+        self.assertEqual(parallel_traverse(arr, 0, square, workers=2), [])
+
+    def test_traverse_floats(self):
+        arr = Array(4, 'd')
+        arr[0:4] = [0.5, 1.5, -2.0, 3.0]
+        self.assertEqual(parallel_traverse(arr, 4, square, workers=2, chunk_size=1), [0.25, 2.25, 4.0, 9.0])
+
+    def test_traverse_file_backed(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            arr = Array(5, 'i', os.path.join(tmp_dir, 'array.bin'))
+            arr[0:5] = [1, 2, 3, 4, 5]
+            self.assertEqual(parallel_traverse(arr, 5, square, workers=2), [1, 4, 9, 16, 25])
+            arr.close()
+
+    def test_traverse_shared(self):
+        arr = Array(6, 'q', shared=True)
+        self.addCleanup(arr.close)
+        arr[0:6] = [3, 1, 4, 1, 5, 9]
+        self.assertEqual(parallel_traverse(arr, 6, square, workers=2), [9, 1, 16, 1, 25, 81])
+        self.assertEqual(parallel_traverse(arr, 3, square, workers=2, chunk_size=1), [9, 1, 16])
+        # The block of the array is left alone
+        attached = Array.attach(arr.name(), 'q', 6)
+        self.addCleanup(attached.close)
+        self.assertEqual(list(attached[:]), [3, 1, 4, 1, 5, 9])
+
+    def test_traverse_invalid(self):
+        arr = Array(3)
+        with self.assertRaises(ValueError):
+            parallel_traverse(arr, 3, square, workers=0)
+        with self.assertRaises(ValueError):
+            parallel_traverse(arr, 3, square, chunk_size=0)
+        with self.assertRaises(ValueError):
+            parallel_traverse(Array(3, 'u'), 3, square)
+
+    def test_traverse_callback_error(self):
+        arr = Array(3)
+        arr[0:3] = [1, -1, 2]
+        with self.assertRaises(ValueError):
+            parallel_traverse(arr, 3, fail_on_negative, workers=2)
+        # The array can still be resized: no view on its buffer was left behind
+        arr.resize(5)
@@ -0,0 +1,120 @@
+import array
+import os
+import tempfile
+import unittest
+from arrays import persistence
+from arrays.core import Array
+
+class TestPersistence(unittest.TestCase):
+    # to_bytes / from_bytes
+
+    def test_round_trip(self):
+        """Test serializing and deserializing an array"""
+        arr = Array(5, 'q')
+        arr[0:3] = [2**40, -1, 7]
+        data = persistence.to_bytes(arr, 3, 6, is_sorted=False)
+        self.assertEqual(len(data), persistence.HEADER.size + 6 * 8)
+        header, loaded = persistence.from_bytes(data)
+        self.assertEqual(header, persistence.Header('q', 3, 6, False))
+        self.assertEqual(list(loaded[:]), [2**40, -1, 7, 0, 0, 0])
+
+    def test_round_trip_array(self):
+        """Test serializing an array.array"""
+        values = array.array('d', [0.5, 1.5])
+        header, loaded = persistence.from_bytes(persistence.to_bytes(values, 2, 2, is_sorted=True))
+        self.assertEqual(header, persistence.Header('d', 2, 2, True))
+        self.assertEqual(list(loaded[:]), [0.5, 1.5])
+
+    def test_invalid(self):
+        """Test serializing and deserializing invalid data"""
+        with self.assertRaises(ValueError):
+            persistence.to_bytes(Array(3), 4, 4)
+        with self.assertRaises(ValueError):
+            persistence.to_bytes(Array(3), 3, 2)
+        data = persistence.to_bytes(Array(3), 3, 3)
+        with self.assertRaises(ValueError):
+            persistence.from_bytes(data[:10])
+        with self.assertRaises(ValueError):
+            persistence.from_bytes(data[:-1])
+        with self.assertRaises(ValueError):
+            persistence.from_bytes(b'XXXX' + data[4:])
+
+    # save / load
+
+    def test_save_load(self):
+        """Test saving an array to a file and reading it back"""
+        arr = Array(4, 'i')
+        arr[0:4] = [4, 3, 2, 1]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'array.bin')
+            persistence.save(path, arr, 4, 4)
+            self.assertEqual(os.listdir(tmp_dir), ['array.bin'])
+            header, loaded = persistence.load(path)
+            self.assertEqual(header, persistence.Header('i', 4, 4, False))
+            self.assertFalse(loaded.is_file_backed())
+            self.assertEqual(list(loaded[:]), [4, 3, 2, 1])
+
+    @unittest.skipIf(os.name == 'nt', 'POSIX permissions')
+    def test_save_permissions(self):
+        """Test that saving keeps the permissions of the file, or uses the default ones for a new file"""
+        arr = Array(2, 'i')
+        umask = os.umask(0o022)
+        self.addCleanup(os.umask, umask)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'array.bin')
+            persistence.save(path, arr, 2, 2)
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o644)
+            os.chmod(path, 0o640)
+            persistence.save(path, arr, 1, 2)
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o640)
+
+    def test_failed_save_leaves_no_temp_file(self):
+        """Test that a failed save removes its temporary file and keeps the old content"""
+        arr = Array(4, 'i')
+        arr[0:4] = [4, 3, 2, 1]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'array.bin')
+            persistence.save(path, arr, 2, 4)
+            with self.assertRaises(ValueError):
+                persistence.save(path, arr, 5, 4)
+            self.assertEqual(os.listdir(tmp_dir), ['array.bin'])
+            header, loaded = persistence.load(path)
+            self.assertEqual(header.size, 2)
+
+    def test_load_mapped(self):
+        """Test mapping a saved array copy-on-write"""
+        arr = Array(3, 'q')
+        arr[0:3] = [1, 2, 3]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'array.bin')
+            persistence.save(path, arr, 3, 3)
+            header, loaded = persistence.load(path, mapped=True)
+            self.assertTrue(loaded.is_file_backed())
+            self.assertEqual(list(loaded[:]), [1, 2, 3])
+            # Changes are not written back to the file
+            loaded[0] = 10
+            self.assertEqual(persistence.load(path)[1][0], 1)
+            # Resizing moves the elements to memory
+            loaded.resize(5)
+            self.assertFalse(loaded.is_file_backed())
+            self.assertEqual(list(loaded[:]), [10, 2, 3, 0, 0])
+
+    # create / open_mapped
+
+    def test_create_open_mapped(self):
+        """Test creating a file-backed array, updating its header and opening it again"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'array.bin')
+            arr = persistence.create(path, 'q', 4)
+            self.assertEqual(persistence.load(path)[0], persistence.Header('q', 0, 4, False))
+            arr[0:2] = [7, 8]
+            persistence.write_header(path, persistence.Header('q', 2, 4, False))
+            arr.close()
+            with self.assertRaises(FileExistsError):
+                persistence.create(path, 'q', 4)
+            header, mapped = persistence.open_mapped(path)
+            self.assertEqual(header, persistence.Header('q', 2, 4, False))
+            # Changes are written back to the file
+            mapped[2] = 9
+            mapped.close()
+            self.assertEqual(list(persistence.load(path)[1][:]), [7, 8, 9, 0])
@@ -0,0 +1,173 @@
+import unittest
+from copy_policy import CopyPolicy
+from linked_lists.pooled_linked_list import NIL, PooledDoublyLinkedList, PooledSinglyLinkedList
+
+class PooledLinkedListTestTemplate():
+    def new_list(self, typecode=None, copy_policy=CopyPolicy.DEEP): # pragma: no cover
+        raise NotImplementedError()
+
+    def test_init(self):
+        linked_list = self.new_list()
+        self.assertEqual(len(linked_list), 0)
+        self.assertTrue(linked_list.is_empty())
+        self.assertEqual(linked_list._head, NIL)
+        self.assertEqual(list(linked_list), [])
+
+    def test_insert(self):
+        linked_list = self.new_list()
+        linked_list.insert_in_front(2)
+        linked_list.insert_in_front(1)
+        linked_list.insert_to_back(3)
+        self.assertEqual(list(linked_list), [1, 2, 3])
+        self.assertEqual(len(linked_list), 3)
+        self.assertEqual(linked_list.size(), 3)
+        self.assertFalse(linked_list.is_empty())
+        self.assertEqual(str(linked_list), self.separator.join(['1', '2', '3']))
+
+    def test_repr(self):
+        linked_list = self.new_list()
+        linked_list.insert_to_back('a')
+        linked_list.insert_to_back('b')
+        name = type(linked_list).__name__
+        self.assertEqual(repr(linked_list), f"{name}('a'{self.separator}'b')")
+
+    def test_get(self):
+        linked_list = self.new_list()
+        for value in [[1], [2], [3]]:
+            linked_list.insert_to_back(value)
+        self.assertEqual(linked_list.get(0), [1])
+        self.assertEqual(linked_list.get(2), [3])
+        # Deep copy by default
+        linked_list.get(1).append(0)
+        self.assertEqual(linked_list.get(1), [2])
+        with self.assertRaises(IndexError):
+            linked_list.get(-1)
+        with self.assertRaises(IndexError):
+            linked_list.get(3)
+        linked_list = self.new_list(copy_policy='none')
+        value = [1]
+        linked_list.insert_to_back(value)
+        self.assertIs(linked_list.get(0), value)
+
+    def test_search_traverse(self):
+        linked_list = self.new_list()
+        for value in [1, 2, 3, 4]:
+            linked_list.insert_to_back(value)
+        self.assertEqual(linked_list.search(lambda x: x % 2 == 0), 2)
+        self.assertIsNone(linked_list.search(lambda x: x > 4))
+        self.assertEqual(linked_list.traverse(lambda x: x * 10), [10, 20, 30, 40])
+        self.assertEqual(linked_list._search(3), 2)
+        self.assertEqual(linked_list._search(5), NIL)
+
+    def test_streaming(self):
+        linked_list = self.new_list()
+        for value in [1, 2, 3, 4]:
+            linked_list.insert_to_back(value)
+        self.assertEqual(list(linked_list.itraverse(lambda x: x * 10)), [10, 20, 30, 40])
+        self.assertEqual(list(linked_list.map(str)), ['1', '2', '3', '4'])
+        self.assertEqual(list(linked_list.filter(lambda x: x % 2 == 1)), [1, 3])
+        self.assertEqual(list(linked_list.take_while(lambda x: x < 3)), [1, 2])
+        self.assertEqual(list(linked_list.first_n(3)), [1, 2, 3])
+        with self.assertRaises(ValueError):
+            linked_list.first_n(-1)
+
+    def test_delete(self):
+        linked_list = self.new_list()
+        for value in [1, 2, 3, 4]:
+            linked_list.insert_to_back(value)
+        linked_list.delete(2)
+        self.assertEqual(list(linked_list), [1, 3, 4])
+        linked_list.delete(1)
+        self.assertEqual(list(linked_list), [3, 4])
+        linked_list.delete(4)
+        self.assertEqual(list(linked_list), [3])
+        linked_list.insert_to_back(5)
+        self.assertEqual(list(linked_list), [3, 5])
+        with self.assertRaises(ValueError):
+            linked_list.delete(42)
+        self.assertEqual(len(linked_list), 2)
+
+    def test_delete_from_front(self):
+        linked_list = self.new_list()
+        with self.assertRaises(ValueError):
+            linked_list.delete_from_front()
+        linked_list.insert_to_back(1)
+        linked_list.insert_to_back(2)
+        self.assertEqual(linked_list.delete_from_front(), 1)
+        self.assertEqual(linked_list.delete_from_front(), 2)
+        self.assertTrue(linked_list.is_empty())
+        linked_list.insert_to_back(3)
+        self.assertEqual(list(linked_list), [3])
+
+    def test_free_list(self):
+        linked_list = self.new_list()
+        for value in range(5):
+            linked_list.insert_to_back(value)
+        self.assertEqual(linked_list.capacity(), 5)
+        linked_list.delete(1)
+        linked_list.delete(3)
+        # Freed slots are reused before the pool grows
+        linked_list.insert_in_front(10)
+        linked_list.insert_to_back(11)
+        self.assertEqual(linked_list.capacity(), 5)
+        linked_list.insert_to_back(12)
+        self.assertEqual(linked_list.capacity(), 6)
+        self.assertEqual(list(linked_list), [10, 0, 2, 4, 11, 12])
+
+    def test_release_drops_references(self):
+        linked_list = self.new_list()
+        linked_list.insert_to_back([1])
+        linked_list.delete_from_front()
+        self.assertIsNone(linked_list._data[0])
+
+    def test_typed_data(self):
+        linked_list = self.new_list('d')
+        linked_list.insert_to_back(1.5)
+        linked_list.insert_in_front(2)
+        self.assertEqual(list(linked_list), [2.0, 1.5])
+        with self.assertRaises(TypeError):
+            linked_list.insert_to_back('a')
+        self.assertEqual(len(linked_list), 2)
+        linked_list.delete(2.0)
+        with self.assertRaises(TypeError):
+            linked_list.insert_to_back('a')
+        self.assertEqual(list(linked_list), [1.5])
+        linked_list.insert_to_back(3.0)
+        self.assertEqual(list(linked_list), [1.5, 3.0])
+
+
+class TestPooledSinglyLinkedList(PooledLinkedListTestTemplate, unittest.TestCase):
+    separator = '->'
+
+    def new_list(self, typecode=None, copy_policy=CopyPolicy.DEEP):
+        return PooledSinglyLinkedList(typecode, copy_policy)
+
+
+class TestPooledDoublyLinkedList(PooledLinkedListTestTemplate, unittest.TestCase):
+    separator = '<->'
+
+    def new_list(self, typecode=None, copy_policy=CopyPolicy.DEEP):
+        return PooledDoublyLinkedList(typecode, copy_policy)
+
+    def test_links(self):
+        linked_list = self.new_list()
+        for value in [1, 2, 3]:
+            linked_list.insert_to_back(value)
+        linked_list.delete(2)
+        linked_list.insert_in_front(0)
+        slots = list(linked_list._slots())
+        self.assertEqual(linked_list._prev[slots[0]], NIL)
+        for previous, slot in zip(slots, slots[1:]):
+            self.assertEqual(linked_list._prev[slot], previous)
+        self.assertEqual(linked_list._tail, slots[-1])
+
+    def test_delete_from_back(self):
+        linked_list = self.new_list()
+        with self.assertRaises(ValueError):
+            linked_list.delete_from_back()
+        linked_list.insert_to_back(1)
+        linked_list.insert_to_back(2)
+        self.assertEqual(linked_list.delete_from_back(), 2)
+        self.assertEqual(linked_list.delete_from_back(), 1)
+        self.assertTrue(linked_list.is_empty())
+        self.assertEqual(linked_list._tail, NIL)
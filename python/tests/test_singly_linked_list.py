@@ -1,4 +1,5 @@
 import unittest
+from copy_policy import CopyPolicy
 from linked_lists.singly_linked_list import SinglyLinkedList
 
 class TestSinglyLinkedList(unittest.TestCase):
@@ -66,6 +67,36 @@ class TestSinglyLinkedList(unittest.TestCase):
         self.assertEqual(list(linked_list), expected)
 
 
+    def test_streaming(self):
+        linked_list = SinglyLinkedList()
+        self.assertEqual(list(linked_list.itraverse(str)), [])
+        self.assertEqual(list(linked_list.first_n(3)), [])
+        for value in [1, 2, 3, 4, 5, 6]:
+            linked_list.insert_to_back(value)
+
+        stream = linked_list.itraverse(lambda x: x * 10)
+        self.assertNotIsInstance(stream, list)
+        self.assertEqual(next(stream), 10)
+        self.assertEqual(list(stream), [20, 30, 40, 50, 60])
+        self.assertEqual(list(linked_list.map(str)), ['1', '2', '3', '4', '5', '6'])
+        self.assertEqual(list(linked_list.filter(lambda x: x % 2 == 0)), [2, 4, 6])
+        self.assertEqual(list(linked_list.take_while(lambda x: x < 4)), [1, 2, 3])
+        self.assertEqual(list(linked_list.take_while(lambda x: x > 4)), [])
+        self.assertEqual(list(linked_list.first_n(2)), [1, 2])
+        self.assertEqual(list(linked_list.first_n(0)), [])
+        self.assertEqual(list(linked_list.first_n(10)), [1, 2, 3, 4, 5, 6])
+        with self.assertRaises(ValueError):
+            linked_list.first_n(-1)
+
+        # Streams stop visiting nodes as soon as they are done
+        visited = []
+        def below_three(x):
+            visited.append(x)
+            return x < 3
+        self.assertEqual(list(linked_list.take_while(below_three)), [1, 2])
+        self.assertEqual(visited, [1, 2, 3])
+
+
     def test_size(self):
         linked_list = SinglyLinkedList()
         self.assertEqual(linked_list.size(), 0)
@@ -76,6 +107,41 @@ class TestSinglyLinkedList(unittest.TestCase):
         linked_list.insert_in_front(2)
         self.assertEqual(linked_list.size(), 2)
 
+    def test_size_and_tail_after_mutations(self):
+        linked_list = SinglyLinkedList()
+        linked_list.insert_to_back(2)
+        self.assertIs(linked_list._tail, linked_list._head)
+        linked_list.insert_in_front(1)
+        linked_list.insert_to_back(3)
+        linked_list.insert_to_back(4)
+        self.assertEqual(len(linked_list), 4)
+        self.assertEqual(linked_list._tail.data(), 4)
+
+        # Deleting the tail moves it back
+        linked_list.delete(4)
+        self.assertEqual(linked_list._tail.data(), 3)
+        linked_list.insert_to_back(5)
+        self.assertEqual(str(linked_list), '1->2->3->5')
+
+        # Deleting in the middle leaves the tail alone
+        linked_list.delete(2)
+        self.assertEqual(linked_list._tail.data(), 5)
+        self.assertEqual(linked_list.size(), 3)
+
+        # A failed delete doesn't change the size
+        with self.assertRaises(ValueError):
+            linked_list.delete(42)
+        self.assertEqual(len(linked_list), 3)
+
+        self.assertEqual(linked_list.delete_from_front(), 1)
+        self.assertEqual(linked_list.delete_from_front(), 3)
+        self.assertEqual(linked_list.delete_from_front(), 5)
+        self.assertEqual(len(linked_list), 0)
+        self.assertIsNone(linked_list._tail)
+        linked_list.insert_to_back(6)
+        self.assertIs(linked_list._head, linked_list._tail)
+        self.assertEqual(len(linked_list), 1)
+
 
     def test_is_empty(self):
         linked_list = SinglyLinkedList()
@@ -153,6 +219,31 @@ class TestSinglyLinkedList(unittest.TestCase):
         retrieved[0].append('c')
         self.assertEqual(linked_list.get(0), [['a', 'b'], 1, 2])
 
+    def test_get_copy_policies(self):
+        data = [['a', 'b'], 1]
+        linked_list = SinglyLinkedList(copy_policy='none')
+        linked_list.insert_in_front(data)
+        self.assertIs(linked_list.get(0), data)
+
+        linked_list = SinglyLinkedList(copy_policy=CopyPolicy.SHALLOW)
+        linked_list.insert_in_front(data)
+        retrieved = linked_list.get(0)
+        self.assertIsNot(retrieved, data)
+        self.assertIs(retrieved[0], data[0])
+
+        linked_list = SinglyLinkedList(copy_policy=CopyPolicy.FROZEN)
+        linked_list.insert_in_front(data)
+        retrieved = linked_list.get(0)
+        self.assertEqual(retrieved, data)
+        with self.assertRaises(TypeError):
+            retrieved.append(3)
+        with self.assertRaises(TypeError):
+            retrieved[0].append('c')
+        self.assertEqual(data, [['a', 'b'], 1])
+
+        with self.assertRaises(ValueError):
+            SinglyLinkedList(copy_policy='unknown')
+
 
     def test_internal_search(self):
         linked_list = SinglyLinkedList()
@@ -279,6 +370,12 @@ class TestNode(unittest.TestCase):
         self.assertEqual(node.data(), data)
         self.assertIsNone(node.next())
 
+    def test_slots(self):
+        node = SinglyLinkedList.Node('test')
+        self.assertFalse(hasattr(node, '__dict__'))
+        with self.assertRaises(AttributeError):
+            node.extra = 1
+
     def test_str(self):
         data = 'test'
         node = SinglyLinkedList.Node(data)
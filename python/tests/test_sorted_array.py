@@ -1,5 +1,13 @@
+import os
+import random
+import tempfile
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from arrays.sorted_array import SortedArray
+from arrays.unsorted_array import UnsortedArray
+
+def search(array, target):
+    return array.binary_search(target)
 
 class TestSortedArray(unittest.TestCase):
     # __init__
@@ -136,6 +144,48 @@ class TestSortedArray(unittest.TestCase):
         self.assertEqual(len(array), 2)
 
 
+    def test_insert_duplicates(self):
+        """Test inserting values equal to elements already in the array."""
+        array = SortedArray(8, 'd')
+        array.insert(1.0)
+        array.insert(3.0)
+        array.insert(1.0, 'left')
+        array.insert(3.0, 'right')
+        array.insert(2.0, 'left')
+        array.insert(0.5, 'right')
+        self.assertEqual(list(array), [0.5, 1.0, 1.0, 2.0, 3.0, 3.0])
+        self.assertEqual(array._bisect_left(1.0), 1)
+        self.assertEqual(array._bisect_right(1.0), 3)
+        self.assertEqual(array._bisect_left(3.0), 4)
+        self.assertEqual(array._bisect_right(3.0), 6)
+        self.assertEqual(array._bisect_left(4.0), 6)
+        self.assertEqual(array._bisect_right(0.0), 0)
+
+    def test_insert_invalid_side(self):
+        """Test that insert raises an error for an invalid side."""
+        array = SortedArray(3, 'i')
+        with self.assertRaises(ValueError):
+            array.insert(1, 'middle')
+        self.assertEqual(len(array), 0)
+
+    def test_insert_invalid_value(self):
+        """Test that inserting a value of the wrong type leaves the array unchanged."""
+        array = SortedArray(4, 'i')
+        array.insert(1)
+        array.insert(3)
+        with self.assertRaises(TypeError):
+            array.insert(2.5)
+        self.assertEqual(list(array), [1, 3])
+
+    def test_insert_many(self):
+        """Test inserting values in arbitrary order."""
+        values = [(i * 7919) % 101 for i in range(100)]
+        array = SortedArray(100, 'i')
+        for value in values:
+            array.insert(value)
+        self.assertEqual(list(array), sorted(values))
+
+
     # search (linear)
 
     def test_linear_search_found(self):
@@ -309,3 +359,304 @@ class TestSortedArray(unittest.TestCase):
         array = SortedArray(5, 'i')
         with self.assertRaises(ValueError):
             array.delete(1)
+
+    # file-backed
+
+    def test_file_backed(self):
+        """Test a sorted array stored in a memory-mapped file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'array.bin')
+            array = SortedArray(5, 'd', path)
+            array.insert(3.5)
+            array.insert(-1.0)
+            array.insert(2.0)
+            self.assertEqual(list(array), [-1.0, 2.0, 3.5])
+            self.assertEqual(array.binary_search(2.0), 1)
+            array.delete(-1.0)
+            self.assertEqual(repr(array), "SortedArray(array('d', [2.0, 3.5]))")
+            array.close()
+            with self.assertRaises(FileExistsError):
+                SortedArray(5, 'd', path)
+            # Tombstones are compacted when the array is flushed
+            array = SortedArray.open(path, lazy_delete=True)
+            self.assertEqual(list(array), [2.0, 3.5])
+            array.insert(1.0)
+            array.delete(3.5)
+            array.flush()
+            self.assertEqual(list(SortedArray.load(path)), [1.0, 2.0])
+            array.close()
+            array = SortedArray.open(path)
+            self.assertEqual(list(array), [1.0, 2.0])
+            array.close()
+
+    # persistence
+
+    def test_save_load(self):
+        """Test saving the array to a file and loading it back."""
+        array = SortedArray(6, 'd', lazy_delete=True)
+        for value in [3.5, -1.0, 2.0, 8.0]:
+            array.insert(value)
+        array.delete(2.0)
+        loaded = SortedArray.from_bytes(array.to_bytes())
+        self.assertEqual(list(loaded), [-1.0, 3.5, 8.0])
+        self.assertEqual(loaded.max_size(), 6)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'array.bin')
+            array.save(path)
+            loaded = SortedArray.load(path, mapped=True, lazy_delete=True)
+            self.assertEqual(loaded.binary_search(3.5), 1)
+            loaded.insert(0.0)
+            loaded.delete(8.0)
+            self.assertEqual(list(loaded), [-1.0, 0.0, 3.5])
+            self.assertEqual(list(SortedArray.load(path)), [-1.0, 3.5, 8.0])
+            loaded.close()
+
+    def test_load_unsorted(self):
+        """Test loading data that was not saved by a sorted array."""
+        with self.assertRaises(ValueError):
+            SortedArray.from_bytes(UnsortedArray(3).to_bytes())
+
+    # share
+
+    def test_share(self):
+        """Test querying a shared memory snapshot from worker processes."""
+        array = SortedArray.from_iterable(range(0, 100, 2), 'q', max_size=64)
+        snapshot = array.share()
+        self.assertTrue(snapshot._array.is_shared())
+        array.delete(10)
+        self.assertEqual(len(snapshot), 50)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(search, [snapshot] * 4, [0, 10, 11, 98]))
+        self.assertEqual(results, [0, 5, None, 49])
+        snapshot.close()
+
+    # range queries
+
+    def new_array(self):
+        array = SortedArray(10, 'i')
+        for value in [5, 1, 3, 3, 9, 7]:
+            array.insert(value)
+        return array
+
+    def test_range(self):
+        """Test iterating over the values within a range."""
+        array = self.new_array()
+        self.assertEqual(list(array.range(3, 8)), [3, 3, 5, 7])
+        self.assertEqual(list(array.range(2, 3)), [])
+        self.assertEqual(list(array.range(-10, 100)), [1, 3, 3, 5, 7, 9])
+        self.assertEqual(list(array.range(9, 10)), [9])
+        self.assertEqual(list(array.range(8, 2)), [])
+        self.assertEqual(list(SortedArray(3).range(0, 1)), [])
+
+    def test_count_range(self):
+        """Test counting the values within a range."""
+        array = self.new_array()
+        self.assertEqual(array.count_range(3, 8), 4)
+        self.assertEqual(array.count_range(3, 3), 0)
+        self.assertEqual(array.count_range(4, 5), 0)
+        self.assertEqual(array.count_range(0, 10), 6)
+        self.assertEqual(array.count_range(8, 2), 0)
+
+    def test_rank_select(self):
+        """Test rank and select."""
+        array = self.new_array()
+        self.assertEqual(array.rank(1), 0)
+        self.assertEqual(array.rank(3), 1)
+        self.assertEqual(array.rank(4), 3)
+        self.assertEqual(array.rank(100), 6)
+        self.assertEqual(array.select(0), 1)
+        self.assertEqual(array.select(3), 5)
+        self.assertEqual(array.select(5), 9)
+        for value in array:
+            self.assertEqual(array.select(array.rank(value)), value)
+        with self.assertRaises(IndexError):
+            array.select(6)
+
+    def test_floor_ceiling(self):
+        """Test floor and ceiling."""
+        array = self.new_array()
+        self.assertEqual(array.floor(3), 3)
+        self.assertEqual(array.floor(4), 3)
+        self.assertEqual(array.floor(100), 9)
+        self.assertIsNone(array.floor(0))
+        self.assertEqual(array.ceiling(3), 3)
+        self.assertEqual(array.ceiling(4), 5)
+        self.assertEqual(array.ceiling(-5), 1)
+        self.assertIsNone(array.ceiling(10))
+
+    def test_predecessor_successor(self):
+        """Test predecessor and successor."""
+        array = self.new_array()
+        self.assertEqual(array.predecessor(3), 1)
+        self.assertEqual(array.predecessor(4), 3)
+        self.assertIsNone(array.predecessor(1))
+        self.assertEqual(array.successor(3), 5)
+        self.assertEqual(array.successor(0), 1)
+        self.assertIsNone(array.successor(9))
+        self.assertIsNone(SortedArray(2).successor(0))
+
+    # from_iterable
+
+    def test_from_iterable(self):
+        """Test creating a sorted array from unsorted values."""
+        array = SortedArray.from_iterable([5, 1, 3, 3, -2], 'i')
+        self.assertEqual(list(array), [-2, 1, 3, 3, 5])
+        self.assertEqual(array.max_size(), 5)
+        self.assertEqual(repr(array), "SortedArray(array('i', [-2, 1, 3, 3, 5]))")
+        array = SortedArray.from_iterable((x / 2 for x in range(4, 0, -1)), 'd', 10)
+        self.assertEqual(list(array), [0.5, 1.0, 1.5, 2.0])
+        self.assertEqual(array.max_size(), 10)
+        array.insert(0.75)
+        self.assertEqual(array.binary_search(0.75), 1)
+        array = SortedArray.from_iterable([])
+        self.assertEqual(len(array), 0)
+        self.assertEqual(array.max_size(), 1)
+
+    def test_from_iterable_invalid(self):
+        """Test creating a sorted array from invalid values."""
+        with self.assertRaises(ValueError):
+            SortedArray.from_iterable([1, 2, 3], 'i', 2)
+        with self.assertRaises(TypeError):
+            SortedArray.from_iterable([1, 2.5], 'i')
+
+    # merge
+
+    def test_merge(self):
+        """Test merging two sorted arrays."""
+        array = SortedArray.from_iterable([1, 4, 9], 'i', 8)
+        other = SortedArray.from_iterable([0, 4, 5, 12], 'i')
+        array.merge(other)
+        self.assertEqual(list(array), [0, 1, 4, 4, 5, 9, 12])
+        self.assertEqual(list(other), [0, 4, 5, 12])
+        array.merge(SortedArray(3, 'i'))
+        self.assertEqual(len(array), 7)
+        with self.assertRaises(ValueError):
+            array.merge(other)
+        self.assertEqual(len(array), 7)
+
+    # lazy deletion
+
+    def test_init_invalid_dead_ratio(self):
+        """Test initializing a lazy array with an invalid dead ratio."""
+        with self.assertRaises(ValueError):
+            SortedArray(5, lazy_delete=True, max_dead_ratio=0)
+        with self.assertRaises(ValueError):
+            SortedArray(5, lazy_delete=True, max_dead_ratio=1.5)
+
+    def test_lazy_delete(self):
+        """Test that lazy deletion marks tombstones, and searches skip them."""
+        array = SortedArray(10, 'i', lazy_delete=True, max_dead_ratio=0.5)
+        for value in [1, 2, 2, 3, 5, 8]:
+            array.insert(value)
+        array.delete(2)
+        array.delete(5)
+        self.assertEqual(array._size, 6)
+        self.assertEqual(array._dead, 2)
+        self.assertEqual(len(array), 4)
+        self.assertEqual(list(array), [1, 2, 3, 8])
+        self.assertEqual(repr(array), "SortedArray(array('i', [1, 2, 3, 8]))")
+        self.assertEqual([array[i] for i in range(len(array))], [1, 2, 3, 8])
+        with self.assertRaises(IndexError):
+            array[4]
+        self.assertEqual(array.binary_search(2), 1)
+        self.assertEqual(array.binary_search(8), 3)
+        self.assertIsNone(array.binary_search(5))
+        self.assertEqual(array.linear_search(3), 2)
+        self.assertIsNone(array.linear_search(5))
+        with self.assertRaises(ValueError):
+            array.delete(5)
+        self.assertEqual(list(array.range(2, 9)), [2, 3, 8])
+        self.assertEqual(array.count_range(2, 9), 3)
+        self.assertEqual(array.rank(8), 3)
+        self.assertEqual(array.select(3), 8)
+        self.assertEqual(array.floor(7), 3)
+        self.assertEqual(array.ceiling(4), 8)
+        self.assertEqual(array.predecessor(8), 3)
+        self.assertEqual(array.successor(3), 8)
+
+        # Inserting reuses the slot of the closest tombstone
+        array.insert(4)
+        self.assertEqual(list(array), [1, 2, 3, 4, 8])
+        self.assertEqual(array._size, 6)
+        self.assertEqual(array._dead, 1)
+        self.assertEqual(array.floor(7), 4)
+        self.assertEqual(array.successor(4), 8)
+
+        # Exceeding the dead ratio triggers compaction
+        array.delete(1)
+        array.delete(2)
+        self.assertEqual(array._dead, 3)
+        array.delete(3)
+        self.assertEqual(array._dead, 0)
+        self.assertEqual(array._size, 2)
+        self.assertEqual(list(array), [4, 8])
+
+    def test_lazy_delete_compacts_when_full(self):
+        """Test that inserting in a full lazy array with tombstones reuses the slot of one."""
+        array = SortedArray(3, 'i', lazy_delete=True, max_dead_ratio=1)
+        for value in [1, 2, 3]:
+            array.insert(value)
+        array.delete(2)
+        array.insert(0)
+        self.assertEqual(list(array), [0, 1, 3])
+        self.assertEqual(array._dead, 0)
+        with self.assertRaises(ValueError):
+            array.insert(4)
+
+    def test_lazy_delete_merge(self):
+        """Test merging lazy arrays with tombstones."""
+        array = SortedArray(8, 'i', lazy_delete=True, max_dead_ratio=1)
+        other = SortedArray(8, 'i', lazy_delete=True, max_dead_ratio=1)
+        for value in [1, 3, 5]:
+            array.insert(value)
+            other.insert(value + 1)
+        array.delete(3)
+        other.delete(6)
+        array.merge(other)
+        self.assertEqual(list(array), [1, 2, 4, 5])
+
+    def test_lazy_delete_random(self):
+        """Test lazy deletion against a sorted list."""
+        array = SortedArray(64, 'i', lazy_delete=True)
+        expected = []
+        for i in range(300):
+            value = (i * 37) % 23
+            if len(expected) < 40 and (i % 3 != 0 or not expected):
+                array.insert(value)
+                expected.append(value)
+                expected.sort()
+            elif value in expected:
+                array.delete(value)
+                expected.remove(value)
+            self.assertEqual(list(array), expected)
+            self.assertEqual(len(array), len(expected))
+            if expected:
+                k = i % len(expected)
+                self.assertEqual(array[k], expected[k])
+                self.assertEqual(array.rank(value), len([v for v in expected if v < value]))
+
+    def test_lazy_delete_neighbours_random(self):
+        """Test inserts reusing tombstones, and neighbour queries skipping them, against a sorted list."""
+        rng = random.Random(1)
+        array = SortedArray(50, 'i', lazy_delete=True, max_dead_ratio=1)
+        expected = []
+        for _ in range(2000):
+            value = rng.randrange(30)
+            if len(expected) < 50 and (rng.random() < 0.55 or not expected):
+                array.insert(value, rng.choice(['left', 'right']))
+                expected.append(value)
+                expected.sort()
+            elif value in expected:
+                array.delete(value)
+                expected.remove(value)
+            self.assertEqual(list(array), expected)
+            target = rng.randrange(-1, 31)
+            self.assertEqual(array.floor(target), max((v for v in expected if v <= target), default=None))
+            self.assertEqual(array.ceiling(target), min((v for v in expected if v >= target), default=None))
+            self.assertEqual(array.predecessor(target), max((v for v in expected if v < target), default=None))
+            self.assertEqual(array.successor(target), min((v for v in expected if v > target), default=None))
+            index = array.binary_search(target)
+            if target in expected:
+                self.assertEqual(array[index], target)
+            else:
+                self.assertIsNone(index)
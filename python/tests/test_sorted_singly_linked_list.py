@@ -69,4 +69,71 @@ class TestSortedSinglyLinkedList(unittest.TestCase):
 
         self.assertEqual(len(linked_list), 2)
         self.assertEqual(linked_list._head.data(), 1)
-        self.assertEqual(linked_list._head.next().data(), 3)
\ No newline at end of file
+        self.assertEqual(linked_list._head.next().data(), 3)
+
+    def test_len_and_tail(self):
+        sorted_list = SortedSinglyLinkedList()
+        for value in [5, 1, 7, 3]:
+            sorted_list.insert(value)
+        self.assertEqual(len(sorted_list), 4)
+        self.assertEqual(sorted_list._tail.data(), 7)
+        sorted_list.delete(7)
+        self.assertEqual(len(sorted_list), 3)
+        self.assertEqual(sorted_list._tail.data(), 5)
+        sorted_list.insert(6)
+        self.assertEqual(sorted_list._tail.data(), 6)
+
+
+    def test_len_after_failed_insert(self):
+        sorted_list = SortedSinglyLinkedList()
+        sorted_list.insert(1)
+        with self.assertRaises(TypeError):
+            sorted_list.insert('a')
+        self.assertEqual(len(sorted_list), 1)
+        self.assertEqual(list(sorted_list), [1])
+        self.assertEqual(sorted_list._tail.data(), 1)
+
+
+    def test_insert_sorted_batch(self):
+        sorted_list = SortedSinglyLinkedList()
+        sorted_list.insert_sorted_batch([])
+        self.assertTrue(sorted_list.is_empty())
+
+        sorted_list.insert_sorted_batch([2, 4, 6])
+        self.assertEqual(list(sorted_list), [2, 4, 6])
+        sorted_list.insert_sorted_batch([1, 4, 5, 8, 9])
+        self.assertEqual(list(sorted_list), [1, 2, 4, 4, 5, 6, 8, 9])
+        self.assertEqual(len(sorted_list), 8)
+        self.assertEqual(sorted_list._head.data(), 1)
+        self.assertEqual(sorted_list._tail.data(), 9)
+
+        # Unsorted batches are still inserted correctly
+        sorted_list.insert_sorted_batch(iter([7, 0, 3]))
+        self.assertEqual(list(sorted_list), [0, 1, 2, 3, 4, 4, 5, 6, 7, 8, 9])
+        self.assertEqual(len(sorted_list), 11)
+        self.assertEqual(sorted_list._tail.data(), 9)
+
+
+    def test_merge_k(self):
+        lists = []
+        for start, step in [(0, 3), (1, 4), (2, 2)]:
+            sorted_list = SortedSinglyLinkedList()
+            sorted_list.insert_sorted_batch(range(start, 20, step))
+            lists.append(sorted_list)
+        expected = sorted(value for sorted_list in lists for value in sorted_list)
+
+        merged = SortedSinglyLinkedList.merge_k(lists)
+        self.assertNotIsInstance(merged, list)
+        self.assertEqual(list(merged), expected)
+        self.assertEqual(list(SortedSinglyLinkedList.merge_k([])), [])
+        self.assertEqual(list(SortedSinglyLinkedList.merge_k([SortedSinglyLinkedList(), [1, 2], []])), [1, 2])
+
+
+    def test_merge_k_is_stable(self):
+        class Key:
+            def __init__(self, key, tag):
+                self.key, self.tag = key, tag
+            def __lt__(self, other):
+                return self.key < other.key
+        keys = SortedSinglyLinkedList.merge_k([[Key(1, 'a'), Key(2, 'a')], [Key(1, 'b')], [Key(1, 'c')]])
+        self.assertEqual([(k.key, k.tag) for k in keys], [(1, 'a'), (1, 'b'), (1, 'c'), (2, 'a')])
@@ -0,0 +1,151 @@
+import random
+import unittest
+from linked_lists.sorted_skip_list import SortedSkipList
+
+class TestSortedSkipList(unittest.TestCase):
+
+    def assert_levels(self, skip_list):
+        # Each level must be sorted, and a subsequence of the level below
+        below = None
+        for level in range(skip_list._max_level):
+            values = []
+            node = skip_list._header._forward[level]
+            while node is not None:
+                values.append(node.data())
+                node = node._forward[level]
+            self.assertEqual(values, sorted(values))
+            if below is not None:
+                remaining = iter(below)
+                self.assertTrue(all(value in remaining for value in values))
+            if level >= skip_list._level:
+                self.assertEqual(values, [])
+            below = values
+
+    def test_init(self):
+        skip_list = SortedSkipList()
+        self.assertEqual(len(skip_list), 0)
+        self.assertTrue(skip_list.is_empty())
+        self.assertIsNone(skip_list._head)
+        self.assertIsNone(skip_list._tail)
+
+    def test_init_invalid(self):
+        with self.assertRaises(ValueError):
+            SortedSkipList(probability=0)
+        with self.assertRaises(ValueError):
+            SortedSkipList(probability=1)
+        with self.assertRaises(ValueError):
+            SortedSkipList(max_level=0)
+
+    def test_insert(self):
+        skip_list = SortedSkipList(seed=42)
+        for value in [6, 3, 5, 4, 7, 3]:
+            skip_list.insert(value)
+        self.assertEqual(list(skip_list), [3, 3, 4, 5, 6, 7])
+        self.assertEqual(len(skip_list), 6)
+        self.assertEqual(skip_list._head.data(), 3)
+        self.assertEqual(skip_list._tail.data(), 7)
+        self.assertEqual(skip_list.get(2), 4)
+        self.assertEqual(str(skip_list), '3->3->4->5->6->7')
+        self.assertEqual(repr(skip_list), 'SortedSkipList(3->3->4->5->6->7)')
+        self.assert_levels(skip_list)
+
+    def test_insert_sorted_batch(self):
+        skip_list = SortedSkipList(seed=3)
+        skip_list.insert(4)
+        skip_list.insert_sorted_batch([1, 4, 9, 2])
+        self.assertEqual(list(skip_list), [1, 2, 4, 4, 9])
+        self.assertEqual(skip_list._tail.data(), 9)
+        self.assert_levels(skip_list)
+        self.assertEqual(list(SortedSkipList.merge_k([skip_list, [3, 5]])), [1, 2, 3, 4, 4, 5, 9])
+
+    def test_insert_in_front_and_back(self):
+        skip_list = SortedSkipList()
+        with self.assertRaises(NotImplementedError):
+            skip_list.insert_in_front(10)
+        with self.assertRaises(NotImplementedError):
+            skip_list.insert_to_back(10)
+
+    def test_search(self):
+        skip_list = SortedSkipList(seed=1)
+        for value in range(0, 100, 2):
+            skip_list.insert(value)
+        self.assertIn(10, skip_list)
+        self.assertNotIn(11, skip_list)
+        self.assertNotIn(-1, skip_list)
+        self.assertNotIn(100, skip_list)
+        self.assertEqual(skip_list._search(98).data(), 98)
+        self.assertIsNone(skip_list._search(99))
+        self.assertEqual(skip_list.search(lambda x: x > 51), 52)
+
+    def test_delete(self):
+        skip_list = SortedSkipList(seed=7)
+        for value in [5, 1, 3, 3, 9]:
+            skip_list.insert(value)
+        skip_list.delete(3)
+        self.assertEqual(list(skip_list), [1, 3, 5, 9])
+        skip_list.delete(9)
+        self.assertEqual(skip_list._tail.data(), 5)
+        skip_list.delete(1)
+        self.assertEqual(skip_list._head.data(), 3)
+        self.assertEqual(len(skip_list), 2)
+        with self.assertRaises(ValueError):
+            skip_list.delete(4)
+        self.assert_levels(skip_list)
+
+    def test_delete_from_front(self):
+        skip_list = SortedSkipList(seed=7)
+        for value in [2, 1, 3]:
+            skip_list.insert(value)
+        self.assertEqual(skip_list.delete_from_front(), 1)
+        self.assertEqual(skip_list.delete_from_front(), 2)
+        self.assertEqual(skip_list.delete_from_front(), 3)
+        self.assertTrue(skip_list.is_empty())
+        self.assertIsNone(skip_list._tail)
+        self.assertEqual(skip_list._level, 1)
+        with self.assertRaises(ValueError):
+            skip_list.delete_from_front()
+
+    def test_seed_is_deterministic(self):
+        def heights(seed):
+            skip_list = SortedSkipList(probability=0.25, seed=seed)
+            for value in range(200):
+                skip_list.insert(value)
+            return [skip_list._search(value).height() for value in range(200)]
+        self.assertEqual(heights(5), heights(5))
+        self.assertNotEqual(heights(5), heights(6))
+
+    def test_random_operations(self):
+        rng = random.Random(0)
+        skip_list = SortedSkipList(probability=0.25, max_level=8, seed=0)
+        expected = []
+        for _ in range(2000):
+            value = rng.randrange(100)
+            if expected and rng.random() < 0.4:
+                value = rng.choice(expected)
+                skip_list.delete(value)
+                expected.remove(value)
+            else:
+                skip_list.insert(value)
+                expected.append(value)
+        expected.sort()
+        self.assertEqual(list(skip_list), expected)
+        self.assertEqual(len(skip_list), len(expected))
+        self.assertEqual(skip_list._tail.data(), expected[-1])
+        self.assert_levels(skip_list)
+
+
+class TestNode(unittest.TestCase):
+
+    def test_links(self):
+        node = SortedSkipList.Node(1, 3)
+        self.assertEqual(node.height(), 3)
+        self.assertFalse(node.has_next())
+        following = SortedSkipList.Node(2, 1)
+        node.append(following)
+        self.assertIs(node.next(), following)
+        self.assertTrue(node.has_next())
+        self.assertFalse(hasattr(node, '__dict__'))
+        # Only the slots a skip list node uses, with no unused `_next` link
+        self.assertFalse(hasattr(node, '_next'))
+        self.assertEqual(str(node), '1')
+        self.assertEqual(repr(SortedSkipList.Node('a', 1)), "'a'")
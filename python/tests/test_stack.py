@@ -1,9 +1,10 @@
 import unittest
+from copy_policy import CopyPolicy
 from stacks.stack import Stack
 from stacks.stack_dynamic_array import Stack as StackWithArray
 
 class TestStackTemplate():
-    def new_stack(self): # pragma: no cover
+    def new_stack(self, copy_policy=CopyPolicy.DEEP): # pragma: no cover
         raise NotImplementedError()
 
     def test_init(self):
@@ -58,6 +59,30 @@ class TestStackTemplate():
         self.assertEqual(stack.pop(), 'CCC')
         self.assertEqual(stack.peek(), 'BB')
 
+    def test_peek_copy_policies(self):
+        value = {'key': ['a']}
+        stack = self.new_stack()
+        stack.push(value)
+        self.assertIsNot(stack.peek()['key'], value['key'])
+
+        stack = self.new_stack(CopyPolicy.NONE)
+        stack.push(value)
+        self.assertIs(stack.peek(), value)
+
+        stack = self.new_stack('shallow')
+        stack.push(value)
+        self.assertIsNot(stack.peek(), value)
+        self.assertIs(stack.peek()['key'], value['key'])
+
+        stack = self.new_stack(CopyPolicy.FROZEN)
+        stack.push(value)
+        self.assertEqual(stack.peek(), value)
+        with self.assertRaises(TypeError):
+            stack.peek()['key'] = []
+        with self.assertRaises(TypeError):
+            stack.peek()['key'].append('b')
+        self.assertEqual(value, {'key': ['a']})
+
 
     def test_len(self):
         stack = self.new_stack()
@@ -128,14 +153,14 @@ class TestStackTemplate():
 
 class TestStack(TestStackTemplate, unittest.TestCase):
     """Tests a stack implemented with linked lists."""
-    def new_stack(self):
-        return Stack()
+    def new_stack(self, copy_policy=CopyPolicy.DEEP):
+        return Stack(copy_policy)
 
 
 class TestStackArray(TestStackTemplate, unittest.TestCase):
     """Runs the tests for a stack implemented with arrays (Python lists)."""
-    def new_stack(self):
-        return StackWithArray()
+    def new_stack(self, copy_policy=CopyPolicy.DEEP):
+        return StackWithArray(copy_policy)
 
     # Additional tests specific to stack implemented with arrays
     def test_repr(self):
@@ -0,0 +1,40 @@
+import unittest
+from linked_lists.streaming import StreamingMixin
+
+class Recorded(StreamingMixin):
+    """A sequence that records which of its values were read."""
+    def __init__(self, values):
+        self.values = values
+        self.visited = []
+
+    def __iter__(self):
+        for value in self.values:
+            self.visited.append(value)
+            yield value
+
+class TestStreamingMixin(unittest.TestCase):
+
+    def test_lazy(self):
+        sequence = Recorded([1, 2, 3, 4])
+        stream = sequence.map(lambda x: x * 10)
+        self.assertEqual(sequence.visited, [])
+        self.assertEqual(next(stream), 10)
+        self.assertEqual(sequence.visited, [1])
+
+    def test_first_n_stops_after_n(self):
+        sequence = Recorded([1, 2, 3, 4])
+        self.assertEqual(list(sequence.first_n(2)), [1, 2])
+        self.assertEqual(sequence.visited, [1, 2])
+        self.assertEqual(list(Recorded([1]).first_n(3)), [1])
+        with self.assertRaises(ValueError):
+            sequence.first_n(-1)
+
+    def test_take_while_stops_at_first_mismatch(self):
+        sequence = Recorded([1, 2, 5, 3])
+        self.assertEqual(list(sequence.take_while(lambda x: x < 3)), [1, 2])
+        self.assertEqual(sequence.visited, [1, 2, 5])
+
+    def test_filter_and_itraverse(self):
+        sequence = Recorded([1, 2, 3, 4])
+        self.assertEqual(list(sequence.filter(lambda x: x % 2 == 0)), [2, 4])
+        self.assertEqual(list(sequence.itraverse(str)), ['1', '2', '3', '4'])
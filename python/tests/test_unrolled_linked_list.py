@@ -0,0 +1,147 @@
+import random
+import unittest
+from linked_lists.unrolled_linked_list import UnrolledLinkedList
+
+class TestUnrolledLinkedList(unittest.TestCase):
+
+    def assert_blocks(self, linked_list, expected):
+        self.assertEqual(list(linked_list), expected)
+        self.assertEqual(len(linked_list), len(expected))
+        nodes = list(linked_list._nodes())
+        self.assertIs(linked_list._tail, nodes[-1] if nodes else None)
+        # Every block but the last is at least half full, and no block is empty
+        for node in nodes[:-1]:
+            self.assertGreaterEqual(node.count(), linked_list._block_capacity // 2)
+        for node in nodes:
+            self.assertGreater(node.count(), 0)
+
+    def test_init(self):
+        linked_list = UnrolledLinkedList()
+        self.assertEqual(len(linked_list), 0)
+        self.assertTrue(linked_list.is_empty())
+        self.assertIsNone(linked_list._head)
+        self.assertEqual(list(linked_list), [])
+        with self.assertRaises(ValueError):
+            UnrolledLinkedList(block_capacity=1)
+
+    def test_insert_to_back(self):
+        linked_list = UnrolledLinkedList(block_capacity=4)
+        for value in range(10):
+            linked_list.insert_to_back(value)
+        self.assert_blocks(linked_list, list(range(10)))
+        self.assertEqual([node.count() for node in linked_list._nodes()], [4, 4, 2])
+        self.assertEqual(linked_list.size(), 10)
+        self.assertFalse(linked_list.is_empty())
+
+    def test_insert_in_front(self):
+        linked_list = UnrolledLinkedList(block_capacity=4)
+        for value in range(10):
+            linked_list.insert_in_front(value)
+        self.assert_blocks(linked_list, list(range(9, -1, -1)))
+
+    def test_insert_splits_full_blocks(self):
+        linked_list = UnrolledLinkedList(block_capacity=4)
+        for value in [1, 2, 3, 4]:
+            linked_list.insert_to_back(value)
+        linked_list.insert(1, 10)
+        self.assertEqual(repr(linked_list), 'UnrolledLinkedList([1, 10, 2]->[3, 4])')
+        linked_list.insert(4, 20)
+        self.assertEqual(repr(linked_list), 'UnrolledLinkedList([1, 10, 2]->[3, 20, 4])')
+        linked_list.insert(6, 30)
+        self.assert_blocks(linked_list, [1, 10, 2, 3, 20, 4, 30])
+        with self.assertRaises(IndexError):
+            linked_list.insert(-1, 0)
+        with self.assertRaises(IndexError):
+            linked_list.insert(8, 0)
+
+    def test_get(self):
+        linked_list = UnrolledLinkedList(block_capacity=3)
+        for value in range(10):
+            linked_list.insert_to_back(value * 10)
+        for index in range(10):
+            self.assertEqual(linked_list.get(index), index * 10)
+        with self.assertRaises(IndexError):
+            linked_list.get(-1)
+        with self.assertRaises(IndexError):
+            linked_list.get(10)
+
+    def test_str_and_traverse(self):
+        linked_list = UnrolledLinkedList(block_capacity=2, typecode='d')
+        for value in [1.5, 2.5, 3.5]:
+            linked_list.insert_to_back(value)
+        self.assertEqual(str(linked_list), '1.5->2.5->3.5')
+        self.assertEqual(linked_list.traverse(lambda x: x * 2), [3.0, 5.0, 7.0])
+        self.assertEqual(list(linked_list.itraverse(int)), [1, 2, 3])
+
+    def test_streaming(self):
+        linked_list = UnrolledLinkedList(block_capacity=3)
+        for value in range(10):
+            linked_list.insert_to_back(value)
+        self.assertEqual(list(linked_list.map(lambda x: x * 10)), list(range(0, 100, 10)))
+        self.assertEqual(list(linked_list.filter(lambda x: x % 3 == 0)), [0, 3, 6, 9])
+        self.assertEqual(list(linked_list.take_while(lambda x: x < 4)), [0, 1, 2, 3])
+        self.assertEqual(list(linked_list.first_n(5)), [0, 1, 2, 3, 4])
+        self.assertEqual(list(linked_list.first_n(20)), list(range(10)))
+        with self.assertRaises(ValueError):
+            linked_list.first_n(-1)
+
+    def test_delete(self):
+        linked_list = UnrolledLinkedList(block_capacity=4)
+        for value in range(8):
+            linked_list.insert_to_back(value)
+        # Falls below half: borrows from the next block
+        linked_list.delete(0)
+        linked_list.delete(1)
+        self.assertEqual(repr(linked_list), 'UnrolledLinkedList([2, 3]->[4, 5, 6, 7])')
+        linked_list.delete(2)
+        self.assertEqual(repr(linked_list), 'UnrolledLinkedList([3, 4]->[5, 6, 7])')
+        # Falls below half: merges with the next block
+        linked_list.delete(4)
+        self.assertEqual(repr(linked_list), 'UnrolledLinkedList([3, 5, 6, 7])')
+        self.assert_blocks(linked_list, [3, 5, 6, 7])
+        with self.assertRaises(ValueError):
+            linked_list.delete(4)
+        for value in [3, 5, 6, 7]:
+            linked_list.delete(value)
+        self.assert_blocks(linked_list, [])
+        self.assertIsNone(linked_list._head)
+
+    def test_random_operations(self):
+        rng = random.Random(0)
+        for capacity in [2, 3, 8]:
+            linked_list = UnrolledLinkedList(block_capacity=capacity)
+            expected = []
+            for _ in range(1000):
+                operation = rng.random()
+                value = rng.randrange(50)
+                if operation < 0.2:
+                    linked_list.insert_in_front(value)
+                    expected.insert(0, value)
+                elif operation < 0.4:
+                    linked_list.insert_to_back(value)
+                    expected.append(value)
+                elif operation < 0.65:
+                    index = rng.randrange(len(expected) + 1)
+                    linked_list.insert(index, value)
+                    expected.insert(index, value)
+                elif expected:
+                    value = rng.choice(expected)
+                    linked_list.delete(value)
+                    expected.remove(value)
+            self.assert_blocks(linked_list, expected)
+            self.assertEqual([linked_list.get(i) for i in range(len(expected))], expected)
+
+
+class TestNode(unittest.TestCase):
+
+    def test_node(self):
+        node = UnrolledLinkedList.Node(4, 'l')
+        self.assertEqual(node.count(), 0)
+        self.assertIsNone(node.next())
+        node._insert_at(0, 2)
+        node._insert_at(0, 1)
+        node._insert_at(2, 3)
+        self.assertEqual(node.values().tolist(), [1, 2, 3])
+        node._delete_at(1)
+        self.assertEqual(repr(node), '[1, 3]')
+        self.assertFalse(hasattr(node, '__dict__'))
@@ -1,4 +1,7 @@
 """Tests for class UnsortedArray"""
+import os
+import pickle
+import tempfile
 import unittest
 from arrays.unsorted_array import UnsortedArray
 
@@ -131,3 +134,173 @@ class TestArray(unittest.TestCase):
         array.insert(5)
         array.traverse(test_callback)
         self.assertEqual(result, [2, 3, 4, 5, 6])
+
+    # file-backed
+
+    def test_file_backed(self):
+        """Test an unsorted array stored in a memory-mapped file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'array.bin')
+            array = UnsortedArray(4, 'q', path)
+            array.insert(5)
+            array.insert(-3)
+            array.insert(8)
+            self.assertEqual(array.find(8), 2)
+            array.delete(0)
+            self.assertEqual(repr(array), "UnsortedArray(array('q', [8, -3]))")
+            array.close()
+            with self.assertRaises(FileExistsError):
+                UnsortedArray(4, 'q', path)
+            array = UnsortedArray.open(path, index_values=True)
+            self.assertEqual(repr(array), "UnsortedArray(array('q', [8, -3]))")
+            self.assertEqual(array.max_size(), 4)
+            self.assertEqual(array.find(-3), 1)
+            array.insert(7)
+            array.close()
+            self.assertEqual(list(UnsortedArray.load(path)), [8, -3, 7])
+
+    # scan kernels
+
+    def test_find_all_and_count(self):
+        """Test finding and counting all the occurrences of an entry"""
+        array = UnsortedArray(6)
+        for value in [5, 1, 5, 5]:
+            array.insert(value)
+        self.assertEqual(array.find_all(5), [0, 2, 3])
+        self.assertEqual(array.count(5), 3)
+        self.assertEqual(array.count(0), 0)
+
+    def test_aggregates(self):
+        """Test min, max, sum, argmin and argmax"""
+        array = UnsortedArray(6)
+        for value in [5, -1, 8, 2]:
+            array.insert(value)
+        self.assertEqual(array.min(), -1)
+        self.assertEqual(array.max(), 8)
+        self.assertEqual(array.sum(), 14)
+        self.assertEqual(array.argmin(), 1)
+        self.assertEqual(array.argmax(), 2)
+        with self.assertRaises(ValueError):
+            UnsortedArray(3).max()
+
+    # delete_value
+
+    def test_delete_value(self):
+        """Test deleting entries by value"""
+        for index_values in (False, True):
+            array = UnsortedArray(6, index_values=index_values)
+            for value in [4, 7, 4, 9]:
+                array.insert(value)
+            array.delete_value(7)
+            self.assertEqual(len(array), 3)
+            self.assertIsNone(array.find(7))
+            self.assertEqual(array.find(9), 1)
+            array.delete_value(4)
+            array.delete_value(4)
+            self.assertEqual(len(array), 1)
+            self.assertEqual(array[0], 9)
+            with self.assertRaises(ValueError):
+                array.delete_value(4)
+
+    def test_delete_value_first_occurrence(self):
+        """Test that delete_value removes the occurrence reported by find"""
+        for index_values in (False, True):
+            array = UnsortedArray(6, index_values=index_values)
+            for value in [5, 1, 5, 2, 5, 3]:
+                array.insert(value)
+            # The last entry moves into the position of the first 5
+            array.delete_value(5)
+            self.assertEqual([array[i] for i in range(len(array))], [3, 1, 5, 2, 5])
+            self.assertEqual(array.find(5), 2)
+            array.delete_value(5)
+            self.assertEqual([array[i] for i in range(len(array))], [3, 1, 5, 2])
+
+    def test_index_values(self):
+        """Test that the index of the values is kept consistent"""
+        array = UnsortedArray(20, 'f', index_values=True)
+        for i in range(20):
+            array.insert(i % 7 + 0.1)
+        for i in range(0, 15, 2):
+            array.delete(i % len(array))
+        array.delete(len(array) - 1)
+        expected = {}
+        for i in range(len(array)):
+            expected.setdefault(array[i], set()).add(i)
+        self.assertEqual(array._positions, expected)
+        for value in expected:
+            self.assertEqual(array.find(value), min(expected[value]))
+        self.assertIsNone(array.find(0.1 + 7))
+
+    def test_index_values_nan(self):
+        """Test that NaN entries can be deleted when values are indexed"""
+        array = UnsortedArray(5, 'd', index_values=True)
+        for value in [float('nan'), 1.0, float('nan'), 2.0]:
+            array.insert(value)
+        array.delete(0)
+        # NaN is never equal to a target, as with a linear scan
+        self.assertIsNone(array.find(float('nan')))
+        array.delete(2)
+        self.assertEqual(len(array), 2)
+        self.assertEqual(array.find(1.0), 1)
+        array.delete(0)
+        self.assertEqual(array._positions, {1.0: {0}})
+
+    # compact
+
+    def test_compact(self):
+        """Test deleting all the entries matching a predicate"""
+        for index_values in (False, True):
+            array = UnsortedArray(10, index_values=index_values)
+            for value in range(10):
+                array.insert(value)
+            self.assertEqual(array.compact(lambda x: x % 3 == 0), 4)
+            self.assertEqual([array[i] for i in range(len(array))], [1, 2, 4, 5, 7, 8])
+            self.assertEqual(array.find(7), 4)
+            self.assertIsNone(array.find(6))
+            self.assertEqual(array.compact(lambda x: x > 100), 0)
+            self.assertEqual(len(array), 6)
+            array.insert(3)
+            self.assertEqual(array.find(3), 6)
+
+    # parallel_traverse
+
+    def test_parallel_traverse(self):
+        array = UnsortedArray(6)
+        for value in [3, 1, 4, 1, 5]:
+            array.insert(value)
+        self.assertEqual(array.parallel_traverse(str, workers=2), ['3', '1', '4', '1', '5'])
+
+    # share
+
+    def test_share(self):
+        array = UnsortedArray(6, index_values=True)
+        for value in [3, 1, 4]:
+            array.insert(value)
+        snapshot = array.share()
+        array.delete_value(4)
+        self.assertEqual(snapshot.find(4), 2)
+        copy = pickle.loads(pickle.dumps(snapshot))
+        self.assertEqual(copy._array.name(), snapshot._array.name())
+        self.assertEqual(copy.find(1), 1)
+        copy.close()
+        snapshot.close()
+
+    # persistence
+
+    def test_save_load(self):
+        array = UnsortedArray(5, 'i')
+        for value in [3, 1, 4]:
+            array.insert(value)
+        loaded = UnsortedArray.from_bytes(array.to_bytes(), index_values=True)
+        self.assertEqual(repr(loaded), "UnsortedArray(array('i', [3, 1, 4]))")
+        self.assertEqual(loaded.max_size(), 5)
+        self.assertEqual(loaded.find(4), 2)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'array.bin')
+            array.save(path)
+            loaded = UnsortedArray.load(path, mapped=True)
+            loaded.insert(1)
+            loaded.delete(0)
+            self.assertEqual(repr(loaded), "UnsortedArray(array('i', [1, 1, 4]))")
+            self.assertEqual(repr(UnsortedArray.load(path)), "UnsortedArray(array('i', [3, 1, 4]))")
+            loaded.close()
@@ -7,7 +7,10 @@ class BinarySearchTree:
     """A class modeling the binary search tree data structure."""
 
     class Node:
-        """A class modeling the nodes of the binary search tree."""
+        """A class modeling the nodes of the binary search tree.
+           Nodes are slotted, without a per-instance `__dict__`."""
+
+        __slots__ = ('_value', '_left', '_right')
 
         @staticmethod
         def _node_str(node: type[BinarySearchTree.Node]) -> str: